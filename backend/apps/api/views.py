@@ -1,47 +1,42 @@
 from pathlib import Path
 import json
+import logging
 import os
 from datetime import datetime
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
 
-DATA_DIR = Path(settings.BASE_DIR) / "data"
+from apps.learn.query import is_page_request, respond_page
+from apps.learn.store import respond as lesson_respond
+from services.braille import text_to_cells
 
-def _load_json(name: str):
-    """
-    data/name 을 안전하게 읽어 dict 반환.
-    - 파일이 없거나, UTF-8 BOM, 혹은 깨진 JSON이라도 예외를 터뜨리지 않음.
-    """
-    p = DATA_DIR / name
-    if not p.exists():
-        return {}
-    try:
-        # BOM 포함 가능성 대비 utf-8-sig
-        with open(p, "r", encoding="utf-8-sig") as f:
-            return json.load(f)
-    except Exception:
-        # 손상/오타 등 어떤 경우라도 빈 매핑
-        return {}
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(settings.BASE_DIR) / "data"
 
 def health(_):
     return JsonResponse({"ok": True})
 
 def learn(request, mode):
     """
-    GET /api/learn/char/ | /word/ | /sentence/
+    GET /api/learn/char/ | /word/ | /sentence/  [?limit=&cursor=&jamo=&difficulty=&tag=&type=]
+    (apps.learn.store 의 미리 직렬화·압축된 본문 - 요청마다 파일을 읽지 않음,
+     페이지 파라미터가 있으면 apps.learn.query 의 필터별 posting 으로 조회)
     """
     name_map = {
-        "char": "lesson_chars.json",
-        "word": "lesson_words.json",
-        "sentence": "lesson_sentences.json",
+        "char": "chars",
+        "word": "words",
+        "sentence": "sentences",
     }
     if mode not in name_map:
         return JsonResponse({"detail": "mode not found"}, status=404)
     try:
-        payload = _load_json(name_map[mode])
-        return JsonResponse(payload)
+        if is_page_request(request):
+            return respond_page(request, name_map[mode])
+        return lesson_respond(request, name_map[mode])
     except Exception as e:
+        logger.exception("learn %s failed", mode)
         return JsonResponse({"detail": str(e)}, status=500)
 
 @csrf_exempt
@@ -50,36 +45,14 @@ def braille_convert(request):
     POST {"text": "..."} -> {"cells": [[0|1 x 6], ...]}
     매핑이 없거나 문자를 못 찾으면 6점 모두 0(빈 점)으로 반환.
     어떤 경우에도 500을 던지지 말고 JsonResponse로 안전 반환.
+    (변환은 services.braille 공용 엔진 - 요청마다 매핑 파일을 읽지 않음)
     """
     try:
-        print(f"[braille_convert] Request method: {request.method}")
-        print(f"[braille_convert] Request body: {request.body}")
-        
         body = json.loads(request.body.decode("utf-8") or "{}")
         text = (body.get("text") or "").strip()
-        print(f"[braille_convert] Text to convert: '{text}'")
-        
-        table = _load_json("ko_braille.json")  # 없거나 깨져도 {}
-        print(f"[braille_convert] Loaded table with {len(table)} entries")
-        
-        cells = []
-        for ch in text:
-            pattern = table.get(ch)
-            if pattern is None:
-                if ch == " ":
-                    pattern = [0,0,0,0,0,0]
-                else:
-                    pattern = [0,0,0,0,0,0]
-            if not isinstance(pattern, (list, tuple)) or len(pattern) != 6:
-                pattern = [0,0,0,0,0,0]
-            cells.append([1 if int(x) else 0 for x in pattern])
-        
-        print(f"[braille_convert] Generated {len(cells)} cells")
-        return JsonResponse({"cells": cells})
+        return JsonResponse({"cells": text_to_cells(text)})
     except Exception as e:
-        print(f"[braille_convert] Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("braille_convert failed")
         return JsonResponse({"cells": [], "error": str(e)})
 
 # 별칭: /api/convert (프론트엔드 호환)
@@ -4,4 +4,21 @@ from django.apps import AppConfig
 class BrailleConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.braille'
-    verbose_name = '점자 변환'
\ No newline at end of file
+    verbose_name = '점자 변환'
+
+    def ready(self):
+        from django.conf import settings
+        from services.braille import configure_cache, get_table
+
+        shared = None
+        alias = getattr(settings, "BRAILLE_CACHE_ALIAS", "")
+        if alias:
+            from django.core.cache import caches
+            shared = caches[alias]
+        configure_cache(
+            max_entries=getattr(settings, "BRAILLE_CACHE_MAX_ENTRIES", 4096),
+            max_bytes=getattr(settings, "BRAILLE_CACHE_MAX_BYTES", 4 * 1024 * 1024),
+            shared=shared,
+        )
+        # 변환 테이블을 워커 기동 시점에 미리 빌드 (첫 요청 지연 방지)
+        get_table()
@@ -4,5 +4,12 @@ from . import views
 urlpatterns = [
     path("encode/", views.braille_convert, name="braille_encode"),
     path("convert/", views.braille_convert, name="braille_convert"),  # legacy compatibility
+    path("batch/", views.braille_convert_batch, name="braille_batch"),  # 여러 텍스트 한 번에
+    path("stream/", views.braille_convert_stream, name="braille_stream"),  # 긴 문서 NDJSON/SSE
+    path("pages/", views.braille_pages, name="braille_pages"),  # 디스플레이 폭 줄/페이지 나누기
+    path("delta/", views.braille_delta, name="braille_delta"),  # 증분 변환 세션 시작
+    path("delta/<str:session_id>/", views.braille_delta_edit, name="braille_delta_edit"),  # 편집 -> 바뀐 셀 구간
+    path("decode/", views.braille_decode, name="braille_decode"),  # 점자 -> 텍스트 역변환/채점
+    path("stats/", views.braille_stats, name="braille_stats"),  # 캐시 적중률 등
     path("", views.braille_convert, name="braille_convert_root"),  # /api/convert/ 호환
 ]
\ No newline at end of file
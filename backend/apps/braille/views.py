@@ -1,135 +1,412 @@
-from django.http import JsonResponse
-from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
-import json, os, unicodedata
-from pathlib import Path
-
-# 전역 점자 매핑 캐시
-_BRAILLE_MAP = None
-
-def _load_braille_map():
-    """점자 매핑 테이블을 안전하게 로드 (캐시 사용)"""
-    global _BRAILLE_MAP
-    if _BRAILLE_MAP is not None:
-        return _BRAILLE_MAP
-    
-    try:
-        data_path = Path(settings.BASE_DIR) / "data" / "ko_braille.json"
-        print(f"[braille] Loading from: {data_path}")
-        print(f"[braille] Path exists: {data_path.exists()}")
-        
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            print(f"[braille] Loaded {len(data)} mappings")
-            print(f"[braille] Sample keys: {list(data.keys())[:5]}")
-            print(f"[braille] ㄱ mapping: {data.get('ㄱ')}")
-            _BRAILLE_MAP = data
-            return data
-    except Exception as e:
-        print(f"[braille] Error loading ko_braille.json: {e}")
-        import traceback
-        traceback.print_exc()
-        _BRAILLE_MAP = {}
-        return {}
-
-def text_to_cells(text: str):
-    """텍스트를 점자 셀로 변환 (한글 자음+모음 분해 포함)"""
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+import base64, json, logging
+
+from jeomgeuli_backend.http_cache import content_etag, http_cache
+from services.braille import (
+    GRADES, bytes_to_text, cache_stats, from_unicode, get_table, iter_convert, iter_decode, iter_read,
+    many_to_bytes, pack_many, registry, render, table_version, text_to_bytes,
+)
+from services.braille.delta import SessionNotFound, VersionConflict, sessions
+from services.braille.frames import DEFAULT_MTU, HEADER_SIZE, encode_frames
+from services.braille.layout import format_cursor, iter_lines, iter_pages, parse_cursor
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("cells", "packed", "bits", "unicode")
+MAX_BATCH = 500
+MAX_PAGES = 50
+MAX_STREAM_CHUNK = 4096  # 스트림 세그먼트 최대 글자 수 (?chunk 상한)
+HTTP_MAX_AGE = getattr(settings, "BRAILLE_HTTP_MAX_AGE", 3600)
+
+def _negotiate_format(request, payload=None):
+    """?format= / body.format / Accept 헤더로 응답 포맷 결정 (기본 cells)"""
+    fmt = request.GET.get("format") or (payload or {}).get("format") or ""
+    if not fmt and "application/octet-stream" in request.headers.get("Accept", ""):
+        fmt = "packed"
+    return fmt if fmt in FORMATS else "cells"
+
+def _negotiate_grade(request, payload=None):
+    """?grade= / body.grade 로 정자(uncontracted, 기본) / 약자(contracted) 결정"""
+    grade = request.GET.get("grade") or (payload or {}).get("grade") or ""
+    return grade if grade in GRADES else "uncontracted"
+
+def _cells_response(packed: bytes, fmt: str):
+    """
+    cells   -> {"cells": [[0|1 x 6], ...]}
+    bits    -> {"bins": ["100000", ...], "len": n}
+    unicode -> {"unicode": "⠁⠃...", "len": n}
+    packed  -> application/octet-stream (셀당 1바이트, 점 n = 비트 n-1)
+    """
+    if fmt == "packed":
+        return HttpResponse(packed, content_type="application/octet-stream")
+    if fmt == "bits":
+        return JsonResponse({"bins": render(packed, fmt), "len": len(packed)})
+    if fmt == "unicode":
+        return JsonResponse({"unicode": render(packed, fmt), "len": len(packed)},
+                            json_dumps_params={"ensure_ascii": False})
+    return JsonResponse({"cells": render(packed, fmt)})
+
+def _frames_response(request, payload, text, grade):
+    """
+    format=frames -> BLE write 단위 프레임 (services.braille.frames)
+    ?mtu=20 (협상된 MTU, 기본 20)  ?width= (디스플레이 폭, 기본 mtu-3 = 한 줄이 프레임 하나)
+    {"frames": ["<base64>", ...], "mtu": 20, "header": 3, "lines": n, "count": n}
+    """
+    opts = payload or request.GET
     try:
-        # 유니코드 정규화로 조합형/분해형 통일 (NFC로 조합형 유지)
-        normalized_text = unicodedata.normalize("NFC", text or "")
-        print(f"[braille] Converting text: '{normalized_text}' (length: {len(normalized_text)})")
-        
-        braille_map = _load_braille_map()
-        print(f"[braille] Map loaded with {len(braille_map)} entries")
-        
-        res = []
-        for i, ch in enumerate(normalized_text):
-            # 먼저 완전한 글자로 매핑 시도
-            arr = braille_map.get(ch)
-            if isinstance(arr, list) and len(arr) == 6:
-                res.append(arr)
-                print(f"[braille] Character {i}: '{ch}' -> direct mapping: {arr}")
-                continue
-            elif isinstance(arr, list) and len(arr) == 12:
-                # 12개 점이면 2개 셀로 분할
-                res.append(arr[:6])
-                res.append(arr[6:])
-                print(f"[braille] Character {i}: '{ch}' -> split mapping: {arr[:6]}, {arr[6:]}")
-                continue
-            
-            # 한글인 경우 자음+모음으로 분해
-            if '가' <= ch <= '힣':
-                # 한글 유니코드에서 자음, 모음, 받침 추출
-                base = ord(ch) - ord('가')
-                initial = base // (21 * 28)  # 초성
-                medial = (base % (21 * 28)) // 28  # 중성
-                final = base % 28  # 종성
-                
-                # 자음 매핑
-                consonants = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
-                vowels = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ']
-                
-                if initial < len(consonants):
-                    initial_char = consonants[initial]
-                    initial_arr = braille_map.get(initial_char)
-                    if isinstance(initial_arr, list) and len(initial_arr) == 6:
-                        res.append(initial_arr)
-                        print(f"[braille] Character {i}: '{ch}' -> initial '{initial_char}': {initial_arr}")
-                
-                if medial < len(vowels):
-                    medial_char = vowels[medial]
-                    medial_arr = braille_map.get(medial_char)
-                    if isinstance(medial_arr, list) and len(medial_arr) == 6:
-                        res.append(medial_arr)
-                        print(f"[braille] Character {i}: '{ch}' -> medial '{medial_char}': {medial_arr}")
-                
-                if final > 0 and final < len(consonants):
-                    final_char = consonants[final]
-                    final_arr = braille_map.get(final_char)
-                    if isinstance(final_arr, list) and len(final_arr) == 6:
-                        res.append(final_arr)
-                        print(f"[braille] Character {i}: '{ch}' -> final '{final_char}': {final_arr}")
-            else:
-                # 알 수 없는 문자는 공백으로 처리
-                res.append([0,0,0,0,0,0])
-                print(f"[braille] Character {i}: '{ch}' -> unknown, using space")
-        
-        print(f"[braille] Generated {len(res)} cells: {res}")
-        return res
-    except Exception as e:
-        print(f"[braille] Error in text_to_cells: {e}")
-        import traceback
-        traceback.print_exc()
-        return []
+        mtu = int(request.GET.get("mtu") or opts.get("mtu") or DEFAULT_MTU)
+        width = int(request.GET.get("width") or opts.get("width") or mtu - HEADER_SIZE)
+        lines = [ln.cells for ln, _ in iter_lines(text, width, grade=grade)]
+        frames = encode_frames(lines, mtu)
+    except (ValueError, TypeError) as e:
+        return JsonResponse({"error": "bad_request", "detail": str(e)}, status=400)
+    return JsonResponse({
+        "frames": [base64.b64encode(f).decode("ascii") for f in frames],
+        "mtu": mtu, "header": HEADER_SIZE, "lines": len(lines), "count": len(frames),
+    })
+
+def _get_etag(request, *args, **kwargs):
+    """GET 변환 응답 ETag = 테이블 버전 + 포맷 + 쿼리(입력 텍스트 포함). POST 는 검증자 없음"""
+    if request.method not in ("GET", "HEAD"):
+        return None
+    grade = _negotiate_grade(request)
+    fmt = request.GET.get("format") or _negotiate_format(request)
+    return content_etag(request.path, table_version(grade), fmt, sorted(request.GET.lists()))
 
 @csrf_exempt
+@http_cache(_get_etag, HTTP_MAX_AGE)
 def braille_convert(request):
     """
     POST {"text": "..."} -> {"cells": [[0|1 x 6], ...]}
     프론트엔드 호환을 위한 점자 변환 API
+    (변환 테이블은 services.braille 에서 프로세스당 한 번 빌드)
+    ?format=packed|bits|unicode 또는 Accept: application/octet-stream 으로 압축 포맷 선택
+    ?grade=contracted 이면 약자·약어 적용 (기본 정자)
+    ?format=frames 이면 BLE 전송용 프레임 (_frames_response 참고)
+    GET 은 ETag/Cache-Control 을 붙이고, If-None-Match 가 맞으면 변환 없이 304
     """
     try:
-        print(f"[braille_convert] Request method: {request.method}")
-        print(f"[braille_convert] Request body: {request.body}")
-        
         if request.method == "GET":
+            payload = None
             text = request.GET.get("text","")
         else:
             payload = json.loads(request.body.decode("utf-8") or "{}")
             text = payload.get("text","")
-        
-        print(f"[braille_convert] Text to convert: '{text}'")
-        cells = text_to_cells(text)
-        print(f"[braille_convert] Generated {len(cells)} cells")
-        
-        return JsonResponse({"cells": cells})
+
+        grade = _negotiate_grade(request, payload)
+        if (request.GET.get("format") or (payload or {}).get("format")) == "frames":
+            return _frames_response(request, payload, text, grade)
+        packed = text_to_bytes(text, grade)
+        return _cells_response(packed, _negotiate_format(request, payload))
+    except Exception as e:
+        logger.exception("braille_convert failed")
+        return JsonResponse({"error": str(e)}, status=500)
+
+def _render_item(packed: bytes, fmt: str):
+    """배치 응답 항목 (packed 는 JSON 안에서 base64 문자열)"""
+    if fmt == "packed":
+        return base64.b64encode(packed).decode("ascii")
+    return render(packed, fmt)
+
+@csrf_exempt
+def braille_convert_batch(request):
+    """
+    POST {"texts": ["학교", "친구", ...]}      -> {"results": [cells, ...]}
+    POST {"items": {"k1": "학교", "k2": "친구"}} -> {"results": {"k1": cells, ...}}
+    키워드/불릿/학습 항목을 한 번의 왕복으로 변환. 배치 안의 중복 입력은 한 번만 변환한다.
+    format/grade 는 단건 API 와 동일 (packed 는 항목별 base64 문자열)
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "method_not_allowed"}, status=405)
+    try:
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+    except Exception:
+        return JsonResponse({"error": "invalid_json"}, status=400)
+    if not isinstance(payload, dict):
+        return JsonResponse({"error": "bad_request", "detail": "JSON 객체가 필요합니다."}, status=400)
+
+    items = payload.get("items")
+    texts = payload.get("texts")
+    if isinstance(items, dict):
+        keys, texts = list(items.keys()), list(items.values())
+    elif isinstance(texts, list):
+        keys = None
+    else:
+        return JsonResponse({"error": "bad_request", "detail": "texts(list) 또는 items(dict)가 필요합니다."}, status=400)
+
+    if len(texts) > MAX_BATCH:
+        return JsonResponse({"error": "too_many_items", "detail": f"최대 {MAX_BATCH}개까지 변환할 수 있습니다."}, status=413)
+
+    fmt = _negotiate_format(request, payload)
+    try:
+        packed = many_to_bytes(("" if t is None else str(t) for t in texts), _negotiate_grade(request, payload))
+        rendered = [_render_item(p, fmt) for p in packed]
+        results = dict(zip(keys, rendered)) if keys is not None else rendered
+        return JsonResponse({"results": results, "format": fmt, "count": len(rendered)},
+                            json_dumps_params={"ensure_ascii": False})
+    except Exception as e:
+        logger.exception("braille_convert_batch failed")
+        return JsonResponse({"error": str(e)}, status=500)
+
+def _stream_source(request):
+    """스트리밍 입력: JSON 이면 text 필드, 그 외(text/plain 등)는 본문을 조금씩 읽는다"""
+    if request.method == "GET":
+        return [request.GET.get("text", "")]
+    if request.content_type == "application/json":
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+        return [payload.get("text", "")]
+    return iter_decode(iter_read(request))
+
+@csrf_exempt
+def braille_convert_stream(request):
+    """
+    POST (text/plain 본문 또는 {"text": "..."}) -> NDJSON / SSE 스트림
+    ?mode=ndjson(기본)|sse  ?chunk=200 (문장 끝이 없을 때 최대 글자 수, 1~4096)  ?format=cells|bits|unicode
+    ?grade=contracted (약자·약어 적용)
+    한 줄(이벤트)마다 {"seq": i, "text": "세그먼트", "cells": [...]} 를 내보내고
+    마지막에 {"done": true, "segments": n, "len": 총 셀 수} 를 보낸다.
+    """
+    fmt = _negotiate_format(request)
+    if fmt == "packed":
+        fmt = "unicode"
+    grade = _negotiate_grade(request)
+    sse = request.GET.get("mode") == "sse"
+    try:
+        max_chars = int(request.GET.get("chunk", 200))
+        if not 1 <= max_chars <= MAX_STREAM_CHUNK:
+            raise ValueError(f"chunk 는 1~{MAX_STREAM_CHUNK} 사이여야 합니다.")
+        source = _stream_source(request)
+    except Exception as e:
+        return JsonResponse({"error": "bad_request", "detail": str(e)}, status=400)
+
+    key = "bins" if fmt == "bits" else fmt
+
+    def line(obj):
+        data = json.dumps(obj, ensure_ascii=False)
+        return f"data: {data}\n\n" if sse else data + "\n"
+
+    def gen():
+        seq = total = 0
+        try:
+            for seg, packed in iter_convert(source, max_chars, grade=grade):
+                yield line({"seq": seq, "text": seg, key: render(packed, fmt)})
+                seq += 1
+                total += len(packed)
+            done = {"done": True, "segments": seq, "len": total}
+            yield f"event: done\ndata: {json.dumps(done)}\n\n" if sse else line(done)
+        except Exception as e:
+            logger.exception("braille_convert_stream failed")
+            err = {"error": str(e)}
+            yield f"event: error\ndata: {json.dumps(err)}\n\n" if sse else line(err)
+
+    resp = StreamingHttpResponse(gen(), content_type="text/event-stream" if sse else "application/x-ndjson")
+    resp["Cache-Control"] = "no-cache"
+    return resp
+
+@csrf_exempt
+@http_cache(_get_etag, HTTP_MAX_AGE)
+def braille_pages(request):
+    """
+    점자 디스플레이 폭에 맞춘 줄/페이지 나누기 (커서 기반)
+    POST {"text": "...", "width": 20, "lines": 1, "cursor": "0.0", "pages": 1}
+      -> {"pages": [{"cursor": "...", "lines": [{"text": "원문 구간", "cells": [...]}, ...]}, ...],
+          "next_cursor": "..." | null, "width": 20, "lines": 1, "format": "cells"}
+    width 셀 단위로 단어 경계에서 줄을 바꾸고, 한 줄보다 긴 단어는 붙임표로 잇는다.
+    다음 요청에 next_cursor 를 넘기면 앞 페이지를 다시 만들지 않고 이어서 만든다.
+    format/grade 는 단건 API 와 동일 (packed 는 줄별 base64 문자열)
+    """
+    try:
+        payload = json.loads(request.body.decode("utf-8") or "{}") if request.method == "POST" else dict(request.GET.items())
+        if not isinstance(payload, dict):
+            return JsonResponse({"error": "bad_request", "detail": "JSON 객체가 필요합니다."}, status=400)
+        text = str(payload.get("text") or "")
+        width = int(payload.get("width") or 20)
+        lines = int(payload.get("lines") or 1)
+        count = min(MAX_PAGES, max(1, int(payload.get("pages") or 1)))
+        cursor = parse_cursor(payload.get("cursor"))
+    except (ValueError, TypeError) as e:
+        return JsonResponse({"error": "bad_request", "detail": str(e)}, status=400)
+    if width < 2 or lines < 1:
+        return JsonResponse({"error": "bad_request", "detail": "width 는 2 이상, lines 는 1 이상이어야 합니다."}, status=400)
+
+    fmt = _negotiate_format(request, payload)
+    grade = _negotiate_grade(request, payload)
+    key = "bins" if fmt == "bits" else fmt
+    try:
+        pages, next_cursor = [], format_cursor(cursor)
+        for page in iter_pages(text, width, lines, cursor, grade):
+            pages.append({
+                "cursor": format_cursor(page.cursor),
+                "lines": [{"text": ln.text, key: _render_item(ln.cells, fmt)} for ln in page.lines],
+            })
+            next_cursor = format_cursor(page.next_cursor)
+            if len(pages) == count:
+                break
+        if not pages:
+            next_cursor = None
+        return JsonResponse({"pages": pages, "next_cursor": next_cursor, "width": width,
+                             "lines": lines, "format": fmt},
+                            json_dumps_params={"ensure_ascii": False})
+    except Exception as e:
+        logger.exception("braille_pages failed")
+        return JsonResponse({"error": str(e)}, status=500)
+
+def _span(start: int, deleted: int, cells: bytes, key: str, fmt: str):
+    return {"start": start, "deleted": deleted, key: _render_item(cells, fmt)}
+
+@csrf_exempt
+def braille_delta(request):
+    """
+    증분 변환 세션 시작
+    POST {"text": "현재 전체 텍스트", "grade": "..."}
+      -> {"session": "<id>", "version": 0, "cells": [...], "len": n}
+    이후 편집은 /api/braille/delta/<id>/ 로 보낸다 (braille_delta_edit)
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "method_not_allowed"}, status=405)
+    try:
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+        if not isinstance(payload, dict):
+            return JsonResponse({"error": "bad_request", "detail": "JSON 객체가 필요합니다."}, status=400)
+        sid, session = sessions.create(str(payload.get("text") or ""), _negotiate_grade(request, payload))
+    except (ValueError, TypeError) as e:
+        return JsonResponse({"error": "bad_request", "detail": str(e)}, status=400)
+    fmt = _negotiate_format(request, payload)
+    key = "bins" if fmt == "bits" else fmt
+    packed = session.packed()
+    return JsonResponse({"session": sid, "version": session.version, key: _render_item(packed, fmt),
+                         "len": len(packed), "format": fmt}, json_dumps_params={"ensure_ascii": False})
+
+@csrf_exempt
+def braille_delta_edit(request, session_id):
+    """
+    POST {"version": v, "offset": i, "delete": n, "insert": "글"}        (편집 하나)
+    POST {"version": v, "edits": [{"offset", "delete", "insert"}, ...]}   (여러 편집을 순서대로)
+      -> {"version": v', "spans": [{"start": 셀 위치, "deleted": 셀 수, "cells": [...]}, ...], "len": 총 셀 수}
+    클라이언트는 span 마다 cells.splice(start, deleted, ...cells) 를 적용하면 된다.
+    offset/delete 는 코드포인트 기준, version 은 마지막으로 받은 값.
+    편집 하나라도 범위를 벗어나면 400 이고 아무 편집도 적용하지 않는다 (version 그대로).
+    409 version_conflict / 410 session_expired 이면 /api/braille/delta/ 로 전체를 다시 보낸다.
+    (404 는 ApiNotFoundJson 미들웨어가 본문을 바꾸므로 만료 세션은 410 Gone)
+    DELETE -> 세션 종료
+    """
+    if request.method == "DELETE":
+        return JsonResponse({"ok": sessions.close(session_id)})
+    if request.method != "POST":
+        return JsonResponse({"error": "method_not_allowed"}, status=405)
+    try:
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+        raw = payload.get("edits")
+        raw = raw if isinstance(raw, list) else [payload]
+        edits = [(int(e.get("offset", 0)), int(e.get("delete", 0)), str(e.get("insert") or "")) for e in raw]
+        version = int(payload.get("version", -1))
+    except (ValueError, TypeError, AttributeError) as e:
+        return JsonResponse({"error": "bad_request", "detail": str(e)}, status=400)
+
+    try:
+        session = sessions.get(session_id)
+        spans = session.edit(version, edits)
+    except SessionNotFound:
+        return JsonResponse({"error": "session_expired", "detail": "세션이 없거나 만료되었습니다."}, status=410)
+    except VersionConflict as e:
+        return JsonResponse({"error": "version_conflict", "version": e.version}, status=409)
+    except ValueError as e:
+        return JsonResponse({"error": "bad_request", "detail": str(e), "version": session.version}, status=400)
+    sessions.update(session_id, session)
+
+    fmt = _negotiate_format(request, payload)
+    key = "bins" if fmt == "bits" else fmt
+    return JsonResponse({
+        "version": session.version,
+        "spans": [_span(start, deleted, cells, key, fmt) for start, deleted, cells in spans],
+        "len": sum(len(c) for c in session.cells),
+        "format": fmt,
+    }, json_dumps_params={"ensure_ascii": False})
+
+def braille_stats(request):
+    """
+    GET -> 변환 캐시/테이블 상태 (캐시 크기 산정용)
+    {"cache": {"hits", "misses", "evictions", "hit_rate", ...},
+     "table": {"entries": n, "version": "..."}, "tables": {이름: {"file", "loaded", "version"}}}
+    """
+    table = get_table()
+    return JsonResponse({
+        "cache": cache_stats(),
+        "table": {"entries": len(table), "version": table.version},
+        "tables": registry.status(),
+        "delta_sessions": sessions.stats(),
+    })
+
+def _packed_input(obj):
+    """역변환 입력: cells(6점 배열 목록) | packed(base64) | unicode(⠁⠃...) | bins("100000" 목록)"""
+    if obj.get("cells") is not None:
+        cells = obj["cells"]
+        if not isinstance(cells, list) or any(not isinstance(c, list) or len(c) != 6 for c in cells):
+            raise ValueError("cells 는 6점 배열의 목록이어야 합니다.")
+        return pack_many(cells)
+    if obj.get("packed") is not None:
+        packed = base64.b64decode(obj["packed"], validate=True)
+        if any(b > 0x3F for b in packed):
+            raise ValueError("packed 는 6점 셀(0x00~0x3F) 바이트만 허용합니다.")
+        return packed
+    if obj.get("unicode") is not None:
+        braille = str(obj["unicode"])
+        if any(not 0x2800 <= ord(ch) <= 0x283F for ch in braille):
+            raise ValueError("unicode 는 6점 점자(U+2800~U+283F)만 허용합니다.")
+        return from_unicode(braille)
+    if obj.get("bins") is not None:
+        return pack_many([int(b) for b in str(bits)[:6]] for bits in obj["bins"])
+    raise ValueError("cells, packed, unicode, bins 중 하나가 필요합니다.")
+
+def _decode_item(obj, grade):
+    """단건 역변환 (+ expected 가 있으면 셀 단위 채점)"""
+    packed = _packed_input(obj)
+    text, ambiguous = bytes_to_text(packed)
+    out = {"text": text, "ambiguous": ambiguous, "len": len(packed)}
+    expected = obj.get("expected")
+    if expected is not None:
+        # 채점은 역변환 결과가 아니라 정답을 정방향 변환한 셀과 비교 (모호성 영향 없음)
+        answer = text_to_bytes(str(expected), grade)
+        out["match"] = answer.strip(b"\x00") == packed.strip(b"\x00")
+    return out
+
+@csrf_exempt
+def braille_decode(request):
+    """
+    점자 -> 텍스트 역변환 (정자 기준)
+    POST {"cells": [[0|1 x 6], ...]} | {"packed": "<base64>"} | {"unicode": "⠁⠃"} | {"bins": ["100000", ...]}
+         -> {"text": "...", "ambiguous": bool, "len": n}
+    "expected": "정답" 을 함께 보내면 정답을 점자로 바꿔 셀 단위로 비교한 "match" 를 붙인다.
+    POST {"items": [{...}, ...]} -> {"results": [...], "count": n}  (문제 여러 개 일괄 채점)
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "method_not_allowed"}, status=405)
+    try:
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+    except Exception:
+        return JsonResponse({"error": "invalid_json"}, status=400)
+    if not isinstance(payload, dict):
+        return JsonResponse({"error": "bad_request", "detail": "JSON 객체가 필요합니다."}, status=400)
+
+    grade = _negotiate_grade(request, payload)
+    items = payload.get("items")
+    try:
+        if isinstance(items, list):
+            if len(items) > MAX_BATCH:
+                return JsonResponse({"error": "too_many_items", "detail": f"최대 {MAX_BATCH}개까지 변환할 수 있습니다."}, status=413)
+            results = [_decode_item(it if isinstance(it, dict) else {}, grade) for it in items]
+            return JsonResponse({"results": results, "count": len(results)},
+                                json_dumps_params={"ensure_ascii": False})
+        return JsonResponse(_decode_item(payload, grade), json_dumps_params={"ensure_ascii": False})
+    except (ValueError, TypeError) as e:
+        return JsonResponse({"error": "bad_request", "detail": str(e)}, status=400)
     except Exception as e:
-        print(f"[braille_convert] Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("braille_decode failed")
         return JsonResponse({"error": str(e)}, status=500)
 
 @csrf_exempt
 def convert(request):
     """레거시 호환"""
-    return braille_convert(request)
\ No newline at end of file
+    return braille_convert(request)
@@ -4,17 +4,29 @@ Provides structured responses with keyword extraction for braille output
 """
 
 import json
+import logging
 import re
 from typing import Dict, List, Optional, Any
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-import google.generativeai as genai
-import os
 
-# Configure Gemini AI
-genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
-model = genai.GenerativeModel('gemini-1.5-flash')
+from services import answer_cache, clients
+from services.single_flight import flights
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = 'gemini-1.5-flash'
+
+
+def _get_model():
+    """Process-wide shared Gemini model (services.clients; configured once)"""
+    return clients.gemini_model(MODEL_NAME, key_env='GEMINI_API_KEY')
+
+
+def _get_async_model():
+    """Gemini model with a per-event-loop async client (for ASGI views)"""
+    return clients.gemini_async_model(MODEL_NAME, key_env='GEMINI_API_KEY')
 
 class AIAssistantProcessor:
     """Processes queries for visually impaired users with structured responses"""
@@ -97,25 +109,66 @@ class AIAssistantProcessor:
 
     def process_query(self, query: str, mode: str = "qa", topic: str = "") -> Dict[str, Any]:
         """Process user query and return structured AI response"""
+        cache_args = {"topic": topic, "model": MODEL_NAME, "template": self.prompt_template}
+        cached = answer_cache.lookup(mode, query, **cache_args)
+        if cached is not None:
+            # Cached post-processed payload (keywords / braille_words already extracted)
+            return cached[0]
+        # Identical concurrent queries share one Gemini call (services.single_flight)
+        key = answer_cache.make_key(mode, query, topic, MODEL_NAME, self.prompt_template)
+        result, _shared = flights.do(key, lambda: self._generate(query, mode, topic, cache_args))
+        return result
+
+    async def aprocess_query(self, query: str, mode: str = "qa", topic: str = "") -> Dict[str, Any]:
+        """Async variant of process_query (Gemini generate_content_async, for ASGI views)"""
+        cache_args = {"topic": topic, "model": MODEL_NAME, "template": self.prompt_template}
+        cached = answer_cache.lookup(mode, query, **cache_args)
+        if cached is not None:
+            return cached[0]
+        key = answer_cache.make_key(mode, query, topic, MODEL_NAME, self.prompt_template)
+        result, _shared = await flights.ado(key, lambda: self._agenerate(query, mode, topic, cache_args))
+        return result
+
+    def _generate(self, query: str, mode: str, topic: str, cache_args: Dict[str, Any]) -> Dict[str, Any]:
+        # Re-check: another call may have stored the answer between our lookup and joining the flight
+        cached = answer_cache.lookup(mode, query, **cache_args)
+        if cached is not None:
+            return cached[0]
         try:
             # Create prompt with mode-specific instructions
             prompt = self.prompt_template.format(query=query, mode=mode, topic=topic)
             
             # Get response from Gemini
-            response = model.generate_content(prompt)
-            
-            # Parse JSON response
-            try:
-                ai_response = json.loads(response.text)
-                return self.validate_response(ai_response, mode)
-            except json.JSONDecodeError:
-                # Fallback if JSON parsing fails
-                return self.create_fallback_response(query, mode, response.text)
+            response = _get_model().generate_content(prompt)
+            return self._finish(response.text, query, mode, cache_args)
                 
         except Exception as e:
             print(f"AI Assistant error: {e}")
             return self.create_error_response(query, mode)
 
+    async def _agenerate(self, query: str, mode: str, topic: str, cache_args: Dict[str, Any]) -> Dict[str, Any]:
+        cached = answer_cache.lookup(mode, query, **cache_args)
+        if cached is not None:
+            return cached[0]
+        try:
+            prompt = self.prompt_template.format(query=query, mode=mode, topic=topic)
+            response = await _get_async_model().generate_content_async(prompt)
+            return self._finish(response.text, query, mode, cache_args)
+        except Exception as e:
+            logger.warning("[chat] ai assistant (async) failed: %s", e)
+            return self.create_error_response(query, mode)
+
+    def _finish(self, text: str, query: str, mode: str, cache_args: Dict[str, Any]) -> Dict[str, Any]:
+        # Parse JSON response
+        try:
+            ai_response = json.loads(text)
+        except json.JSONDecodeError:
+            # Fallback if JSON parsing fails (not cached - retry may yield valid JSON)
+            return self.create_fallback_response(query, mode, text)
+        result = self.validate_response(ai_response, mode)
+        answer_cache.store(mode, query, result, **cache_args)
+        return result
+
     def validate_response(self, response: Dict[str, Any], mode: str) -> Dict[str, Any]:
         """Validate and clean AI response"""
         # Ensure required fields
@@ -5,3 +5,23 @@ class ChatConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.chat'
     verbose_name = 'AI 채팅'
+
+    def ready(self):
+        from django.conf import settings
+        from services import answer_cache
+        from services.semantic_cache import SemanticCache
+
+        shared = None
+        alias = getattr(settings, "CHAT_CACHE_ALIAS", "")
+        if alias:
+            from django.core.cache import caches
+            shared = caches[alias]
+        answer_cache.configure(
+            max_entries=getattr(settings, "CHAT_CACHE_MAX_ENTRIES", 2048),
+            max_bytes=getattr(settings, "CHAT_CACHE_MAX_BYTES", 16 * 1024 * 1024),
+            shared=shared,
+            semantic=SemanticCache(
+                threshold=getattr(settings, "CHAT_SEMANTIC_THRESHOLD", 0.8),
+                max_entries=getattr(settings, "CHAT_SEMANTIC_MAX_ENTRIES", 4096),
+            ) if getattr(settings, "CHAT_SEMANTIC_CACHE", True) else None,
+        )
@@ -0,0 +1,258 @@
+# apps/chat/async_views.py
+"""
+ASGI 용 async 챗/뉴스 뷰 (apps.chat.views 와 같은 URL·요청·응답 형식)
+
+동기 뷰는 LLM 왕복(2~15초) 동안 워커 스레드 하나를 붙잡는다. 여기 뷰는 AsyncOpenAI,
+Gemini generate_content_async, httpx.AsyncClient 를 await 하므로 uvicorn 프로세스 하나가
+느린 업스트림 호출 수백 개를 동시에 들고 있을 수 있다.
+
+- ASGI(jeomgeuli_backend.asgi)로 띄우면 apps.chat.urls 가 이 모듈의 뷰를 쓴다 (settings.CHAT_ASYNC_VIEWS)
+- 프롬프트·모델·캐시 키·single-flight 키가 동기 뷰와 같다 -> 응답 캐시·동시 호출 합치기 공유
+- explore 는 GPT 답변과 뉴스 검색을 동시에 보낸다
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+
+import httpx
+from django.http import JsonResponse
+
+from services import answer_cache, clients
+from services.single_flight import flights
+
+from .ai_assistant import processor
+from .views import (ASK_PROMPT, CHAT_MODEL, DETAIL_PROMPT, EXPLORE_PROMPT, NAVER_NEWS_URL, NEWS_SUMMARY_PROMPT,
+                    _cached_response, _ok_rate, _split_keywords)
+
+logger = logging.getLogger(__name__)
+
+
+def _csrf_exempt(view):
+    # Django 4.2 의 csrf_exempt 는 코루틴 함수를 동기 함수로 감싸 버리므로 표시만 붙인다
+    view.csrf_exempt = True
+    return view
+
+
+async def _complete(prompt: str) -> str:
+    resp = await clients.aopenai().chat.completions.create(
+        model=CHAT_MODEL,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    return resp.choices[0].message.content
+
+
+async def _llm_answer(request, field: str, mode: str, template: str, error: str, extra=None):
+    """chat_ask / chat_detail 공통: 본문 field -> 캐시/합치기 -> 답변 + 키워드"""
+    if request.method != "POST":
+        return JsonResponse({"error": "method_not_allowed"}, status=405)
+
+    ip = request.META.get("REMOTE_ADDR", "unknown")
+    if not _ok_rate(ip):
+        return JsonResponse({"error":"too_many_requests","detail":"잠시 후 다시 시도해주세요."}, status=429)
+
+    try:
+        body = json.loads(request.body.decode("utf-8"))
+        text = (body.get(field) or "").strip()
+        if not text:
+            return JsonResponse({"error":"bad_request","detail":f"{field} is required"}, status=400)
+
+        async def compute():
+            answer, keywords = _split_keywords(await _complete(template.format(**{field: text})))
+            return {"answer": answer, "keywords": keywords[:3], **(extra or {})}
+
+        try:
+            payload, hit = await answer_cache.acached_answer(mode, text, compute,
+                                                             model=CHAT_MODEL, template=template)
+        except clients.ConfigError as cfg_err:
+            return JsonResponse({"error":"config_error","detail":str(cfg_err)}, status=503)
+        return _cached_response(payload, hit)
+
+    except Exception as e:
+        return JsonResponse({"error":error,"detail":str(e)}, status=500)
+
+
+@_csrf_exempt
+async def chat_ask(request):
+    return await _llm_answer(request, "query", "ask", ASK_PROMPT, "chat_ask_failed")
+
+
+@_csrf_exempt
+async def chat_detail(request):
+    """자세한 설명 모드"""
+    return await _llm_answer(request, "topic", "detail", DETAIL_PROMPT, "chat_detail_failed", {"mode": "detail"})
+
+
+@_csrf_exempt
+async def news_summary(request):
+    try:
+        if request.method == "POST":
+            try:
+                body = json.loads(request.body.decode("utf-8"))
+                q = (body.get("q") or body.get("query") or "").strip()
+            except Exception:
+                q = ""
+        else:
+            q = (request.GET.get("q", "") or request.GET.get("query", "")).strip()
+
+        if not q:
+            return JsonResponse({"ok": True, "items": [], "q": ""})
+
+        try:
+            answer = await _complete(NEWS_SUMMARY_PROMPT.format(q=q))
+            items = [{"title": line.strip(), "summary": ""} for line in answer.split('\n') if line.strip()]
+            return JsonResponse({"ok": True, "items": items, "q": q, "answer": answer})
+        except Exception as e:
+            return JsonResponse({"ok": False, "error": str(e), "items": [], "q": q})
+
+    except Exception as e:
+        return JsonResponse({"ok": False, "error": str(e), "items": []})
+
+
+@_csrf_exempt
+async def naver_news(request):
+    """
+    네이버 뉴스 API 프록시
+    GET /api/news?q=검색어&display=10&start=1&sort=sim
+    """
+    if request.method != "GET":
+        return JsonResponse({"error": "method_not_allowed"}, status=405)
+
+    try:
+        client_id = os.getenv("NAVER_CLIENT_ID")
+        client_secret = os.getenv("NAVER_CLIENT_SECRET")
+        if not client_id or not client_secret:
+            return JsonResponse({
+                "error": "naver_api_keys_not_set",
+                "detail": "NAVER_CLIENT_ID 또는 NAVER_CLIENT_SECRET이 설정되지 않았습니다."
+            }, status=503)
+
+        query = request.GET.get('q', '').strip()
+        if not query:
+            return JsonResponse({"error": "query_required", "detail": "검색어(q)가 필요합니다."}, status=400)
+
+        params = {
+            'query': query,
+            'display': request.GET.get('display', '10'),
+            'start': request.GET.get('start', '1'),
+            'sort': request.GET.get('sort', 'sim'),
+        }
+        response = await clients.ahttp().get(NAVER_NEWS_URL, headers=_naver_headers(client_id, client_secret),
+                                              params=params)
+
+        if response.status_code == 200:
+            return JsonResponse(response.json(), safe=False)
+        return JsonResponse({
+            "error": "naver_api_error",
+            "detail": f"네이버 API 오류: {response.status_code}",
+            "naver_response": response.text
+        }, status=response.status_code)
+
+    except httpx.TimeoutException:
+        return JsonResponse({"error": "timeout", "detail": "네이버 API 호출 시간 초과"}, status=504)
+    except httpx.HTTPError as e:
+        return JsonResponse({"error": "network_error", "detail": f"네트워크 오류: {str(e)}"}, status=502)
+    except Exception as e:
+        return JsonResponse({"error": "internal_error", "detail": f"내부 오류: {str(e)}"}, status=500)
+
+
+def _naver_headers(client_id, client_secret):
+    return {'X-Naver-Client-Id': client_id, 'X-Naver-Client-Secret': client_secret}
+
+
+async def _explore_answer(query):
+    try:
+        return await _complete(EXPLORE_PROMPT.format(query=query))
+    except Exception as e:
+        return f"GPT 답변 생성 중 오류가 발생했습니다: {str(e)}"
+
+
+async def _explore_news(query, naver_client_id, naver_client_secret):
+    try:
+        response = await clients.ahttp().get(
+            NAVER_NEWS_URL, headers=_naver_headers(naver_client_id, naver_client_secret),
+            params={'query': query, 'display': 5, 'sort': 'sim'})
+        return response.json().get("items", []) if response.status_code == 200 else []
+    except Exception as e:
+        logger.warning("[chat] naver news lookup failed: %s", e)
+        return []
+
+
+async def _explore_result(query, naver_client_id, naver_client_secret):
+    """GPT 답변과 뉴스 목록을 동시에 (각각 실패해도 나머지는 반환)"""
+    answer, news = await asyncio.gather(_explore_answer(query),
+                                        _explore_news(query, naver_client_id, naver_client_secret))
+    return {"answer": answer, "news": news}
+
+
+@_csrf_exempt
+async def explore(request):
+    """
+    정보탐색 모드: GPT 답변 + 네이버 뉴스 검색 결과 통합
+    GET /api/explore?q=검색어
+    """
+    if request.method != "GET":
+        return JsonResponse({"error": "method_not_allowed"}, status=405)
+
+    try:
+        naver_client_id = os.getenv("NAVER_CLIENT_ID")
+        naver_client_secret = os.getenv("NAVER_CLIENT_SECRET")
+        if not os.getenv("OPENAI_API_KEY"):
+            return JsonResponse({
+                "error": "openai_key_not_set",
+                "detail": "OPENAI_API_KEY가 설정되지 않았습니다."
+            }, status=503)
+        if not naver_client_id or not naver_client_secret:
+            return JsonResponse({
+                "error": "naver_keys_not_set",
+                "detail": "NAVER_CLIENT_ID 또는 NAVER_CLIENT_SECRET이 설정되지 않았습니다."
+            }, status=503)
+
+        query = request.GET.get('q', '오늘 뉴스').strip()
+        if not query:
+            return JsonResponse({"error": "query_required", "detail": "검색어(q)가 필요합니다."}, status=400)
+
+        key = answer_cache.make_key("explore", query, model=CHAT_MODEL, template=EXPLORE_PROMPT)
+        result, _shared = await flights.ado(
+            key, lambda: _explore_result(query, naver_client_id, naver_client_secret))
+        return JsonResponse({
+            "answer": result["answer"],
+            "news": result["news"],
+            "query": query,
+            "timestamp": time.time()
+        })
+
+    except Exception as e:
+        return JsonResponse({
+            "error": "explore_failed",
+            "detail": f"정보탐색 중 오류가 발생했습니다: {str(e)}"
+        }, status=500)
+
+
+@_csrf_exempt
+async def ai_assistant_view(request):
+    """Handle AI Assistant requests (async; see ai_assistant.ai_assistant_view)"""
+    if request.method != "POST":
+        return JsonResponse({"error": "method_not_allowed"}, status=405)
+    try:
+        data = json.loads(request.body)
+        query = data.get('q', '').strip()
+        mode = data.get('mode', 'qa')
+        format_type = data.get('format', '')
+
+        if not query:
+            return JsonResponse({"error": "질문을 입력해주세요."}, status=400)
+        if mode not in ['news', 'explain', 'qa']:
+            mode = 'qa'
+
+        if format_type == 'ai_assistant':
+            return JsonResponse(await processor.aprocess_query(query, mode))
+        # Fallback to regular chat processing
+        return await chat_ask(request)
+
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "잘못된 요청 형식입니다."}, status=400)
+    except Exception:
+        logger.exception("[chat] ai assistant view failed")
+        return JsonResponse({"error": "서버 오류가 발생했습니다."}, status=500)
@@ -1,8 +1,9 @@
 import os, time, threading
-import google.generativeai as genai
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from google.api_core.exceptions import DeadlineExceeded, ServiceUnavailable
 
+from services import clients
+
 MODEL_NAME = os.environ.get("GEMINI_MODEL", "gemini-1.5-flash")  # 필요시 pro로 교체
 
 class TransientError(RuntimeError): ...
@@ -22,8 +23,9 @@ def _get_api_key():
     return key
 
 def _get_model():
-    genai.configure(api_key=_get_api_key())
-    return genai.GenerativeModel(
+    # 프로세스 공유 모델 (services.clients - configure/생성은 한 번, 재설정은 clients.reload())
+    _get_api_key()
+    return clients.gemini_model(
         MODEL_NAME,
         system_instruction=SYSTEM_PROMPT,
         safety_settings={
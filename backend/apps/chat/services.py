@@ -1,7 +1,8 @@
 import os
-import google.generativeai as genai
 from django.conf import settings
 
+from services import clients
+
 
 class GeminiService:
     def __init__(self):
@@ -9,8 +10,8 @@ class GeminiService:
         if not api_key:
             raise ValueError("GEMINI_API_KEY not found in environment variables")
         
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        # 프로세스 공유 모델 (services.clients - configure/생성은 한 번)
+        self.model = clients.gemini_model('gemini-1.5-flash', key_env='GEMINI_API_KEY')
     
     def generate_news_response(self, query):
         """Generate news summary response with 5 cards"""
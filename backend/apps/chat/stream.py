@@ -1,11 +1,8 @@
-import os, json
+import json
 from django.http import StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
-from dotenv import load_dotenv
-from openai import OpenAI
 
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from services import clients
 
 @csrf_exempt
 def chat_stream(request):
@@ -19,6 +16,7 @@ def chat_stream(request):
 
         def gen():
             try:
+                client = clients.openai()
                 with client.responses.stream(
                     model="gpt-4o-mini",
                     input=f"사용자 질문: {q}\n간결하고 정확하게 한국어로 답해줘.",
@@ -1,13 +1,26 @@
 # apps/chat/urls.py
+from django.conf import settings
 from django.urls import path
-from .views import chat_ask, chat_detail, health, llm_health, news_summary, naver_news, explore
+
+from . import views
+from .views import health, llm_health, llm_reload
+
+# ASGI 로 띄우면 LLM/외부 API 를 부르는 뷰는 async 판 (apps.chat.async_views)
+if settings.CHAT_ASYNC_VIEWS:
+    from . import async_views as chat_views
+    ai_assistant_view = chat_views.ai_assistant_view
+else:
+    chat_views = views
+    from .ai_assistant import ai_assistant_view
 
 urlpatterns = [
-    path("ask/", chat_ask, name="chat_ask"),
-    path("detail/", chat_detail, name="chat_detail"),  # 자세한 설명 모드
+    path("ask/", chat_views.chat_ask, name="chat_ask"),
+    path("detail/", chat_views.chat_detail, name="chat_detail"),  # 자세한 설명 모드
+    path("assistant/", ai_assistant_view, name="ai_assistant"),   # 구조화 응답 (Gemini)
     path("health/", health, name="health"),
     path("llm/health/", llm_health, name="llm_health"),
-    path("news/summary/", news_summary, name="news_summary"),
-    path("news/", naver_news, name="naver_news"),  # 네이버 뉴스 API 프록시
-    path("explore/", explore, name="explore"),      # 정보탐색 모드: GPT + 뉴스
+    path("llm/reload/", llm_reload, name="llm_reload"),  # 클라이언트/설정 재로드 훅
+    path("news/summary/", chat_views.news_summary, name="news_summary"),
+    path("news/", chat_views.naver_news, name="naver_news"),  # 네이버 뉴스 API 프록시
+    path("explore/", chat_views.explore, name="explore"),      # 정보탐색 모드: GPT + 뉴스
 ]
@@ -1,8 +1,12 @@
 # apps/chat/views.py
 import os, json, time, requests
+from django.conf import settings
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 
+from services import answer_cache, clients
+from services.single_flight import flights
+
 # --- 레이트리밋(그대로) ---
 _LAST = {}
 def _ok_rate(ip: str, interval=1.0):
@@ -14,33 +18,83 @@ def _ok_rate(ip: str, interval=1.0):
     return True
 
 def _get_openai_client():
-    # 안전장치: .env 파일 자동 탐색 및 로드
-    from dotenv import load_dotenv, find_dotenv
-    load_dotenv(find_dotenv(), override=True, encoding="utf-8")
-    
-    try:
-        from openai import OpenAI
-    except Exception as e:
-        raise RuntimeError(f"OpenAI SDK(v1+) 필요: {e}")
-    
-    key = os.getenv("OPENAI_API_KEY")
-    
-    # 확인 코드 추가 (로깅)
-    import logging
-    logging.warning("OPENAI_API_KEY prefix: %s", (key[:10] if key else "NONE"))
-    
-    if not key:
-        raise RuntimeError("OPENAI_API_KEY 미설정")
-    return OpenAI(api_key=key)
+    # 프로세스 공유 클라이언트 (services.clients - .env 재로드는 llm_reload 훅에서만)
+    return clients.openai()
+
+CHAT_MODEL = "gpt-4o-mini"
+NAVER_NEWS_URL = os.getenv("NAVER_NEWS_URL", "https://openapi.naver.com/v1/search/news.json")
+
+# 프롬프트 템플릿 - 문자열 자체가 응답 캐시 키에 들어간다(고치면 이전 캐시는 안 쓰임)
+# 불릿 요약 + 키워드 추출
+ASK_PROMPT = """다음 질문에 대해 불릿 포인트 형태로 답변해주세요: {query}
+
+답변 형식:
+• 첫 번째 핵심 내용
+• 두 번째 핵심 내용  
+• 세 번째 핵심 내용
+
+답변 후에 핵심 키워드 3개를 추출해서 "키워드: 키워드1, 키워드2, 키워드3" 형태로 끝에 추가해주세요."""
+
+# 자세한 설명
+DETAIL_PROMPT = """"{topic}"에 대해 자세하고 구체적으로 설명해주세요. 
+
+다음 내용을 포함해주세요:
+- 기본 개념과 정의
+- 주요 특징과 원리
+- 실제 활용 사례나 예시
+- 관련된 중요 정보
+
+답변 후에 핵심 키워드 3개를 추출해서 "키워드: 키워드1, 키워드2, 키워드3" 형태로 끝에 추가해주세요."""
+
+def _split_keywords(answer):
+    """답변 끝의 "키워드: a, b, c" -> (본문, [a, b, c])"""
+    keywords = []
+    if "키워드:" in answer:
+        try:
+            keyword_part = answer.split("키워드:")[-1].strip()
+            keywords = [kw.strip() for kw in keyword_part.split(",") if kw.strip()]
+            # 답변에서 키워드 부분 제거
+            answer = answer.split("키워드:")[0].strip()
+        except:
+            pass
+    return answer, keywords
+
+def _cached_response(payload, hit):
+    # 후처리까지 끝난 응답 캐시 (services.answer_cache) - 적중 여부는 헤더로만 알림
+    # HIT: 정규화 질의 일치 / SIMILAR: 유사 질의(MinHash) 재사용
+    # COALESCED: 동시에 들어온 같은 질의의 호출 결과를 같이 받음 (services.single_flight) / MISS
+    response = JsonResponse(payload)
+    response["X-Cache"] = {"exact": "HIT", "similar": "SIMILAR", "coalesced": "COALESCED"}.get(hit, "MISS")
+    return response
 
 # --- 헬스 체크들 ---
 def health(_request):
     return JsonResponse({"ok": True})
 
 def llm_health(_request):
-    # LLM 연결상태 간단 점검(키 유무만 확인)
+    # LLM 연결상태 간단 점검(키 유무 + 만들어 둔 클라이언트)
     has_key = bool(os.getenv("OPENAI_API_KEY"))
-    return JsonResponse({"ok": has_key, "provider": "openai", "model": "gpt-4o-mini"})
+    semantic = answer_cache.get_semantic()
+    return JsonResponse({"ok": has_key, "provider": "openai", "model": CHAT_MODEL,
+                         "clients": clients.registry.status(),
+                         "cache": answer_cache.get_cache().stats(),
+                         "semantic_cache": semantic.stats() if semantic else None,
+                         "single_flight": flights.stats()})
+
+@csrf_exempt
+def llm_reload(request):
+    """
+    설정 변경 반영 훅: .env 재로드 + LLM/HTTP 클라이언트 재생성 (다음 요청부터)
+    POST /api/chat/llm/reload/ - DEBUG 이거나 로컬(loopback)에서만
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "method_not_allowed"}, status=405)
+    if not settings.DEBUG and request.META.get("REMOTE_ADDR") not in ("127.0.0.1", "::1"):
+        return JsonResponse({"error": "forbidden", "detail": "local only"}, status=403)
+    clients.reload()
+    return JsonResponse({"ok": True, "clients": clients.registry.status()})
+
+NEWS_SUMMARY_PROMPT = "'{q}'에 대한 최신 뉴스를 5개 항목으로 요약해주세요. 각 항목은 제목과 간단한 설명을 포함해주세요."
 
 @csrf_exempt
 def news_summary(request):
@@ -63,11 +117,9 @@ def news_summary(request):
         # OpenAI를 사용한 뉴스 요약
         try:
             client = _get_openai_client()
-            prompt = f"'{q}'에 대한 최신 뉴스를 5개 항목으로 요약해주세요. 각 항목은 제목과 간단한 설명을 포함해주세요."
-            
             resp = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}]
+                model=CHAT_MODEL,
+                messages=[{"role": "user", "content": NEWS_SUMMARY_PROMPT.format(q=q)}]
             )
             
             answer = resp.choices[0].message.content
@@ -97,42 +149,24 @@ def chat_ask(request):
         if not user_query:
             return JsonResponse({"error":"bad_request","detail":"query is required"}, status=400)
 
-        try:
+        def compute():
             client = _get_openai_client()
-        except Exception as cfg_err:
-            return JsonResponse({"error":"config_error","detail":str(cfg_err)}, status=503)
-
-        # 불릿 요약 + 키워드 추출을 위한 프롬프트 수정
-        enhanced_prompt = f"""다음 질문에 대해 불릿 포인트 형태로 답변해주세요: {user_query}
-
-답변 형식:
-• 첫 번째 핵심 내용
-• 두 번째 핵심 내용  
-• 세 번째 핵심 내용
-
-답변 후에 핵심 키워드 3개를 추출해서 "키워드: 키워드1, 키워드2, 키워드3" 형태로 끝에 추가해주세요."""
+            resp = client.chat.completions.create(
+                model=CHAT_MODEL,   # 필요시 gpt-4o 등으로 변경
+                messages=[{"role": "user", "content": ASK_PROMPT.format(query=user_query)}]
+            )
+            answer, keywords = _split_keywords(resp.choices[0].message.content)
+            return {
+                "answer": answer,
+                "keywords": keywords[:3]  # 최대 3개 키워드
+            }
 
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",   # 필요시 gpt-4o 등으로 변경
-            messages=[{"role": "user", "content": enhanced_prompt}]
-        )
-        answer = resp.choices[0].message.content
-        
-        # 키워드 추출
-        keywords = []
-        if "키워드:" in answer:
-            try:
-                keyword_part = answer.split("키워드:")[-1].strip()
-                keywords = [kw.strip() for kw in keyword_part.split(",") if kw.strip()]
-                # 답변에서 키워드 부분 제거
-                answer = answer.split("키워드:")[0].strip()
-            except:
-                pass
-        
-        return JsonResponse({
-            "answer": answer,
-            "keywords": keywords[:3]  # 최대 3개 키워드
-        })
+        try:
+            payload, hit = answer_cache.cached_answer("ask", user_query, compute,
+                                                      model=CHAT_MODEL, template=ASK_PROMPT)
+        except clients.ConfigError as cfg_err:
+            return JsonResponse({"error":"config_error","detail":str(cfg_err)}, status=503)
+        return _cached_response(payload, hit)
 
     except Exception as e:
         return JsonResponse({"error":"chat_ask_failed","detail":str(e)}, status=500)
@@ -154,43 +188,25 @@ def chat_detail(request):
         if not topic:
             return JsonResponse({"error":"bad_request","detail":"topic is required"}, status=400)
 
-        try:
+        def compute():
             client = _get_openai_client()
-        except Exception as cfg_err:
-            return JsonResponse({"error":"config_error","detail":str(cfg_err)}, status=503)
-
-        # 자세한 설명을 위한 프롬프트
-        detail_prompt = f""""{topic}"에 대해 자세하고 구체적으로 설명해주세요. 
-
-다음 내용을 포함해주세요:
-- 기본 개념과 정의
-- 주요 특징과 원리
-- 실제 활용 사례나 예시
-- 관련된 중요 정보
-
-답변 후에 핵심 키워드 3개를 추출해서 "키워드: 키워드1, 키워드2, 키워드3" 형태로 끝에 추가해주세요."""
+            resp = client.chat.completions.create(
+                model=CHAT_MODEL,
+                messages=[{"role": "user", "content": DETAIL_PROMPT.format(topic=topic)}]
+            )
+            answer, keywords = _split_keywords(resp.choices[0].message.content)
+            return {
+                "answer": answer,
+                "keywords": keywords[:3],
+                "mode": "detail"
+            }
 
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": detail_prompt}]
-        )
-        answer = resp.choices[0].message.content
-        
-        # 키워드 추출
-        keywords = []
-        if "키워드:" in answer:
-            try:
-                keyword_part = answer.split("키워드:")[-1].strip()
-                keywords = [kw.strip() for kw in keyword_part.split(",") if kw.strip()]
-                answer = answer.split("키워드:")[0].strip()
-            except:
-                pass
-        
-        return JsonResponse({
-            "answer": answer,
-            "keywords": keywords[:3],
-            "mode": "detail"
-        })
+        try:
+            payload, hit = answer_cache.cached_answer("detail", topic, compute,
+                                                      model=CHAT_MODEL, template=DETAIL_PROMPT)
+        except clients.ConfigError as cfg_err:
+            return JsonResponse({"error":"config_error","detail":str(cfg_err)}, status=503)
+        return _cached_response(payload, hit)
 
     except Exception as e:
         return JsonResponse({"error":"chat_detail_failed","detail":str(e)}, status=500)
@@ -207,10 +223,6 @@ def naver_news(request):
         return JsonResponse({"error": "method_not_allowed"}, status=405)
     
     try:
-        # .env 강제 로드
-        from dotenv import load_dotenv, find_dotenv
-        load_dotenv(find_dotenv(), override=True, encoding="utf-8")
-        
         # 네이버 API 키 확인
         client_id = os.getenv("NAVER_CLIENT_ID")
         client_secret = os.getenv("NAVER_CLIENT_SECRET")
@@ -231,7 +243,7 @@ def naver_news(request):
         sort = request.GET.get('sort', 'sim')  # sim: 정확도순, date: 날짜순
         
         # 네이버 뉴스 API 호출
-        naver_url = "https://openapi.naver.com/v1/search/news.json"
+        naver_url = NAVER_NEWS_URL
         headers = {
             'X-Naver-Client-Id': client_id,
             'X-Naver-Client-Secret': client_secret
@@ -243,8 +255,8 @@ def naver_news(request):
             'sort': sort
         }
         
-        # 네이버 API 호출
-        response = requests.get(naver_url, headers=headers, params=params, timeout=10)
+        # 네이버 API 호출 (공유 세션 - keep-alive 연결 재사용)
+        response = clients.http().get(naver_url, headers=headers, params=params, timeout=10)
         
         if response.status_code == 200:
             # 네이버 API 응답을 그대로 반환
@@ -274,6 +286,49 @@ def naver_news(request):
 
 
 # --- 정보탐색 모드: GPT + 네이버 뉴스 통합 ---
+EXPLORE_PROMPT = "'{query}'에 대해 간결하고 정확하게 설명해주세요."
+
+def _explore_result(query, naver_client_id, naver_client_secret):
+    """GPT 답변 + 뉴스 목록 (각각 실패해도 나머지는 반환)"""
+    # 1) OpenAI GPT 호출
+    try:
+        client = clients.openai()
+        
+        gpt_response = client.chat.completions.create(
+            model=CHAT_MODEL,
+            messages=[{"role": "user", "content": EXPLORE_PROMPT.format(query=query)}]
+        )
+        gpt_answer = gpt_response.choices[0].message.content
+    except Exception as e:
+        gpt_answer = f"GPT 답변 생성 중 오류가 발생했습니다: {str(e)}"
+    
+    # 2) 네이버 뉴스 API 호출
+    try:
+        naver_url = NAVER_NEWS_URL
+        headers = {
+            'X-Naver-Client-Id': naver_client_id,
+            'X-Naver-Client-Secret': naver_client_secret
+        }
+        params = {
+            'query': query,
+            'display': 5,
+            'sort': 'sim'
+        }
+        
+        news_response = clients.http().get(naver_url, headers=headers, params=params, timeout=10)
+        
+        if news_response.status_code == 200:
+            news_data = news_response.json()
+            news_items = news_data.get("items", [])
+        else:
+            news_items = []
+            
+    except Exception as e:
+        news_items = []
+        print(f"네이버 뉴스 API 오류: {e}")
+    
+    return {"answer": gpt_answer, "news": news_items}
+
 @csrf_exempt
 def explore(request):
     """
@@ -284,10 +339,6 @@ def explore(request):
         return JsonResponse({"error": "method_not_allowed"}, status=405)
     
     try:
-        # .env 강제 로드
-        from dotenv import load_dotenv, find_dotenv
-        load_dotenv(find_dotenv(), override=True, encoding="utf-8")
-        
         # API 키 확인
         openai_key = os.getenv("OPENAI_API_KEY")
         naver_client_id = os.getenv("NAVER_CLIENT_ID")
@@ -310,43 +361,11 @@ def explore(request):
         if not query:
             return JsonResponse({"error": "query_required", "detail": "검색어(q)가 필요합니다."}, status=400)
         
-        # 1) OpenAI GPT 호출
-        try:
-            from openai import OpenAI
-            client = OpenAI(api_key=openai_key)
-            
-            gpt_response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": f"'{query}'에 대해 간결하고 정확하게 설명해주세요."}]
-            )
-            gpt_answer = gpt_response.choices[0].message.content
-        except Exception as e:
-            gpt_answer = f"GPT 답변 생성 중 오류가 발생했습니다: {str(e)}"
-        
-        # 2) 네이버 뉴스 API 호출
-        try:
-            naver_url = "https://openapi.naver.com/v1/search/news.json"
-            headers = {
-                'X-Naver-Client-Id': naver_client_id,
-                'X-Naver-Client-Secret': naver_client_secret
-            }
-            params = {
-                'query': query,
-                'display': 5,
-                'sort': 'sim'
-            }
-            
-            news_response = requests.get(naver_url, headers=headers, params=params, timeout=10)
-            
-            if news_response.status_code == 200:
-                news_data = news_response.json()
-                news_items = news_data.get("items", [])
-            else:
-                news_items = []
-                
-        except Exception as e:
-            news_items = []
-            print(f"네이버 뉴스 API 오류: {e}")
+        # 1) GPT 답변 + 2) 네이버 뉴스 - 같은 질의가 동시에 오면 한 번만 호출하고 결과를 같이 받는다
+        key = answer_cache.make_key("explore", query, model=CHAT_MODEL, template=EXPLORE_PROMPT)
+        result, _shared = flights.do(
+            key, lambda: _explore_result(query, naver_client_id, naver_client_secret))
+        gpt_answer, news_items = result["answer"], result["news"]
         
         # 3) 결과 통합 반환
         return JsonResponse({
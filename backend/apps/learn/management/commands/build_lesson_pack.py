@@ -0,0 +1,60 @@
+"""
+학습 팩 빌드: python manage.py build_lesson_pack [--output PATH] [--check] [--strict]
+
+lesson_*.json + ko_braille_core.json 을 엔진으로 검증·보강해 data/lesson_pack.json 하나로 묶는다.
+손으로 적은 점자와 엔진 결과가 다른 항목(drift)은 목록으로 출력한다.
+"""
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.learn.data import LearningData
+from services.braille.lesson_pack import PACK_FILE, build_pack, write_pack
+from services.braille.tables import DATA_DIR
+
+
+def _legacy_pairs():
+    """apps.learn.data 의 하드코딩 샘플 (korean, braille) 쌍 - drift 보고용"""
+    data = LearningData()
+    for rows in (data.char_data, data.word_data, data.sentence_data, data.free_data):
+        for row in rows:
+            if row.get("korean") and row.get("braille"):
+                yield row["korean"], row["braille"]
+
+
+class Command(BaseCommand):
+    help = "lesson_*.json + ko_braille_core.json -> 점자/TTS 를 미리 계산한 학습 팩(lesson_pack.json)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=str(DATA_DIR / PACK_FILE), help="출력 경로")
+        parser.add_argument("--check", action="store_true", help="파일을 쓰지 않고 drift 만 보고")
+        parser.add_argument("--strict", action="store_true", help="drift 가 있으면 실패(종료 코드 1)")
+
+    def handle(self, *args, **options):
+        try:
+            pack, drift = build_pack(extra={"apps/learn/data.py": _legacy_pairs()})
+        except (OSError, ValueError) as e:
+            raise CommandError(f"lesson pack build failed: {e}")
+
+        for d in drift:
+            self.stdout.write(
+                f"[drift] {d['source']} {d['id']} {d['text']!r} {d['field']}: "
+                f"{d['found']} -> {d['expected']}"
+            )
+
+        meta = pack["meta"]
+        counts = ", ".join(
+            f"{mode}={len(data if isinstance(data, list) else data.get('items', []))}"
+            for mode, data in pack["modes"].items()
+        )
+        summary = f"version {meta['version']} ({counts}, index={len(pack['index'])}, drift={len(drift)})"
+
+        if not options["check"]:
+            output = Path(options["output"])
+            write_pack(pack, output)
+            summary = f"{output}: {summary}"
+
+        if drift and options["strict"]:
+            raise CommandError(f"{len(drift)} drift item(s): {summary}")
+        style = self.style.WARNING if drift else self.style.SUCCESS
+        self.stdout.write(style(summary))
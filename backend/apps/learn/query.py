@@ -0,0 +1,204 @@
+"""
+학습 세트 페이지 조회 (limit + 불투명 커서 + 필터)
+
+GET /api/learn/<mode>/?limit=20&cursor=...&jamo=ㄱ&difficulty=1&tag=...&type=...
+
+- 세트 버전마다 한 번: 항목별 직렬화 본문 + 필터 값별 위치 목록(posting, 오름차순)을 만든다
+- 페이지 = 가장 짧은 posting 에서 커서 다음 위치를 이분 탐색으로 찾아 limit 개까지 훑고,
+  나머지 필터는 집합 포함 여부로만 확인 -> 필터 하나면 O(limit), 요청마다 전체를 훑지 않음
+- 커서 = 마지막 항목 id (base64url). 세트가 바뀌어도 그 항목이 남아 있으면 이어서 조회된다
+"""
+import base64
+import json
+import threading
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from django.http import HttpResponse, JsonResponse
+
+from services.braille import registry
+from services.braille.engine import CHOSEONG, HANGUL_FIRST, HANGUL_LAST, JONGSEONG, JUNGSEONG
+from services.braille.lesson_pack import TEXT_KEYS, item_id
+
+from .store import ALIASES, store
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 200
+
+# 쿼리 파라미터 -> 필터 이름
+FILTERS = ("jamo", "difficulty", "tag", "type")
+PAGE_PARAMS = ("limit", "cursor") + FILTERS
+
+_JUNG_JONG = 21 * 28
+_TYPE_BY_MODE = {"words": "word", "sentences": "sentence", "keywords": "keyword"}
+
+
+class QueryError(ValueError):
+    pass
+
+
+def _jamo(text: str) -> set:
+    """본문에 들어 있는 자모 (음절은 초/중/종성으로 분해, 낱자는 그대로)"""
+    out = set()
+    for ch in text:
+        cp = ord(ch)
+        if HANGUL_FIRST <= cp <= HANGUL_LAST:
+            s = cp - HANGUL_FIRST
+            out.add(CHOSEONG[s // _JUNG_JONG])
+            out.add(JUNGSEONG[(s % _JUNG_JONG) // 28])
+            if s % 28:
+                out.add(JONGSEONG[s % 28])
+        elif 0x3131 <= cp <= 0x318E:
+            out.add(ch)
+    return out
+
+
+def _values(item: dict, *keys) -> List[str]:
+    out = []
+    for key in keys:
+        v = item.get(key)
+        if isinstance(v, (list, tuple)):
+            out.extend(str(x) for x in v if x not in (None, ""))
+        elif v not in (None, ""):
+            out.append(str(v))
+    return out
+
+
+class LessonIndex:
+    """한 모드·한 버전의 항목 목록 + 필터 posting"""
+
+    def __init__(self, mode: str, version: str, data, char_types: Dict[str, str]):
+        self.mode = mode
+        self.version = version
+        items = data if isinstance(data, list) else (data or {}).get("items", [])
+        # 전체 응답과 같은 머리 필드 ({mode, ...} 또는 keywords 의 {ok})
+        if isinstance(data, list):
+            self.meta = {"ok": True}
+        else:
+            self.meta = {k: v for k, v in (data or {}).items() if k != "items"}
+        key = TEXT_KEYS[mode]
+        self.bodies: List[bytes] = []
+        self.ids: List[str] = []
+        self.position: Dict[str, int] = {}
+        self.postings: Dict[Tuple[str, str], List[int]] = {}
+
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            text = str(item.get(key) or "")
+            iid = item.get("id") or item_id(mode, text)
+            pos = len(self.ids)
+            self.ids.append(iid)
+            self.position[iid] = pos
+            self.bodies.append(json.dumps(item, ensure_ascii=False).encode("utf-8"))
+
+            types = _values(item, "type") or ([char_types[text]] if text in char_types else [])
+            if mode in _TYPE_BY_MODE:
+                types.append(_TYPE_BY_MODE[mode])
+            for name, values in (
+                ("jamo", _jamo(text)),
+                ("difficulty", _values(item, "difficulty", "level")),
+                ("tag", _values(item, "tags", "tag")),
+                ("type", types),
+            ):
+                for value in set(values):
+                    self.postings.setdefault((name, value), []).append(pos)
+        self._sets: Dict[Tuple[str, str], frozenset] = {}
+
+    def _set(self, key) -> frozenset:
+        s = self._sets.get(key)
+        if s is None:
+            s = self._sets[key] = frozenset(self.postings.get(key, ()))
+        return s
+
+    def page(self, filters: Dict[str, str], after: Optional[str], limit: int):
+        """-> (본문 목록, 다음 커서 id 또는 None, 전체 개수 또는 None)"""
+        start = -1
+        if after is not None:
+            if after not in self.position:
+                raise QueryError("stale cursor")
+            start = self.position[after]
+
+        keys = sorted(filters.items(), key=lambda k: len(self.postings.get(k, ())))
+        if keys:
+            driver = self.postings.get(keys[0], [])
+            others = [self._set(k) for k in keys[1:]]
+            total = len(driver) if len(keys) == 1 else None
+        else:
+            driver, others, total = range(len(self.ids)), [], len(self.ids)
+
+        out: List[int] = []
+        i = bisect_right(driver, start)
+        while i < len(driver) and len(out) <= limit:
+            pos = driver[i]
+            if all(pos in s for s in others):
+                out.append(pos)
+            i += 1
+        more = len(out) > limit
+        out = out[:limit]
+        next_id = self.ids[out[-1]] if more and out else None
+        return [self.bodies[p] for p in out], next_id, total
+
+
+def encode_cursor(iid: str) -> str:
+    return base64.urlsafe_b64encode(iid.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        return base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+    except ValueError:   # binascii.Error, UnicodeDecodeError, 비 ASCII 커서 모두 ValueError
+        raise QueryError("invalid cursor")
+
+
+_indexes: Dict[str, LessonIndex] = {}
+_lock = threading.Lock()
+
+
+def get_index(mode: str) -> LessonIndex:
+    mode = ALIASES.get(mode, mode)
+    version = store.version(mode)
+    index = _indexes.get(mode)
+    if index is not None and index.version == version:
+        return index
+    with _lock:
+        index = _indexes.get(mode)
+        if index is None or index.version != version:
+            char_types = {}
+            if mode == "chars":
+                char_types = {c: row.get("type") for c, row in registry.get("ko_braille_core")["by_char"].items()
+                              if row.get("type")}
+            index = _indexes[mode] = LessonIndex(mode, version, store.data(mode), char_types)
+    return index
+
+
+def is_page_request(request) -> bool:
+    return any(p in request.GET for p in PAGE_PARAMS)
+
+
+def query_page(request, mode: str) -> bytes:
+    """요청 파라미터 -> 페이지 응답 본문 (JSON 바이트). 잘못된 값이면 QueryError"""
+    try:
+        limit = int(request.GET.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        raise QueryError("limit must be an integer")
+    if not 1 <= limit <= MAX_LIMIT:
+        raise QueryError(f"limit must be between 1 and {MAX_LIMIT}")
+    cursor = request.GET.get("cursor")
+    after = decode_cursor(cursor) if cursor else None
+    filters = {name: request.GET[name].strip() for name in FILTERS if request.GET.get(name, "").strip()}
+
+    index = get_index(mode)
+    bodies, next_id, total = index.page(filters, after, limit)
+    head = {**index.meta, "limit": limit, "total": total,
+            "next": encode_cursor(next_id) if next_id else None}
+    head = json.dumps(head, ensure_ascii=False).encode("utf-8")
+    return head[:-1] + b', "items": [' + b", ".join(bodies) + b"]}"
+
+
+def respond_page(request, mode: str):
+    try:
+        body = query_page(request, mode)
+    except QueryError as e:
+        return JsonResponse({"error": "invalid_query", "detail": str(e)}, status=400)
+    return HttpResponse(body, content_type="application/json")
@@ -0,0 +1,294 @@
+"""
+학습 자료 검색 (역색인)
+
+GET /api/learn/search/?q=ㄱ이 들어간 단어&limit=20[&mode=words]  (뷰: apps.learn.views.learn_search)
+
+검색 대상: lesson_chars / words / sentences / keywords, ko_braille_core.json(글자·이름·예시),
+braille_catalog.json(규정 항목과 조항). 데이터 버전이 바뀔 때 한 번 색인을 만든다.
+- 색인 키: 글자(음절) 1-gram, 2-gram, 자모. 부분 문자열 질의는 질의의 2-gram posting 을
+  짧은 것부터 교집합해 후보를 좁힌 뒤 실제 포함 여부만 확인한다 (문서 전체를 훑지 않음)
+- 질의어 중 낱자 자모("ㄱ", "ㄱ이")는 자모 조건, "단어/문장/글자/예시" 같은 말은 범위 힌트로 쓴다
+- 점수: 필드 가중치 × (완전 일치 3 / 접두 2 / 부분 1), 자모 조건은 만족해야 하는 필터
+- 결과에는 미리 계산한 cells / unicode 를 싣는다 (약어 항목은 약자 변환)
+"""
+import json
+import logging
+import re
+import threading
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from services.braille import registry, table_version, text_to_bytes, to_cells, to_unicode
+from services.braille.engine import CHOSEONG, HANGUL_FIRST, HANGUL_LAST, JONGSEONG, JUNGSEONG
+from services.braille.lesson_pack import TEXT_KEYS, item_id
+
+from .query import QueryError
+from .store import store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+MAX_QUERY_CHARS = 100
+
+_JUNG_JONG = 21 * 28
+
+# 필드별 가중치 (본문 > 이름 > 예시/설명 > 조항)
+FIELD_WEIGHTS = {"text": 4.0, "name": 3.0, "type": 2.0, "examples": 2.0, "desc": 1.5, "hint": 1.0, "rule": 1.0}
+
+# 질의어 -> 검색 범위(mode) 힌트
+SCOPE_WORDS = {
+    "글자": ("chars", "core.chars", "catalog"), "자모": ("chars", "core.chars", "catalog"),
+    "자음": ("chars", "core.chars", "catalog"), "모음": ("chars", "core.chars", "catalog"),
+    "단어": ("words", "core.words", "keywords", "catalog"), "낱말": ("words", "core.words", "keywords", "catalog"),
+    "문장": ("sentences", "core.sentences"), "키워드": ("keywords",), "약어": ("catalog",),
+}
+# 예시를 찾는 질의어 (examples 필드 가중치를 올린다)
+EXAMPLE_WORDS = {"예시", "예", "보기", "예문"}
+# 뜻 없는 질의어 (조사·서술어)
+STOP_WORDS = {"들어간", "들어가는", "포함", "포함된", "있는", "찾기", "찾아줘", "보여줘", "알려줘", "점자", "의", "관련"}
+_PARTICLES = ("이", "가", "을", "를", "은", "는", "의", "로", "으로", "에", "와", "과")
+
+_COMPAT_JAMO = re.compile(r"^[ㄱ-ㆎ]$")
+
+
+def _jamo(text: str) -> Set[str]:
+    out = set()
+    for ch in text:
+        cp = ord(ch)
+        if HANGUL_FIRST <= cp <= HANGUL_LAST:
+            s = cp - HANGUL_FIRST
+            out.add(CHOSEONG[s // _JUNG_JONG])
+            out.add(JUNGSEONG[(s % _JUNG_JONG) // 28])
+            if s % 28:
+                out.add(JONGSEONG[s % 28])
+        elif 0x3131 <= cp <= 0x318E:
+            out.add(ch)
+    return out
+
+
+def _norm(text: str) -> str:
+    """색인/질의 공통 정규화: 소문자 + 공백 제거"""
+    return "".join(str(text).lower().split())
+
+
+def _grams(s: str) -> Set[str]:
+    out = set(s)
+    out.update(s[i:i + 2] for i in range(len(s) - 1))
+    return out
+
+
+class Doc(NamedTuple):
+    id: str
+    source: str
+    text: str
+    fields: Tuple[Tuple[str, str], ...]   # (필드 이름, 정규화 값)
+    item: dict
+    body: bytes                           # cells/unicode 포함 미리 직렬화된 결과 항목
+
+
+class SearchIndex:
+    def __init__(self, version: str, docs: List[Doc]):
+        self.version = version
+        self.docs = docs
+        self.grams: Dict[str, List[int]] = {}
+        self.jamo: Dict[str, List[int]] = {}
+        for n, doc in enumerate(docs):
+            keys = set()
+            for _, value in doc.fields:
+                keys |= _grams(value)
+            for k in keys:
+                self.grams.setdefault(k, []).append(n)
+            for j in _jamo(doc.text):
+                self.jamo.setdefault(j, []).append(n)
+
+    def _candidates(self, term: str) -> Optional[Set[int]]:
+        """term 을 부분 문자열로 가질 수 있는 문서 (2-gram posting 교집합)"""
+        keys = _grams(term) if len(term) == 1 else {term[i:i + 2] for i in range(len(term) - 1)}
+        lists = sorted((self.grams.get(k, ()) for k in keys), key=len)
+        if not lists or not lists[0]:
+            return set()
+        out = set(lists[0])
+        for other in lists[1:]:
+            out.intersection_update(other)
+            if not out:
+                break
+        return out
+
+    def search(self, terms: List[str], jamo: List[str], scopes: Optional[Set[str]], examples: bool):
+        """-> [(점수, 문서 번호)] 점수 내림차순"""
+        candidates: Optional[Set[int]] = None
+        for j in jamo:
+            posting = set(self.jamo.get(j, ()))
+            candidates = posting if candidates is None else candidates & posting
+        term_hits: Dict[int, float] = {}
+        for term in terms:
+            hits = self._candidates(term)
+            if candidates is not None:
+                hits &= candidates
+            for n in hits:
+                score = self._score(self.docs[n], term, examples)
+                if score:
+                    term_hits[n] = term_hits.get(n, 0.0) + score
+        if terms:
+            ranked = term_hits
+        elif candidates is not None:
+            ranked = {n: 1.0 for n in candidates}
+        else:
+            # 범위 힌트만 있는 질의("단어") - 범위 전체
+            ranked = {n: 1.0 for n in range(len(self.docs))}
+        out = [(score, n) for n, score in ranked.items()
+               if scopes is None or self.docs[n].source in scopes]
+        out.sort(key=lambda x: (-x[0], x[1]))
+        return out
+
+    @staticmethod
+    def _score(doc: Doc, term: str, examples: bool) -> float:
+        best = 0.0
+        for field, value in doc.fields:
+            if term not in value:
+                continue
+            kind = 3.0 if value == term else 2.0 if value.startswith(term) else 1.0
+            weight = FIELD_WEIGHTS.get(field, 1.0)
+            if examples and field == "examples":
+                weight *= 2
+            best = max(best, weight * kind)
+        return best
+
+
+def _doc(source: str, text: str, item: dict, fields: Dict[str, object], grade: str = "uncontracted") -> Doc:
+    packed = text_to_bytes(text, grade)
+    flat = []
+    for name, value in fields.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        flat.extend((name, _norm(v)) for v in values if isinstance(v, str) and v.strip())
+    iid = item.get("id") or item_id(source, text)
+    result = {"id": iid, "source": source, "text": text, "item": item,
+              "cells": to_cells(packed), "unicode": to_unicode(packed)}
+    return Doc(iid, source, text, tuple(flat), item, json.dumps(result, ensure_ascii=False).encode("utf-8"))
+
+
+def _lesson_docs() -> List[Doc]:
+    docs = []
+    for mode, key in TEXT_KEYS.items():
+        data = store.data(mode)
+        items = data if isinstance(data, list) else (data or {}).get("items", [])
+        for item in items:
+            if isinstance(item, dict) and item.get(key):
+                text = str(item[key])
+                docs.append(_doc(mode, text, item, {
+                    "text": text, "name": item.get("name"), "examples": item.get("examples"),
+                    "desc": item.get("desc"), "hint": item.get("hint"),
+                }))
+    return docs
+
+
+def _core_docs() -> List[Doc]:
+    core = registry.get("ko_braille_core")
+    docs = []
+    for section, key in (("chars", "char"), ("words", "word"), ("sentences", "text")):
+        for item in core.get(section) or []:
+            if isinstance(item, dict) and item.get(key):
+                text = str(item[key])
+                docs.append(_doc(f"core.{section}", text, item, {
+                    "text": text, "name": item.get("name"), "type": item.get("type"),
+                    "examples": item.get("examples"),
+                }))
+    return docs
+
+
+def _catalog_docs() -> List[Doc]:
+    catalog = registry.get("braille_catalog")
+    docs = []
+    for section, rows in catalog.items():
+        if not isinstance(rows, list):
+            continue
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            text = str(row.get("char") or row.get("word") or "")
+            if not text:
+                continue
+            grade = "contracted" if row.get("mark") == "약어" else "uncontracted"
+            docs.append(_doc("catalog", text, {**row, "section": section}, {
+                "text": text, "name": [row.get("name"), row.get("mark")], "rule": row.get("rule"),
+            }, grade))
+    return docs
+
+
+def index_version() -> str:
+    """검색 색인을 결정하는 데이터/테이블 버전 (ETag 용)"""
+    parts = [store.version(mode) for mode in TEXT_KEYS]
+    parts += [registry.version("ko_braille_core"), registry.version("braille_catalog"),
+              table_version("uncontracted"), table_version("contracted")]
+    return "|".join(parts)
+
+
+_index: Optional[SearchIndex] = None
+_lock = threading.Lock()
+
+
+def get_index() -> SearchIndex:
+    global _index
+    version = index_version()
+    index = _index
+    if index is not None and index.version == version:
+        return index
+    with _lock:
+        if _index is None or _index.version != version:
+            _index = SearchIndex(version, _lesson_docs() + _core_docs() + _catalog_docs())
+            logger.info("[learn] search index built (%d docs)", len(_index.docs))
+        return _index
+
+
+def parse_query(q: str):
+    """자연어 질의 -> (검색어 목록, 자모 조건, 범위, 예시 우선 여부)"""
+    terms, jamo, scopes, examples = [], [], set(), False
+    for word in q.split():
+        word = word.strip(".,?!\"'")
+        if not word:
+            continue
+        head = word[0]
+        if _COMPAT_JAMO.match(head) and (len(word) == 1 or word[1:] in _PARTICLES):
+            jamo.append(head)
+            continue
+        if word in SCOPE_WORDS:
+            scopes.update(SCOPE_WORDS[word])
+            continue
+        if word in EXAMPLE_WORDS:
+            examples = True
+            continue
+        if word in STOP_WORDS:
+            continue
+        terms.append(_norm(word))
+    return terms, jamo, (scopes or None), examples
+
+
+def search(q: str, limit: int = DEFAULT_LIMIT, mode: Optional[str] = None) -> bytes:
+    """질의 -> 응답 본문 (JSON 바이트). 잘못된 질의면 QueryError"""
+    q = q.strip()
+    if not q:
+        raise QueryError("q is required")
+    if len(q) > MAX_QUERY_CHARS:
+        raise QueryError(f"q is limited to {MAX_QUERY_CHARS} chars")
+    limit = max(1, min(limit, MAX_LIMIT))
+
+    terms, jamo, scopes, examples = parse_query(q)
+    if mode:
+        scopes = {mode}
+    index = get_index()
+    if not terms and not jamo:
+        # 힌트 말만 있으면("모음") 먼저 질의 그대로 검색하고, 없으면 그 범위 전체
+        terms = [_norm(q)]
+        ranked = index.search(terms, jamo, scopes, examples)
+        if not ranked and scopes:
+            terms = []
+            ranked = index.search(terms, jamo, scopes, examples)
+    else:
+        ranked = index.search(terms, jamo, scopes, examples)
+    head = json.dumps({"ok": True, "query": q, "terms": terms, "jamo": jamo,
+                       "total": len(ranked)}, ensure_ascii=False).encode("utf-8")
+    items = []
+    for score, n in ranked[:limit]:
+        body = index.docs[n].body
+        items.append(body[:-1] + b', "score": ' + f"{score:g}".encode("ascii") + b"}")
+    return head[:-1] + b', "items": [' + b", ".join(items) + b"]}"
@@ -0,0 +1,148 @@
+"""
+학습 세트 메모리 저장소
+
+모드별 응답 본문(UTF-8 JSON)과 gzip / brotli 압축본을 한 번만 만들어 메모리에 두고,
+요청의 Accept-Encoding 에 맞는 것을 파싱·직렬화 없이 그대로 돌려준다.
+- 본문 출처: 학습 팩(build_lesson_pack)이 최신이면 그 미리 직렬화된 본문, 아니면 lesson_*.json
+  (최신 = 원본 lesson 파일·ko_braille_core 해시와 점자 테이블 버전이 빌드 당시와 모두 같음)
+- 파일 변경 감지는 services.braille.registry 의 mtime 검사에 맡기고, 여기서는
+  (원본 버전, 팩 버전) 이 바뀌었을 때만 압축본을 다시 만든다
+- brotli 패키지가 없으면 gzip 까지만 쓴다
+"""
+import gzip
+import json
+import logging
+import threading
+from typing import Dict, NamedTuple, Optional
+
+from django.http import HttpResponse
+
+from services.braille import registry, table_version
+from services.braille.lesson_pack import CORE_FILE, LESSON_FILES
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 모드 별칭 (단수형 URL / 예전 뷰 이름)
+ALIASES = {"char": "chars", "word": "words", "sentence": "sentences", "keyword": "keywords"}
+
+# learn_keyword 응답은 {"ok": true, "items": [...]} 로 감싼다
+_ENVELOPES = {"keywords": (b'{"ok": true, "items": ', b"}")}
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 9
+
+
+class Body(NamedTuple):
+    version: str
+    identity: bytes
+    gzip: bytes
+    br: Optional[bytes]
+
+    def pick(self, encoding: str) -> bytes:
+        return {"br": self.br, "gzip": self.gzip}.get(encoding) or self.identity
+
+
+def _fresh_pack(mode: str):
+    """학습 팩이 있고 이 모드의 원본·점자 테이블과 같은 내용으로 빌드되었으면 팩, 아니면 None
+    (ko_braille.json 이 핫리로드되면 팩의 cells 는 옛 테이블 값이므로 원본 경로로 돌아간다)"""
+    pack = registry.get("lesson_pack")
+    if not pack or mode not in pack.bodies:
+        return None
+    sources = pack.meta.get("sources", {})
+    if sources.get(LESSON_FILES[mode]) != registry.version(f"lesson_{mode}"):
+        return None
+    if sources.get(CORE_FILE) != registry.version("ko_braille_core"):
+        return None
+    if pack.meta.get("tables", {}).get("uncontracted") != table_version("uncontracted"):
+        return None
+    return pack
+
+
+class LessonStore:
+    def __init__(self):
+        self._bodies: Dict[str, Body] = {}
+        self._lock = threading.Lock()
+
+    def _build(self, mode: str, version: str, body: bytes) -> Body:
+        prefix, suffix = _ENVELOPES.get(mode, (b"", b""))
+        body = prefix + body + suffix
+        return Body(
+            version=version,
+            identity=body,
+            gzip=gzip.compress(body, GZIP_LEVEL, mtime=0),
+            br=brotli.compress(body, quality=BROTLI_QUALITY) if brotli else None,
+        )
+
+    def get(self, mode: str) -> Body:
+        mode = ALIASES.get(mode, mode)
+        version = self.version(mode)
+        cached = self._bodies.get(mode)
+        if cached is not None and cached.version == version:
+            return cached
+        with self._lock:
+            cached = self._bodies.get(mode)
+            if cached is None or cached.version != version:
+                pack = _fresh_pack(mode)
+                if pack is not None:
+                    body = pack.bodies[mode]
+                else:
+                    body = json.dumps(self.data(mode), ensure_ascii=False).encode("utf-8")
+                cached = self._bodies[mode] = self._build(mode, version, body)
+                logger.info("[learn] %s body built (version %s, %d bytes)", mode, version, len(cached.identity))
+        return cached
+
+    def data(self, mode: str):
+        """파싱된 학습 세트 (팩이 최신이면 엔진 값으로 보강된 팩 쪽)"""
+        mode = ALIASES.get(mode, mode)
+        pack = _fresh_pack(mode)
+        if pack is not None:
+            return pack.modes[mode]
+        if registry.get("lesson_pack"):
+            logger.warning("lesson pack is stale for %s; run manage.py build_lesson_pack", mode)
+        return registry.get(f"lesson_{mode}")
+
+    def version(self, mode: str) -> str:
+        """본문을 만들지 않고 현재 버전만 (ETag 용) = 원본 버전 + 테이블 버전 [+ 팩 버전]"""
+        mode = ALIASES.get(mode, mode)
+        version = registry.version(f"lesson_{mode}") + "@" + table_version("uncontracted")
+        if _fresh_pack(mode) is not None:
+            version += "+" + registry.version("lesson_pack")
+        return version
+
+
+def negotiate_encoding(request) -> str:
+    """Accept-Encoding -> "br" | "gzip" | "identity" (q=0 은 거부로 본다)"""
+    accepted = {}
+    for part in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name.strip().lower()] = q
+    star = accepted.get("*", 0.0)
+    candidates = (["br"] if brotli else []) + ["gzip"]
+    best = max(candidates, key=lambda enc: accepted.get(enc, star))
+    return best if accepted.get(best, star) > 0 else "identity"
+
+
+def respond(request, mode: str) -> HttpResponse:
+    body = store.get(mode)
+    encoding = negotiate_encoding(request)
+    response = HttpResponse(body.pick(encoding), content_type="application/json")
+    if encoding != "identity":
+        response["Content-Encoding"] = encoding
+    response["Vary"] = "Accept-Encoding"
+    return response
+
+
+store = LessonStore()
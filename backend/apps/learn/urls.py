@@ -8,6 +8,7 @@ urlpatterns = [
     path("words/",     views.learn_word,     name="learn_words"),
     path("sentences/", views.learn_sentence, name="learn_sentences"),
     path("keywords/",  views.learn_keyword,  name="learn_keywords"),
+    path("search/",    views.learn_search,   name="learn_search"),
     
     # 과거 별칭 유지 (단수형)
     path("char/",      views.learn_char,     name="learn_char"),
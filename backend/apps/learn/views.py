@@ -1,66 +1,64 @@
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.conf import settings
-import json, os
-from pathlib import Path
+import logging
 
-def _load_json(filename):
-    try:
-        # Make sure this path is correct relative to your project root
-        DATA_PATH = Path(settings.BASE_DIR) / 'data'
-        file_path = DATA_PATH / filename
-        
-        print(f"Loading JSON file: {file_path}")
-        
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        print(f"Successfully loaded {len(data) if isinstance(data, list) else 'object'} items from {filename}")
-        return data
-    except FileNotFoundError:
-        print(f"File not found: {file_path}")
-        return []
-    except json.JSONDecodeError as e:
-        print(f"Invalid JSON format in {filename}: {e}")
-        return []
-    except Exception as e:
-        print(f"Error loading {filename}: {e}")
-        return []
+from jeomgeuli_backend.http_cache import content_etag, http_cache
 
-def learn_char(request):
-    try:
-        data = _load_json("lesson_chars.json")
-        # 데이터 파일이 이미 {mode, items} 구조이므로 그대로 반환
-        return JsonResponse(data)
-    except Exception as e:
-        print(f"Error in learn_char: {e}")
-        return JsonResponse({'error': 'Failed to load character data'}, status=500)
+from .query import QueryError, is_page_request, respond_page
+from .search import index_version, search
+from .store import negotiate_encoding, respond, store
 
-def learn_word(request):
-    try:
-        data = _load_json("lesson_words.json")
-        # 데이터 파일이 이미 {mode, items} 구조이므로 그대로 반환
-        return JsonResponse(data)
-    except Exception as e:
-        print(f"Error in learn_word: {e}")
-        return JsonResponse({'error': 'Failed to load word data'}, status=500)
+logger = logging.getLogger(__name__)
 
-def learn_sentence(request):
-    try:
-        data = _load_json("lesson_sentences.json")
-        # 데이터 파일이 이미 {mode, items} 구조이므로 그대로 반환
-        return JsonResponse(data)
-    except Exception as e:
-        print(f"Error in learn_sentence: {e}")
-        return JsonResponse({'error': 'Failed to load sentence data'}, status=500)
+LEARN_HTTP_MAX_AGE = getattr(settings, "LEARN_HTTP_MAX_AGE", 300)
+
+def _lesson_etag(mode):
+    """학습 세트 ETag = 본문 버전(원본 파일 해시 + 테이블 버전 + 학습 팩 버전) + 압축 방식(+ 페이지 조회 파라미터)"""
+    def etag(request, *args, **kwargs):
+        if is_page_request(request):
+            return content_etag("learn", mode, store.version(mode), request.GET.urlencode())
+        return content_etag("learn", mode, store.version(mode), negotiate_encoding(request))
+    return etag
 
-def learn_keyword(request):
+def _lesson_view(mode, error):
+    """메모리 저장소의 미리 직렬화·압축된 본문을 그대로 돌려주는 뷰
+    (limit/cursor/필터 파라미터가 있으면 페이지 조회 - apps.learn.query)"""
+    @http_cache(_lesson_etag(mode), LEARN_HTTP_MAX_AGE, vary=("Accept-Encoding",))
+    def view(request):
+        try:
+            if is_page_request(request):
+                return respond_page(request, mode)
+            return respond(request, mode)
+        except Exception:
+            logger.exception("learn %s failed", mode)
+            return JsonResponse({'error': error}, status=500)
+    return view
+
+# 데이터 파일이 이미 {mode, items} 구조이므로 그대로 반환 (keywords 는 {ok, items} 로 감쌈)
+learn_char = _lesson_view("chars", "Failed to load character data")
+learn_word = _lesson_view("words", "Failed to load word data")
+learn_sentence = _lesson_view("sentences", "Failed to load sentence data")
+learn_keyword = _lesson_view("keywords", "Failed to load keyword data")
+
+def _search_etag(request, *args, **kwargs):
+    return content_etag("learn-search", index_version(), request.GET.urlencode())
+
+@http_cache(_search_etag, LEARN_HTTP_MAX_AGE, vary=None)
+def learn_search(request):
+    """GET /api/learn/search/?q=&limit=&mode= - 학습 자료·규정 목록 역색인 검색 (apps.learn.search)"""
+    try:
+        limit = int(request.GET.get("limit", 20))
+    except ValueError:
+        return JsonResponse({"error": "invalid_query", "detail": "limit must be an integer"}, status=400)
     try:
-        data = _load_json("lesson_keywords.json")
-        return JsonResponse({"ok": True, "items": data})
-    except Exception as e:
-        print(f"Error in learn_keyword: {e}")
-        return JsonResponse({'error': 'Failed to load keyword data'}, status=500)
+        body = search(request.GET.get("q") or "", limit, request.GET.get("mode") or None)
+    except QueryError as e:
+        return JsonResponse({"error": "invalid_query", "detail": str(e)}, status=400)
+    except Exception:
+        logger.exception("learn_search failed")
+        return JsonResponse({'error': 'Failed to search lessons'}, status=500)
+    return HttpResponse(body, content_type="application/json")
 
 # 필요 시 간단한 헬스체크(프런트 진단용)
 def health(request):
-    return JsonResponse({"ok": True})
\ No newline at end of file
+    return JsonResponse({"ok": True})
@@ -8,5 +8,8 @@ load_dotenv(BASE_DIR / ".env", encoding='utf-8')
 
 from django.core.asgi import get_asgi_application
 
+# ASGI 서버(uvicorn jeomgeuli_backend.asgi:application)에서는 챗/뉴스 뷰를 async 판으로
+os.environ.setdefault("JEOMGEULI_ASGI", "1")
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "jeomgeuli_backend.settings")
 application = get_asgi_application()
@@ -0,0 +1,42 @@
+"""
+결정적 응답용 HTTP 캐시 헤더 (ETag / Cache-Control / 304)
+
+etag_func(request, *args, **kwargs) 가 입력 + 테이블 버전으로 만든 문자열을 돌려주면
+- If-None-Match 가 맞으면 뷰를 아예 실행하지 않고 304 (변환 생략)
+- 아니면 뷰 응답에 ETag 를 붙인다
+GET/HEAD 의 200/304 응답에는 Cache-Control(max-age) 와 Vary 를 붙인다.
+etag_func 가 None 을 돌려주면(POST 등) 아무것도 하지 않는다.
+"""
+import hashlib
+from functools import wraps
+
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+
+def content_etag(*parts) -> str:
+    """입력 조각들 -> 내용 해시 ETag 값 (따옴표 없이, Django 가 붙임)"""
+    h = hashlib.sha1()
+    for p in parts:
+        h.update(str(p).encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()[:20]
+
+
+def http_cache(etag_func, max_age: int, vary=("Accept",)):
+    def decorator(view):
+        conditional = condition(etag_func=etag_func)(view)
+
+        @wraps(view)
+        def inner(request, *args, **kwargs):
+            response = conditional(request, *args, **kwargs)
+            if (request.method in ("GET", "HEAD") and response.status_code in (200, 304)
+                    and response.has_header("ETag")):
+                patch_cache_control(response, public=True, max_age=max_age)
+                if vary:
+                    patch_vary_headers(response, vary)
+            return response
+
+        return inner
+
+    return decorator
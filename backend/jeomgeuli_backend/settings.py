@@ -75,6 +75,9 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "jeomgeuli_backend.wsgi.application"
+ASGI_APPLICATION = "jeomgeuli_backend.asgi.application"
+# 챗/뉴스 뷰를 async 판으로 (apps.chat.async_views). asgi.py 가 JEOMGEULI_ASGI=1 을 켠다
+CHAT_ASYNC_VIEWS = os.getenv("CHAT_ASYNC_VIEWS", os.getenv("JEOMGEULI_ASGI", "0")) == "1"
 
 DATABASES = {
     "default": {
@@ -144,6 +147,26 @@ REST_FRAMEWORK = {
     ],
 }
 
+# 점자 변환 결과 LRU 캐시 (services.braille)
+# BRAILLE_CACHE_ALIAS 를 CACHES 별칭으로 지정하면 워커 간 공유 2차 캐시로 사용
+BRAILLE_CACHE_MAX_ENTRIES = int(os.getenv("BRAILLE_CACHE_MAX_ENTRIES", "4096"))
+BRAILLE_CACHE_MAX_BYTES = int(os.getenv("BRAILLE_CACHE_MAX_BYTES", str(4 * 1024 * 1024)))
+BRAILLE_CACHE_ALIAS = os.getenv("BRAILLE_CACHE_ALIAS", "")
+
+# LLM 응답 캐시 (services.answer_cache) - 정규화된 질의 기준, 모드별 TTL 은 CHAT_CACHE_TTL_* 환경변수
+# CHAT_CACHE_ALIAS 를 CACHES 별칭(redis/memcached 등)으로 지정하면 워커 간 공유
+CHAT_CACHE_MAX_ENTRIES = int(os.getenv("CHAT_CACHE_MAX_ENTRIES", "2048"))
+CHAT_CACHE_MAX_BYTES = int(os.getenv("CHAT_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+CHAT_CACHE_ALIAS = os.getenv("CHAT_CACHE_ALIAS", "")
+# 유사 질의 캐시 (services.semantic_cache, 프로세스 로컬): 글자 n-gram Jaccard 가 임계값 이상이면 답 재사용
+CHAT_SEMANTIC_CACHE = os.getenv("CHAT_SEMANTIC_CACHE", "1") == "1"
+CHAT_SEMANTIC_THRESHOLD = float(os.getenv("CHAT_SEMANTIC_THRESHOLD", "0.8"))
+CHAT_SEMANTIC_MAX_ENTRIES = int(os.getenv("CHAT_SEMANTIC_MAX_ENTRIES", "4096"))
+
+# 결정적 응답(점자 변환 GET, 학습 세트)의 Cache-Control max-age (초). ETag 로 재검증
+BRAILLE_HTTP_MAX_AGE = int(os.getenv("BRAILLE_HTTP_MAX_AGE", "3600"))
+LEARN_HTTP_MAX_AGE = int(os.getenv("LEARN_HTTP_MAX_AGE", "300"))
+
 if "CACHES" not in globals():
     CACHES = {
         "default": {
@@ -5,6 +5,8 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.http import JsonResponse
 
+from apps.braille import views as braille_views
+
 def root_health(request):
     """루트 health 엔드포인트"""
     return JsonResponse({"ok": True, "message": "Server is running"})
@@ -19,6 +21,7 @@ urlpatterns = [
     path("api/app/", include("apps.app.urls")),
     path("api/api/", include("apps.api.urls")),
     path("api/braille/", include("apps.braille.urls")),
+    path("api/convert/", braille_views.braille_convert),  # 프론트엔드 호환: /api/convert/ (변환 루트만)
     path("api/chat/", include("apps.chat.urls")),
     path("api/learn/", include("apps.learn.urls")),
     path("api/learning/", include("apps.learning.urls")),
@@ -4,6 +4,9 @@ from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 import feedparser
 
+from apps.learn.store import respond as lesson_respond
+from services.braille import text_to_bytes, text_to_cells, to_bins, to_cells
+
 logger = logging.getLogger(__name__)
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -28,55 +31,19 @@ def health(_):
     return JsonResponse({"ok": True})
 
 # -------- 학습 데이터 --------
-def learn_chars(_):
-    return JsonResponse(_load_json("lesson_chars.json", {"items": []}))
-
-def learn_words(_):
-    return JsonResponse(_load_json("lesson_words.json", {"items": []}))
-
-def learn_sentences(_):
-    return JsonResponse(_load_json("lesson_sentences.json", {"items": []}))
-
-# -------- 간단 한국점자 매핑(서버용 fallback) --------
-JAMO = {
-    # 한글 자음
-    "ㄱ":[1,0,0,0,0,0], "ㄲ":[1,1,0,0,0,0], "ㄴ":[1,0,1,0,0,0], "ㄷ":[1,1,0,0,1,0],
-    "ㄹ":[1,0,0,1,0,0], "ㅁ":[1,0,1,1,0,0], "ㅂ":[1,1,0,1,0,0], "ㅅ":[0,1,0,1,0,0],
-    "ㅆ":[0,1,1,1,0,0], "ㅇ":[0,0,1,1,0,0], "ㅈ":[1,0,0,0,1,0], "ㅊ":[1,0,0,1,1,0],
-    "ㅋ":[1,0,1,0,1,0], "ㅌ":[1,1,0,0,1,0], "ㅍ":[1,1,1,0,1,0], "ㅎ":[0,1,0,0,1,0],
-    # 한글 모음
-    "ㅏ":[0,0,1,0,0,0], "ㅓ":[0,1,0,0,0,0], "ㅗ":[0,0,1,1,0,0], "ㅜ":[0,1,1,0,0,0],
-    "ㅡ":[0,1,0,1,0,0], "ㅣ":[0,0,0,1,0,0], "ㅑ":[0,0,1,0,1,0], "ㅕ":[0,1,0,0,1,0],
-    "ㅛ":[0,0,1,1,1,0], "ㅠ":[0,1,1,0,1,0], "ㅐ":[0,0,1,0,0,1], "ㅔ":[0,1,0,0,0,1],
-    # 영어 (간단한 매핑)
-    "a":[1,0,0,0,0,0], "b":[1,1,0,0,0,0], "c":[1,0,0,1,0,0], "d":[1,0,0,1,1,0],
-    "e":[1,0,0,0,1,0], "f":[1,1,0,1,0,0], "g":[1,1,0,1,1,0], "h":[1,1,0,0,1,0],
-    "i":[0,1,0,1,0,0], "j":[0,1,0,1,1,0], "k":[1,0,1,0,0,0], "l":[1,1,1,0,0,0],
-    "m":[1,0,1,1,0,0], "n":[1,0,1,1,1,0], "o":[1,0,1,0,1,0], "p":[1,1,1,1,0,0],
-    "q":[1,1,1,1,1,0], "r":[1,1,1,0,1,0], "s":[0,1,1,1,0,0], "t":[0,1,1,1,1,0],
-    "u":[1,0,1,0,0,1], "v":[1,1,1,0,0,1], "w":[0,1,0,1,1,1], "x":[1,0,1,1,0,1],
-    "y":[1,0,1,1,1,1], "z":[1,0,1,0,1,1],
-    # 특수문자
-    "·":[0,0,0,0,0,0], " ":[0,0,0,0,0,0], ".":[0,1,0,1,1,0], ",":[0,1,0,0,0,0],
-    "!":[0,1,1,0,1,0], "?":[0,1,1,0,0,1]
-}
-import unicodedata
+# (apps.learn.store: 메모리에 둔 직렬화·압축 본문을 그대로 반환)
+def learn_chars(request):
+    return lesson_respond(request, "chars")
+
+def learn_words(request):
+    return lesson_respond(request, "words")
+
+def learn_sentences(request):
+    return lesson_respond(request, "sentences")
+
+# -------- 점자 변환 (services.braille 공용 엔진) --------
 def _text_to_cells(txt):
-    cells=[]
-    for ch in txt.strip():
-        if ch in JAMO:
-            cells.append(JAMO[ch])
-            continue
-        # 한글 낱자 분해
-        try:
-            dec=unicodedata.normalize("NFD", ch)
-            for j in dec:
-                if j in JAMO: 
-                    cells.append(JAMO[j])
-        except Exception:
-            # 알 수 없는 문자는 공백으로 처리
-            cells.append([0,0,0,0,0,0])
-    return cells
+    return text_to_cells(txt.strip())
 
 @csrf_exempt
 @require_POST
@@ -105,13 +72,9 @@ def convert_braille(request):
         return JsonResponse({"ok": False, "error": "empty_text"}, status=400)
 
     try:
-        # --- 최소 동작 보장용 아주 단순 매핑 (실 서비스 로직으로 교체 가능) ---
-        # dot1(100000)로 모두 찍어 UI를 반드시 뜨게 한다. (프론트 폴백도 함께 넣을 것)
-        def cell_bin(dot1=True):
-            return "100000" if dot1 else "000000"
-
-        bins = [cell_bin(True) for _ in text]
-        cells = [[int(b) for b in s] for s in bins]
+        packed = text_to_bytes(text)
+        bins = to_bins(packed)
+        cells = to_cells(packed)
 
         return JsonResponse({"ok": True, "cells": cells, "bins": bins, "len": len(bins)})
     except Exception as e:
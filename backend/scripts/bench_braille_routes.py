@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+점자 변환 라우트 동등성 + 지연시간 벤치마크
+
+- 모든 변환 라우트/뷰가 같은 텍스트에 같은 셀을 돌려주는지 확인
+- 통합 엔진(after)과 통합 전 apps/api 방식(before: 요청마다 ko_braille.json 읽기)의
+  요청당 지연시간 비교
+
+사용법: python scripts/bench_braille_routes.py [--n 300]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.chdir(BACKEND_DIR)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "jeomgeuli_backend.settings")
+os.environ.setdefault("DJANGO_ALLOWED_HOSTS", "testserver,localhost,127.0.0.1")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import Client, RequestFactory  # noqa: E402
+
+from apps.api import views as api_views  # noqa: E402
+from apps.app import views as app_views  # noqa: E402
+from jeomgeuli_backend import views as root_views  # noqa: E402
+
+SAMPLES = [
+    "안녕하세요",
+    "학교에 갑니다.",
+    "오늘 날씨가 맑다!",
+    "블록체인, 인공지능?",
+    "닭과 값",
+    "가나다라마바사아자차카타파하",
+]
+
+ROUTES = [
+    "/api/braille/convert/",
+    "/api/braille/encode/",
+    "/api/braille/",
+    "/api/convert/",
+    "/api/api/braille/convert/",
+    "/api/api/convert/",
+]
+
+
+def legacy_api_convert(text):
+    """통합 전 apps/api/views.braille_convert 의 변환부 (요청마다 파일 읽기)"""
+    p = BACKEND_DIR / "data" / "ko_braille.json"
+    with open(p, "r", encoding="utf-8-sig") as f:
+        table = json.load(f)
+    cells = []
+    for ch in text:
+        pattern = table.get(ch)
+        if not isinstance(pattern, (list, tuple)) or len(pattern) != 6:
+            pattern = [0, 0, 0, 0, 0, 0]
+        cells.append([1 if int(x) else 0 for x in pattern])
+    return cells
+
+
+def _json(resp):
+    return json.loads(resp.content.decode("utf-8"))
+
+
+def collect(text):
+    """라우트/뷰별 셀 결과 수집"""
+    client = Client()
+    rf = RequestFactory()
+    body = json.dumps({"text": text})
+    out = {}
+    for url in ROUTES:
+        out[url] = _json(client.post(url, body, content_type="application/json"))["cells"]
+
+    req = lambda: rf.post("/", body, content_type="application/json")  # noqa: E731
+    out["apps.api.views.braille_convert"] = _json(api_views.braille_convert(req()))["cells"]
+    out["jeomgeuli_backend.views.braille_convert"] = _json(root_views.braille_convert(req()))["cells"]
+    out["jeomgeuli_backend.views.convert_braille"] = _json(root_views.convert_braille(req()))["cells"]
+    items = _json(app_views.braille_convert(req()))["items"]
+    out["apps.app.views.braille_convert"] = [c for it in items for c in it["cells"]]
+    return out
+
+
+def check_equivalence():
+    ok = True
+    results = {}
+    for text in SAMPLES:
+        results = collect(text)
+        ref = results[ROUTES[0]]
+        for name, cells in results.items():
+            if cells != ref:
+                ok = False
+                print(f"  ✗ {name!r} differs for {text!r}")
+    print(f"동등성: {'OK' if ok else 'MISMATCH'} ({len(SAMPLES)} texts × {len(results)} routes)")
+    return ok
+
+
+def timeit(fn, n):
+    samples = []
+    for i in range(n):
+        text = SAMPLES[i % len(SAMPLES)]
+        t0 = time.perf_counter()
+        fn(text)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    samples.sort()
+    return statistics.mean(samples), samples[len(samples) // 2], samples[int(len(samples) * 0.95)]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=300)
+    args = ap.parse_args()
+
+    ok = check_equivalence()
+
+    client = Client()
+    from services.braille import text_to_cells
+
+    def route(url):
+        return lambda t: client.post(url, json.dumps({"text": t}), content_type="application/json")
+
+    rows = [
+        ("before: legacy per-request file read (변환부)", legacy_api_convert),
+        ("after:  services.braille.text_to_cells (변환부)", text_to_cells),
+    ] + [(f"after:  POST {url}", route(url)) for url in ROUTES]
+
+    print(f"\n{'case':<52} {'mean µs':>10} {'p50 µs':>10} {'p95 µs':>10}")
+    for name, fn in rows:
+        fn(SAMPLES[0])  # warm-up
+        mean, p50, p95 = timeit(fn, args.n)
+        print(f"{name:<52} {mean:>10.1f} {p50:>10.1f} {p95:>10.1f}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+학습 세트 응답 벤치마크 (메모리 저장소 vs 요청마다 파일 읽기)
+
+- before: 예전 뷰 방식 - 요청마다 lesson_*.json 을 열어 json.load 후 JsonResponse 로 다시 직렬화
+- after : apps.learn.store - 미리 직렬화·압축된 본문을 Accept-Encoding 에 맞춰 그대로 반환
+- 압축본을 풀면 무압축 본문과 같은지, 라우트마다 같은 본문인지 확인
+
+사용법: python scripts/bench_lesson_store.py [--n 500]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.chdir(BACKEND_DIR)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "jeomgeuli_backend.settings")
+os.environ.setdefault("DJANGO_ALLOWED_HOSTS", "testserver,localhost,127.0.0.1")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.http import JsonResponse  # noqa: E402
+from django.test import Client, RequestFactory  # noqa: E402
+
+from apps.learn import store as lesson_store  # noqa: E402
+from apps.learn import views as learn_views  # noqa: E402
+
+MODES = [
+    ("chars", "/api/learn/chars/", learn_views.learn_char),
+    ("words", "/api/learn/words/", learn_views.learn_word),
+    ("sentences", "/api/learn/sentences/", learn_views.learn_sentence),
+    ("keywords", "/api/learn/keywords/", learn_views.learn_keyword),
+]
+
+ENCODINGS = ["identity", "gzip"] + (["br"] if lesson_store.brotli else [])
+
+
+def legacy_view(mode):
+    """예전 apps/learn/views 방식 (요청마다 파일 읽기 + 파싱 + 재직렬화)"""
+    def view(request):
+        with open(BACKEND_DIR / "data" / f"lesson_{mode}.json", "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if mode == "keywords":
+            data = {"ok": True, "items": data}
+        return JsonResponse(data)
+    return view
+
+
+def _decode(resp):
+    body = resp.content
+    enc = resp.get("Content-Encoding")
+    if enc == "gzip":
+        body = gzip.decompress(body)
+    elif enc == "br":
+        body = lesson_store.brotli.decompress(body)
+    return body
+
+
+def check_equivalence():
+    ok = True
+    client = Client()
+    for mode, url, _ in MODES:
+        bodies = {}
+        for enc in ENCODINGS:
+            resp = client.get(url, HTTP_ACCEPT_ENCODING=enc)
+            if resp.status_code != 200 or (enc != "identity" and resp.get("Content-Encoding") != enc):
+                ok = False
+                print(f"  ✗ {url} {enc}: status {resp.status_code}, encoding {resp.get('Content-Encoding')}")
+                continue
+            bodies[enc] = _decode(resp)
+        if len(set(bodies.values())) != 1:
+            ok = False
+            print(f"  ✗ {url}: encodings disagree")
+        legacy = json.loads(legacy_view(mode)(None).content)
+        data = json.loads(bodies["identity"])
+        if len(data.get("items", [])) != len(legacy.get("items", [])):
+            ok = False
+            print(f"  ✗ {url}: item count differs from source file")
+    print(f"동등성: {'OK' if ok else 'MISMATCH'} ({len(MODES)} modes × {len(ENCODINGS)} encodings)")
+    return ok
+
+
+def timeit(fn, n):
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1e6)
+    samples.sort()
+    return statistics.mean(samples), samples[len(samples) // 2], samples[int(len(samples) * 0.95)]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=500)
+    args = ap.parse_args()
+
+    ok = check_equivalence()
+    rf = RequestFactory()
+
+    print(f"\n{'case':<44} {'mean µs':>10} {'p50 µs':>10} {'p95 µs':>10} {'bytes':>8}")
+    for mode, url, view in MODES:
+        rows = [(f"before: {mode} file read + JsonResponse", legacy_view(mode), "identity")]
+        rows += [(f"after:  {mode} store ({enc})", view, enc) for enc in ENCODINGS]
+        for name, fn, enc in rows:
+            req = rf.get(url, HTTP_ACCEPT_ENCODING=enc)
+            size = len(fn(req).content)  # warm-up
+            mean, p50, p95 = timeit(lambda: fn(req), args.n)
+            print(f"{name:<44} {mean:>10.1f} {p50:>10.1f} {p95:>10.1f} {size:>8}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
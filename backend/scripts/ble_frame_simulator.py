@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+BLE 프레임 로컬 디바이스 시뮬레이터
+
+- services.braille.frames 로 인코딩한 프레임을 가상 디바이스(FrameDecoder)에 한 개씩 write
+- 왕복(round-trip) 검증: 디바이스가 재조립한 줄 == 서버가 만든 줄
+- 결정성 검증: 같은 입력을 두 번 인코딩하면 바이트 단위로 같음
+- 손상 검출: 프레임 누락/중복/순서 뒤바뀜을 디바이스가 FrameError 로 잡는지
+- 기존 방식(셀마다 점당 1바이트 6바이트 write) 대비 write 횟수/바이트 비교
+
+사용법: python scripts/ble_frame_simulator.py [--n 500] [--seed 1]
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from services.braille import text_to_bytes  # noqa: E402
+from services.braille.frames import FrameDecoder, FrameError, decode_frames, encode_frames, HEADER_SIZE  # noqa: E402
+from services.braille.layout import iter_lines  # noqa: E402
+
+SAMPLES = [
+    "안녕하세요",
+    "오늘 날씨가 맑고 학교에 갑니다.",
+    "블록체인, 인공지능? 초고속인터넷서비스제공업체!",
+    "",
+]
+WIDTHS = (3, 14, 17, 20, 40)
+MTUS = (4, 20, 23, 64, 185, 244, 512)
+
+
+def random_text(rng, n):
+    pool = [chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(64)] + list(" .,!?ㄱㅏabc")
+    return "".join(rng.choice(pool) for _ in range(n))
+
+
+def simulate(frames):
+    """가상 디바이스: write 하나씩 받아 줄 단위로 표시"""
+    device = FrameDecoder()
+    shown = []
+    for frame in frames:
+        line = device.feed(frame)
+        if line is not None:
+            shown.append(line)
+    if device.pending:
+        raise FrameError("device left with a partial line")
+    return shown
+
+
+def expect_error(frames):
+    try:
+        simulate(frames)
+    except FrameError:
+        return True
+    return False
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=500)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+    rng = random.Random(args.seed)
+
+    texts = SAMPLES + [random_text(rng, rng.randint(1, 300)) for _ in range(args.n)]
+    cases = failures = detected = corruptions = 0
+    for text in texts:
+        for width in WIDTHS:
+            lines = [ln.cells for ln, _ in iter_lines(text, width)]
+            for mtu in MTUS:
+                cases += 1
+                frames = encode_frames(lines, mtu)
+                ok = (
+                    frames == encode_frames(lines, mtu)
+                    and all(len(f) <= mtu for f in frames)
+                    and simulate(frames) == lines
+                    and decode_frames(frames) == lines
+                )
+                if not ok:
+                    failures += 1
+                    print(f"  ✗ round-trip failed: width={width} mtu={mtu} text={text[:20]!r}")
+                    continue
+                if len(frames) >= 2:
+                    i = rng.randrange(len(frames) - 1)
+                    broken = [
+                        frames[:i] + frames[i + 1:],                               # 누락
+                        frames[:i + 1] + frames[i:],                               # 중복
+                        frames[:i] + [frames[i + 1], frames[i]] + frames[i + 2:],  # 순서 뒤바뀜
+                    ]
+                    corruptions += len(broken)
+                    detected += sum(expect_error(b) for b in broken)
+
+    print(f"round-trip: {'OK' if not failures else 'FAIL'} ({cases - failures}/{cases} cases)")
+    print(f"corruption detected: {detected}/{corruptions}")
+
+    text = " ".join(SAMPLES[:3]) * 20
+    cells = len(text_to_bytes(text))
+    print(f"\n{'mode':<32} {'writes':>8} {'bytes':>8}")
+    print(f"{'legacy (cell per write, 6B)':<32} {cells:>8} {cells * 6:>8}")
+    for mtu in (20, 185, 244):
+        lines = [ln.cells for ln, _ in iter_lines(text, mtu - HEADER_SIZE)]
+        frames = encode_frames(lines, mtu)
+        print(f"{f'frames mtu={mtu}':<32} {len(frames):>8} {sum(map(len, frames)):>8}")
+
+    return 0 if not failures and detected == corruptions else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+점자 왕복(round-trip) 검증: 텍스트 -> text_to_bytes -> bytes_to_text == 원문
+
+- 한글 사이에 숫자·로마자(대문자 포함)·둥근 따옴표·기본 테이블에 없는 문장부호가 섞인 입력
+- 실패하면 원문/역변환 결과/점자를 출력하고 종료 코드 1
+
+정방향이 같은 셀을 내는 경우(3 나 / 3나, 곧은/둥근 따옴표, 와/왜 처럼 테이블 셀이 겹치는 모음)는
+원리상 되돌릴 수 없으므로 샘플에 넣지 않는다.
+
+사용법: python scripts/check_braille_roundtrip.py
+"""
+
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from services.braille import bytes_to_text, text_to_bytes, to_unicode  # noqa: E402
+
+SAMPLES = [
+    "안녕하세요",
+    "오늘 날씨가 맑다.",
+    "ABC 123",
+    "3개",
+    "31가",
+    "1.5",
+    "1,000원",
+    "2024년 3월 15일",
+    "10-20",
+    "Hello, World!",
+    "aBc",
+    "Abc한글",
+    "GPT-4o 모델",
+    "“인용”",
+    "“A”",
+    "“요얘”",
+    "‘작은’ 따옴표",
+    "[참고] 쪽: 12/30 … 마침",
+    "“AI” 기술 2025년 CES에서 100개 공개",
+]
+
+
+def main():
+    failures = 0
+    for text in SAMPLES:
+        back, ambiguous = bytes_to_text(text_to_bytes(text))
+        if back != text:
+            failures += 1
+            print(f"  ✗ {text!r} -> {back!r} (ambiguous={ambiguous}) {to_unicode(text_to_bytes(text))}")
+    print(f"round-trip: {'OK' if not failures else 'FAIL'} ({len(SAMPLES) - failures}/{len(SAMPLES)} cases)")
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+WSGI vs ASGI 동시 처리량 부하 테스트 (느린 업스트림 흉내)
+
+- 가짜 업스트림: OpenAI chat.completions 와 네이버 뉴스 검색을 --delay 초 뒤에 응답하는 로컬 서버
+  (OPENAI_BASE_URL / NAVER_NEWS_URL 로 연결하므로 실제 API 키·비용 없음)
+- WSGI: 스레드 --threads 개로 고정한 wsgiref 서버 (gunicorn --threads 와 같은 모델, 동기 뷰)
+- ASGI: uvicorn 워커 1개 (apps.chat.async_views)
+- 각 동시성 단계마다 서로 다른 질의로 /api/chat/explore/ 를 동시에 보내고 (캐시·합치기 안 걸리게)
+  처리 시간, 초당 처리 수, 지연 p50/p95, 실패 수를 비교한다
+
+사용법: python scripts/loadtest_asgi.py [--levels 8,32,128] [--delay 1.0] [--threads 8]
+필요: uvicorn, openai, httpx (requirements.txt)
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+# --- 가짜 업스트림 -------------------------------------------------------------
+
+def upstream_handler(delay):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, payload):
+            time.sleep(delay)
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):   # /v1/chat/completions
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            self._send({
+                "id": "chatcmpl-load", "object": "chat.completion", "created": int(time.time()),
+                "model": "gpt-4o-mini",
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": "• 부하 테스트 답변\n키워드: 가, 나, 다"}}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20},
+            })
+
+        def do_GET(self):    # /v1/search/news.json
+            self._send({"items": [{"title": "부하 테스트 뉴스", "link": "http://example.com"}]})
+
+    return Handler
+
+
+# --- 스레드 고정 WSGI 서버 (하위 프로세스) ---------------------------------------
+
+def serve_wsgi(port, threads):
+    from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+    class Quiet(WSGIRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    class PooledWSGIServer(WSGIServer):
+        request_queue_size = 1024
+
+        def process_request(self, request, client_address):
+            pool.submit(self._work, request, client_address)
+
+        def _work(self, request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    pool = ThreadPoolExecutor(threads)
+    sys.path.insert(0, str(BACKEND_DIR))
+    from jeomgeuli_backend.wsgi import application
+
+    make_server("127.0.0.1", port, application, server_class=PooledWSGIServer, handler_class=Quiet).serve_forever()
+
+
+# --- 부하 ----------------------------------------------------------------------
+
+def wait_ready(base, proc, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server process exited ({proc.returncode})")
+        try:
+            with urllib.request.urlopen(base + "/api/chat/health/", timeout=2) as r:
+                if r.status == 200:
+                    return
+        except Exception:
+            time.sleep(0.3)
+    raise RuntimeError(f"server at {base} did not start")
+
+
+def fire(base, n):
+    def one(i):
+        q = urllib.parse.quote(f"부하 {i} {uuid.uuid4().hex}")
+        t0 = time.perf_counter()
+        try:
+            with urllib.request.urlopen(f"{base}/api/chat/explore/?q={q}", timeout=120) as r:
+                ok = r.status == 200 and "answer" in json.loads(r.read())
+        except Exception:
+            ok = False
+        return ok, time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(n) as pool:
+        results = list(pool.map(one, range(n)))
+    wall = time.perf_counter() - t0
+    lat = sorted(t for _, t in results)
+    return {
+        "n": n, "wall": wall, "rps": n / wall,
+        "p50": statistics.median(lat), "p95": lat[min(len(lat) - 1, int(len(lat) * 0.95))],
+        "errors": sum(1 for ok, _ in results if not ok),
+    }
+
+
+def run(name, cmd, port, env, levels):
+    proc = subprocess.Popen(cmd, cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL)
+    base = f"http://127.0.0.1:{port}"
+    try:
+        wait_ready(base, proc)
+        fire(base, 2)   # 워밍업 (클라이언트 생성)
+        rows = [fire(base, n) for n in levels]
+    finally:
+        proc.terminate()
+        proc.wait(10)
+    for r in rows:
+        print(f"{name:5} conc={r['n']:4}  wall={r['wall']:6.2f}s  {r['rps']:6.1f} req/s  "
+              f"p50={r['p50']:5.2f}s  p95={r['p95']:5.2f}s  errors={r['errors']}")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--levels", default="8,32,128")
+    parser.add_argument("--delay", type=float, default=1.0, help="업스트림 응답 지연(초)")
+    parser.add_argument("--threads", type=int, default=8, help="WSGI 워커 스레드 수")
+    parser.add_argument("--serve-wsgi", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve_wsgi:
+        serve_wsgi(args.serve_wsgi, args.threads)
+        return
+
+    upstream = ThreadingHTTPServer(("127.0.0.1", 0), upstream_handler(args.delay))
+    upstream.daemon_threads = True
+    threading.Thread(target=upstream.serve_forever, daemon=True).start()
+    up = f"http://127.0.0.1:{upstream.server_address[1]}"
+
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "jeomgeuli_backend.settings",
+        "DJANGO_ALLOWED_HOSTS": "127.0.0.1,localhost",
+        "OPENAI_API_KEY": "loadtest", "OPENAI_BASE_URL": up + "/v1", "OPENAI_MAX_RETRIES": "0",
+        "NAVER_CLIENT_ID": "loadtest", "NAVER_CLIENT_SECRET": "loadtest",
+        "NAVER_NEWS_URL": up + "/v1/search/news.json",
+        "CHAT_SEMANTIC_CACHE": "0",
+    }
+    levels = [int(x) for x in args.levels.split(",")]
+    print(f"upstream delay {args.delay}s, explore = GPT + news (WSGI: sequential, ASGI: concurrent)")
+
+    run("WSGI", [sys.executable, str(Path(__file__).resolve()), "--serve-wsgi", "8101", "--threads", str(args.threads)],
+        8101, {**env, "CHAT_ASYNC_VIEWS": "0"}, levels)
+    run("ASGI", [sys.executable, "-m", "uvicorn", "jeomgeuli_backend.asgi:application",
+                 "--port", "8102", "--log-level", "warning", "--backlog", "2048"],
+        8102, {**env, "CHAT_ASYNC_VIEWS": "1"}, levels)
+    print(f"(WSGI threads={args.threads}; ASGI = 1 process, 1 event loop)")
+
+
+if __name__ == "__main__":
+    main()
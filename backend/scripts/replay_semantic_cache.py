@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+유사 질의 캐시 재생 (services.semantic_cache)
+
+질의 로그(한 줄에 질의 하나, 또는 "mode<TAB>질의")를 순서대로 흘려보내며
+임계값별로 정확 일치 / 유사 재사용 비율과 후보 수를 비교한다. LLM 호출 없음 -
+미스가 나면 질의 자체를 답으로 저장하고, 유사 적중 시 원래 질의와 짝을 출력해 눈으로 확인한다.
+
+사용법: python scripts/replay_semantic_cache.py [queries.txt] [--thresholds 0.6,0.7,0.8,0.9] [--show 10]
+        (파일이 없으면 내장 샘플)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from services.answer_cache import normalize_query  # noqa: E402
+from services.semantic_cache import SemanticCache, canonical  # noqa: E402
+
+SAMPLE = """블록체인이 뭐야
+블록체인 설명해줘
+블록체인에 대해 알려줘
+블록 체인이 뭐예요?
+인공지능이 뭐야
+인공지능 설명해줘
+인공 지능에 대해서 알려주세요
+오늘 뉴스 알려줘
+오늘의 뉴스
+오늘 뉴스
+메타버스란 뭐야
+메타버스 설명
+메타버스가 뭔가요
+점자가 뭐야
+점자 설명해줘
+한글 점자 규칙 알려줘
+한글 점자 규칙
+인플레이션이 뭐야
+인플레이션에 대해 설명해주세요
+금리 인상 뉴스
+금리 인하 뉴스
+주식 시장 전망
+주식시장 전망 알려줘
+"""
+
+
+def load(path):
+    lines = Path(path).read_text(encoding="utf-8").splitlines() if path else SAMPLE.splitlines()
+    out = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        mode, _, query = line.partition("\t") if "\t" in line else ("ask", "", line)
+        out.append((mode, query))
+    return out
+
+
+def replay(queries, threshold, show):
+    cache = SemanticCache(threshold=threshold)
+    exact, similar, pairs = set(), 0, []
+    t0 = time.perf_counter()
+    for mode, query in queries:
+        key = (mode, normalize_query(query))
+        if key in exact:
+            continue
+        found = cache.lookup(("replay", mode), query)
+        if found is not None:
+            similar += 1
+            pairs.append((query, found[0]["query"], found[1]))
+        else:
+            cache.add(("replay", mode), query, {"query": query}, 3600)
+        exact.add(key)
+    elapsed = (time.perf_counter() - t0) * 1e6 / max(1, len(queries))
+    n = len(queries)
+    n_exact = n - len(exact)
+    stats = cache.stats()
+    print(f"threshold={threshold:.2f}  queries={n}  exact={n_exact} ({n_exact / n:.1%})  "
+          f"similar={similar} ({similar / n:.1%})  llm_calls={n - n_exact - similar}  "
+          f"avg_candidates={stats['avg_candidates']}  {elapsed:.1f}µs/query")
+    for query, original, sim in pairs[:show]:
+        print(f"    {query!r:40} -> {original!r} (sim {sim:.2f})")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--thresholds", default="0.6,0.7,0.8,0.9")
+    parser.add_argument("--show", type=int, default=10)
+    args = parser.parse_args()
+
+    queries = load(args.path)
+    if not args.path:
+        print("canonical:", ", ".join(f"{q} -> {canonical(q)}" for _, q in queries[:4]))
+    for threshold in (float(t) for t in args.thresholds.split(",")):
+        replay(queries, threshold, args.show)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import Dict, List
 import os, json, re, logging
 
+from .clients import gemini_model
+
 logger = logging.getLogger(__name__)
 REQUIRED_KEYS = {"summary", "bullets", "keywords"}
 
@@ -80,16 +82,14 @@ def summarize(text: str) -> Dict[str, object]:
         logger.warning("[AI] GEMINI_API_KEY missing → fallback")
         return _fallback(raw)
 
-    # Lazy import to avoid ImportError at module import time
+    # Shared model from services.clients (lazy import inside; configured once per process)
     try:
-        import google.generativeai as genai  # type: ignore
-    except Exception as e:
-        logger.exception("[AI] google-generativeai import failed → fallback")
+        model = gemini_model("gemini-1.5-flash", key_env="GEMINI_API_KEY")
+    except Exception:
+        logger.exception("[AI] google-generativeai unavailable → fallback")
         return _fallback(raw)
 
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel("gemini-1.5-flash")
         prompt = f"{PROMPT}\n\n분석할 텍스트:\n{raw}"
 
         # Request with timeout; if SDK doesn't support, ignore silently.
@@ -0,0 +1,222 @@
+# services/answer_cache.py
+"""
+LLM 응답 캐시 (정규화된 질의 기준, Django 비의존)
+
+자주 오는 같은 질문("오늘 뉴스", "블록체인 설명해줘")마다 LLM 을 다시 부르지 않도록
+후처리까지 끝난 응답(answer / keywords / braille_words ...)을 JSON 으로 저장한다.
+
+- 키: 프롬프트 템플릿 해시 + 모델 + 모드 + 정규화된 topic + 정규화된 질의
+  정규화 = NFC + 소문자 + 문장부호 제거 + 공백 제거 ("오늘 날씨 알려줘?" == "오늘날씨알려줘")
+  기호(+, = ...)와 뜻이 있는 부호(# % & * @ /)는 남긴다 ("C++" != "C", "C#" != "C", "1+1" != "11")
+  템플릿 문자열을 키에 넣으므로 프롬프트를 고치면 이전 답은 자연히 쓰이지 않는다
+- TTL: 모드별 (뉴스는 짧게, 개념 설명은 길게). 질의에 시의성 있는 말(오늘/뉴스/날씨...)이
+  있으면 모드와 상관없이 뉴스 TTL
+- 로컬 LRU(항목 수·바이트 상한) -> (선택) 공유 캐시(get/set 을 가진 Django CACHES 백엔드 등)
+  -> (선택) 유사 질의 캐시(services.semantic_cache, 조사·어미만 다른 질의)
+- 캐시 미스 후 같은 키의 동시 호출은 services.single_flight 로 한 번만 (결과를 같이 받음)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import time
+import unicodedata
+from typing import Any, Dict, Optional
+
+from .braille.cache import LRUCache
+from .single_flight import flights
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# 모드별 TTL (초)
+DEFAULT_TTLS = {
+    "news": int(os.getenv("CHAT_CACHE_TTL_NEWS", "600")),
+    "ask": int(os.getenv("CHAT_CACHE_TTL_ASK", "3600")),
+    "qa": int(os.getenv("CHAT_CACHE_TTL_ASK", "3600")),
+    "detail": int(os.getenv("CHAT_CACHE_TTL_CONCEPT", "86400")),
+    "explain": int(os.getenv("CHAT_CACHE_TTL_CONCEPT", "86400")),
+}
+DEFAULT_TTL = int(os.getenv("CHAT_CACHE_TTL_ASK", "3600"))
+
+# 이 말이 들어간 질의는 답이 금방 낡는다
+TIMELY_WORDS = ("오늘", "지금", "현재", "최신", "최근", "뉴스", "날씨", "속보", "어제", "내일", "이번주")
+
+# 유니코드 문장부호(P*) 이지만 질의 뜻을 바꾸는 글자 (C#, 3%, R&D, 2*3, 1/2)
+KEEP_PUNCT = frozenset("#%&*@/")
+
+_EXPIRY = struct.Struct("!d")
+
+
+def normalize_query(text: str) -> str:
+    """NFC + 소문자 + 문장부호/공백 제거 (기호와 KEEP_PUNCT 는 유지)"""
+    text = unicodedata.normalize("NFC", text or "").casefold()
+    return "".join(ch for ch in text
+                   if not ch.isspace() and (ch in KEEP_PUNCT or unicodedata.category(ch)[0] != "P"))
+
+
+def template_version(template: str) -> str:
+    return hashlib.sha1(template.encode("utf-8")).hexdigest()[:10]
+
+
+def make_key(mode: str, query: str, topic: str = "", model: str = "", template: str = "") -> str:
+    parts = (template_version(template), model, mode, normalize_query(topic), normalize_query(query))
+    return "chat:" + hashlib.sha1("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+def ttl_for(mode: str, query: str, ttls: Optional[Dict[str, int]] = None) -> int:
+    ttls = ttls or DEFAULT_TTLS
+    if any(w in (query or "") for w in TIMELY_WORDS):
+        return ttls.get("news", DEFAULT_TTL)
+    return ttls.get(mode, DEFAULT_TTL)
+
+
+class AnswerCache:
+    """로컬 LRU(만료 시각 포함) -> (선택) 공유 캐시"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 shared: Any = None, ttls: Optional[Dict[str, int]] = None):
+        self.local = LRUCache(max_entries, max_bytes)
+        self.shared = shared
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.shared_hits = 0
+        self.expired = 0
+        self.stores = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        blob = self.local.get(key)
+        if blob is not None:
+            (expires,) = _EXPIRY.unpack_from(blob)
+            if expires >= time.time():
+                return json.loads(blob[_EXPIRY.size:])
+            self.expired += 1
+        if self.shared is not None:
+            try:
+                value = self.shared.get(key)
+            except Exception:
+                logger.warning("[chat] shared answer cache get failed", exc_info=True)
+                value = None
+            if isinstance(value, (bytes, bytearray)):
+                self.shared_hits += 1
+                # 공유 캐시가 만료를 관리하므로 로컬에는 짧게만 둔다
+                self.local.put(key, _EXPIRY.pack(time.time() + 60) + bytes(value))
+                return json.loads(value)
+        return None
+
+    def set(self, key: str, payload: Dict[str, Any], ttl: int) -> None:
+        if ttl <= 0:
+            return
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.local.put(key, _EXPIRY.pack(time.time() + ttl) + body)
+        self.stores += 1
+        if self.shared is not None:
+            try:
+                self.shared.set(key, body, ttl)
+            except Exception:
+                logger.warning("[chat] shared answer cache set failed", exc_info=True)
+
+    def ttl(self, mode: str, query: str) -> int:
+        return ttl_for(mode, query, self.ttls)
+
+    def clear(self) -> None:
+        self.local.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.local.stats()
+        stats.update({
+            "stores": self.stores,
+            "expired": self.expired,
+            "shared": self.shared is not None,
+            "shared_hits": self.shared_hits,
+            "ttls": self.ttls,
+        })
+        return stats
+
+
+_CACHE = AnswerCache()
+_SEMANTIC = None   # services.semantic_cache.SemanticCache (유사 질의 2차 조회, 선택)
+
+
+def configure(semantic=None, **kwargs) -> AnswerCache:
+    """응답 캐시 교체 (max_entries, max_bytes, shared, ttls) + 유사 질의 캐시(semantic)"""
+    global _CACHE, _SEMANTIC
+    _CACHE = AnswerCache(**kwargs)
+    _SEMANTIC = semantic
+    return _CACHE
+
+
+def get_cache() -> AnswerCache:
+    return _CACHE
+
+
+def get_semantic():
+    return _SEMANTIC
+
+
+def lookup(mode: str, query: str, *, topic: str = "", model: str = "", template: str = ""):
+    """-> (payload, "exact" | "similar") 또는 None"""
+    key = make_key(mode, query, topic, model, template)
+    payload = _CACHE.get(key)
+    if payload is not None:
+        return payload, "exact"
+    if _SEMANTIC is not None:
+        found = _SEMANTIC.lookup(_scope(mode, topic, model, template), query)
+        if found is not None:
+            return found[0], "similar"
+    return None
+
+
+def store(mode: str, query: str, payload: Dict[str, Any], *, topic: str = "", model: str = "",
+          template: str = "") -> None:
+    ttl = _CACHE.ttl(mode, f"{topic} {query}")
+    _CACHE.set(make_key(mode, query, topic, model, template), payload, ttl)
+    if _SEMANTIC is not None:
+        _SEMANTIC.add(_scope(mode, topic, model, template), query, payload, ttl)
+
+
+def _scope(mode: str, topic: str, model: str, template: str):
+    return (template_version(template), model, mode, normalize_query(topic))
+
+
+def cached_answer(mode: str, query: str, compute, *, topic: str = "", model: str = "", template: str = ""):
+    """-> (payload, "exact" | "similar" | "coalesced" | ""). compute() 는 후처리까지 끝난 dict 를 돌려주고,
+    실패는 예외로 알린다(캐시 안 함, 같이 기다리던 요청도 같은 예외)"""
+    found = lookup(mode, query, topic=topic, model=model, template=template)
+    if found is not None:
+        return found
+
+    def leader():
+        # 조회와 합류 사이에 다른 호출이 끝나 저장했을 수 있으므로 한 번 더 확인
+        found = lookup(mode, query, topic=topic, model=model, template=template)
+        if found is not None:
+            return found
+        payload = compute()
+        store(mode, query, payload, topic=topic, model=model, template=template)
+        return payload, ""
+
+    (payload, hit), shared = flights.do(make_key(mode, query, topic, model, template), leader)
+    return payload, "coalesced" if shared else hit
+
+
+async def acached_answer(mode: str, query: str, acompute, *, topic: str = "", model: str = "",
+                         template: str = ""):
+    """cached_answer 의 async 판 (acompute 는 코루틴 함수). 로컬 캐시 조회는 메모리 연산이라 그대로 호출"""
+    found = lookup(mode, query, topic=topic, model=model, template=template)
+    if found is not None:
+        return found
+
+    async def leader():
+        found = lookup(mode, query, topic=topic, model=model, template=template)
+        if found is not None:
+            return found
+        payload = await acompute()
+        store(mode, query, payload, topic=topic, model=model, template=template)
+        return payload, ""
+
+    (payload, hit), shared = await flights.ado(make_key(mode, query, topic, model, template), leader)
+    return payload, "coalesced" if shared else hit
@@ -0,0 +1,51 @@
+# 점자 변환 엔진 (Django 비의존)
+from .cells import CELLS, from_unicode, pack, pack_many, render, to_bins, to_cells, to_unicode, unpack
+from .engine import (
+    BLANK,
+    BrailleTable,
+    build_table,
+    cache_stats,
+    configure_cache,
+    get_table,
+    many_to_bytes,
+    table_version,
+    text_to_bytes,
+    text_to_cells,
+    text_to_unicode,
+)
+from .contractions import GRADES, ContractionEngine
+from .reverse import ReverseIndex, bytes_to_text
+from .tables import registry
+from .stream import iter_convert, iter_decode, iter_read, iter_segments
+
+__all__ = [
+    "BLANK",
+    "CELLS",
+    "GRADES",
+    "BrailleTable",
+    "ContractionEngine",
+    "ReverseIndex",
+    "build_table",
+    "bytes_to_text",
+    "cache_stats",
+    "configure_cache",
+    "from_unicode",
+    "get_table",
+    "iter_convert",
+    "iter_decode",
+    "iter_read",
+    "iter_segments",
+    "many_to_bytes",
+    "pack",
+    "pack_many",
+    "registry",
+    "render",
+    "table_version",
+    "text_to_bytes",
+    "text_to_cells",
+    "text_to_unicode",
+    "to_bins",
+    "to_cells",
+    "to_unicode",
+    "unpack",
+]
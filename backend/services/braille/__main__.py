@@ -0,0 +1,136 @@
+# services/braille/__main__.py
+"""
+점자 변환 CLI (Django/AI SDK 를 import 하지 않음 - 바로 뜬다)
+
+    python -m services.braille [FILE ...] [-f unicode|cells|packed] [--grade contracted] [-j N]
+
+- FILE 이 없거나 "-" 이면 stdin. 결과는 stdout 으로 스트리밍
+- unicode: 입력 줄마다 점자 한 줄 (UTF-8)
+- cells  : 입력 줄마다 6점 배열 목록 JSON 한 줄 (NDJSON)
+- packed : 셀당 1바이트 원시 바이트열 (줄바꿈도 빈 셀로 변환 - 엔진 전체 변환과 동일)
+- 큰 입력은 문단(빈 줄) 경계에서 --block 글자 안팎으로 묶어 프로세스 풀에서 변환하고
+  입력 순서대로 이어서 내보낸다 (-j 1 이면 풀 없이 현재 프로세스에서).
+  입력은 처리 속도에 맞춰 읽으므로 메모리는 입력 크기가 아니라 -j 에 비례한다
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import sys
+from collections import deque
+from itertools import chain
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List, Tuple
+
+from .cells import to_cells, to_unicode
+from .engine import get_table, text_to_bytes
+
+FORMATS = ("unicode", "cells", "packed")
+DEFAULT_BLOCK_CHARS = 64 * 1024
+IN_FLIGHT_PER_JOB = 2   # 워커당 동시에 들고 있는 블록 수 (메모리 상한 = 이 값 × jobs × 블록 크기)
+
+_Task = Tuple[str, str, str]
+
+
+def convert_block(task: _Task) -> bytes:
+    """(텍스트 블록, 포맷, grade) -> 출력 바이트 (워커 프로세스에서 실행)"""
+    text, fmt, grade = task
+    if fmt == "packed":
+        return text_to_bytes(text, grade)
+    out: List[str] = []
+    for line in text.splitlines():
+        packed = text_to_bytes(line, grade)
+        if fmt == "cells":
+            out.append(json.dumps(to_cells(packed), separators=(",", ":")))
+        else:
+            out.append(to_unicode(packed))
+    return ("\n".join(out) + "\n").encode("utf-8") if out else b""
+
+
+def iter_blocks(lines: Iterable[str], block_chars: int = DEFAULT_BLOCK_CHARS) -> Iterator[str]:
+    """줄 스트림 -> block_chars 이상 모이면 다음 문단 경계(빈 줄)에서 자른 블록.
+    문단 경계가 너무 멀면(4배) 줄 경계에서 자른다. 블록을 이어 붙이면 원문과 같다."""
+    buf: List[str] = []
+    size = 0
+    for line in lines:
+        buf.append(line)
+        size += len(line)
+        if size >= block_chars and (not line.strip() or size >= 4 * block_chars):
+            yield "".join(buf)
+            buf, size = [], 0
+    if buf:
+        yield "".join(buf)
+
+
+def _open_inputs(paths: List[str]) -> Iterator[str]:
+    """입력 파일(또는 stdin)들의 줄을 차례로 (줄바꿈 유지)"""
+    for path in paths or ["-"]:
+        if path == "-":
+            stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig", errors="replace", newline="")
+            yield from stream
+            continue
+        with open(path, "r", encoding="utf-8-sig", errors="replace", newline="") as f:
+            yield from f
+
+
+def _warm() -> None:
+    get_table()
+
+
+def run(paths: List[str], fmt: str, grade: str, jobs: int, block_chars: int, out) -> int:
+    blocks = iter_blocks(_open_inputs(paths), block_chars)
+    tasks = ((b, fmt, grade) for b in blocks)
+
+    first = next(tasks, None)
+    if first is None:
+        return 0
+    second = next(tasks, None)
+    if second is None or jobs <= 1:
+        # 블록이 하나뿐이면 풀 기동 비용이 더 크다
+        for task in chain([first], [second] if second else [], tasks):
+            out.write(convert_block(task))
+        return 0
+
+    with Pool(processes=jobs, initializer=_warm) as pool:
+        # 제출은 최대 IN_FLIGHT_PER_JOB × jobs 블록까지만 앞서 나간다 (imap 은 입력을 끝까지 미리 읽어
+        # 메모리가 입력 크기만큼 늘어남). 결과는 제출 순서대로 꺼내 쓰므로 출력 순서는 그대로
+        window = deque()
+        for task in chain([first, second], tasks):
+            window.append(pool.apply_async(convert_block, (task,)))
+            if len(window) >= IN_FLIGHT_PER_JOB * jobs:
+                out.write(window.popleft().get())
+        while window:
+            out.write(window.popleft().get())
+    return 0
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m services.braille", description="텍스트 -> 한국어 점자 변환")
+    ap.add_argument("files", nargs="*", help="입력 파일 (없거나 - 이면 stdin)")
+    ap.add_argument("-f", "--format", choices=FORMATS, default="unicode")
+    ap.add_argument("--grade", choices=("uncontracted", "contracted"), default="uncontracted")
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수")
+    ap.add_argument("--block", type=int, default=DEFAULT_BLOCK_CHARS, help="워커 한 건당 글자 수 (문단 경계 기준)")
+    args = ap.parse_args(argv)
+
+    out = sys.stdout.buffer
+    try:
+        return run(args.files, args.format, args.grade, max(1, args.jobs), max(1, args.block), out)
+    except BrokenPipeError:
+        # | head 등으로 출력이 먼저 닫힌 경우
+        sys.stderr.close()
+        return 0
+    except OSError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        try:
+            out.flush()
+        except BrokenPipeError:
+            pass
+
+
+if __name__ == "__main__":
+    sys.exit(main())
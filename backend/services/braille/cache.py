@@ -0,0 +1,153 @@
+# services/braille/cache.py
+"""
+단어/구 단위 변환 결과 캐시 (LRU)
+
+- 키: 테이블 버전 + NFC 정규화된 입력 문자열 (짧은 입력만 캐시 - 긴 문서는 엔진 직통이 더 빠름)
+- 값: 패킹된 셀 바이트열
+- 항목 수와 대략적인 바이트 수 둘 다로 상한을 두고, 넘치면 가장 오래 안 쓴 항목부터 제거
+- shared: get/set 을 가진 외부 캐시(예: Django CACHES 백엔드)를 2차 캐시로 붙일 수 있음
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+DEFAULT_MAX_KEY_CHARS = 64
+SHARED_TIMEOUT = 24 * 60 * 60
+
+
+class LRUCache:
+    """항목 수/바이트 상한이 있는 스레드 안전 LRU"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self._data: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _size(key: str, value: bytes) -> int:
+        return len(key.encode("utf-8")) + len(value)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: bytes) -> None:
+        size = self._size(key, value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= self._size(key, old)
+            self._data[key] = value
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                k, v = self._data.popitem(last=False)
+                self._bytes -= self._size(k, v)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+class ConversionCache:
+    """엔진 앞단 메모이제이션: 로컬 LRU -> (선택) 공유 캐시 -> 엔진"""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_key_chars: int = DEFAULT_MAX_KEY_CHARS,
+        shared: Any = None,
+    ):
+        self.local = LRUCache(max_entries, max_bytes)
+        self.max_key_chars = max_key_chars
+        self.shared = shared
+        self.shared_hits = 0
+        self.bypass = 0
+
+    @staticmethod
+    def shared_key(key: str) -> str:
+        # memcached 등 ASCII 키만 허용하는 백엔드 대비 해시
+        return "braille:" + hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def lookup(self, text: str, compute, namespace: str = "") -> bytes:
+        """text(정규화된 입력)에 대한 결과를 찾고, 없으면 compute() 로 만들어 저장
+        namespace: 테이블 버전 등 - 테이블이 바뀌면 이전 항목은 자연히 밀려난다"""
+        if len(text) > self.max_key_chars:
+            self.bypass += 1
+            return compute()
+        key = f"{namespace}\x00{text}" if namespace else text
+        value = self.local.get(key)
+        if value is not None:
+            return value
+        if self.shared is not None:
+            try:
+                value = self.shared.get(self.shared_key(key))
+            except Exception:
+                logger.warning("[braille] shared cache get failed", exc_info=True)
+                value = None
+            if isinstance(value, (bytes, bytearray)):
+                self.shared_hits += 1
+                value = bytes(value)
+                self.local.put(key, value)
+                return value
+        value = compute()
+        self.local.put(key, value)
+        if self.shared is not None:
+            try:
+                self.shared.set(self.shared_key(key), value, SHARED_TIMEOUT)
+            except Exception:
+                logger.warning("[braille] shared cache set failed", exc_info=True)
+        return value
+
+    def clear(self) -> None:
+        self.local.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.local.stats()
+        stats.update({
+            "max_key_chars": self.max_key_chars,
+            "bypass": self.bypass,
+            "shared": self.shared is not None,
+            "shared_hits": self.shared_hits,
+        })
+        return stats
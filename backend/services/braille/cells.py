@@ -0,0 +1,72 @@
+# services/braille/cells.py
+"""
+비트 패킹된 6점 셀 표현
+
+셀 하나 = 1바이트. 점 n(1..6)은 비트 n-1 에 대응하므로
+바이트 값이 곧 유니코드 점자(U+2800 + 값)의 오프셋이 된다.
+셀 시퀀스는 bytes 로 다루고, 셀마다 list 를 만들지 않는다.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Sequence, Tuple
+
+Cell = Tuple[int, int, int, int, int, int]
+
+BRAILLE_BASE = 0x2800
+BLANK_MASK = 0
+BLANK_UNICODE = chr(BRAILLE_BASE)
+
+# 0..63 마스크 -> 6-튜플 / 비트 문자열 / 유니코드 점자 (공유 객체, 재할당 없음)
+CELLS: Tuple[Cell, ...] = tuple(
+    tuple((m >> i) & 1 for i in range(6)) for m in range(64)  # type: ignore[misc]
+)
+BINS: Tuple[str, ...] = tuple("".join(str(b) for b in c) for c in CELLS)
+UNICODE: Tuple[str, ...] = tuple(chr(BRAILLE_BASE + m) for m in range(64))
+
+# bytes.decode("latin-1") 결과를 유니코드 점자로 바꾸는 str.translate 테이블
+_LATIN_TO_BRAILLE = {m: UNICODE[m] for m in range(64)}
+
+
+def pack(cell: Sequence[int]) -> int:
+    """[1,0,0,0,0,0] -> 0b000001"""
+    mask = 0
+    for i, dot in enumerate(cell[:6]):
+        if dot:
+            mask |= 1 << i
+    return mask
+
+
+def pack_many(cells: Iterable[Sequence[int]]) -> bytes:
+    return bytes(pack(c) for c in cells)
+
+
+def unpack(mask: int) -> Cell:
+    return CELLS[mask & 0x3F]
+
+
+def to_cells(packed: bytes) -> List[Cell]:
+    return [CELLS[m & 0x3F] for m in packed]
+
+
+def to_bins(packed: bytes) -> List[str]:
+    return [BINS[m & 0x3F] for m in packed]
+
+
+def to_unicode(packed: bytes) -> str:
+    return packed.decode("latin-1").translate(_LATIN_TO_BRAILLE)
+
+
+def from_unicode(braille: str) -> bytes:
+    """U+2800..U+283F 문자열 -> 패킹 바이트 (UTF-16LE 하위 바이트가 곧 마스크)"""
+    return braille.encode("utf-16-le")[::2]
+
+
+def render(packed: bytes, fmt: str):
+    """응답 포맷별 표현: cells(list) | bits(list[str]) | unicode(str) | packed(bytes)"""
+    if fmt == "packed":
+        return packed
+    if fmt == "bits":
+        return to_bins(packed)
+    if fmt == "unicode":
+        return to_unicode(packed)
+    return to_cells(packed)
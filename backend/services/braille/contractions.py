@@ -0,0 +1,209 @@
+# services/braille/contractions.py
+"""
+약자·약어(2급 점자) 변환
+
+규칙은 ko_braille_contractions.json (tables.registry 가 관리, 핫 리로드) 에 둔다.
+- syllables: 음절 약자 (가, 나, ... 것). with_final 이면 받침이 붙은 음절(각, 낙 ...)은 약자 + 받침
+- rimes: 모음+받침 약자 (억, 언, ... 인). 앞의 초성과 결합(먹 = ㅁ + 억), 초성 ㅇ 은 생략
+- words: 약어 (그래서, 그리고 ...). 단어 첫머리에서만 적용
+
+컴파일 시 위 규칙을 글자 단위 트라이 하나로 펼쳐 두고, 변환은 왼쪽에서 오른쪽으로
+한 번 훑으며 위치마다 가장 긴 일치를 고른다. 트라이 깊이는 가장 긴 규칙 길이로 묶이므로
+규칙 수와 상관없이 입력 길이에 선형이다. 일치가 없는 구간은 기본 테이블(str.translate)로 넘긴다.
+"""
+from __future__ import annotations
+
+import logging
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+from .engine import CHOSEONG, HANGUL_FIRST, HANGUL_LAST, JONGSEONG, BrailleTable, get_table
+from .tables import registry
+
+logger = logging.getLogger(__name__)
+
+RULES_FILE = "ko_braille_contractions.json"
+
+GRADES = ("uncontracted", "contracted")
+
+_JUNG_JONG = 21 * 28
+_IEUNG = CHOSEONG.index("ㅇ")
+
+_END = ""  # 트라이 노드의 규칙 슬롯 키 (글자 키와 겹치지 않음)
+
+
+def _mask(dots) -> int:
+    """[1, 2, 4] (점 번호) -> 0b001011"""
+    mask = 0
+    for d in dots:
+        d = int(d)
+        if 1 <= d <= 6:
+            mask |= 1 << (d - 1)
+    return mask
+
+
+def _cells(rule: dict) -> Optional[bytes]:
+    dots = rule.get("dots")
+    if not isinstance(dots, list) or not dots:
+        return None
+    try:
+        return bytes(_mask(cell) for cell in dots)
+    except (TypeError, ValueError):
+        return None
+
+
+def _decompose(ch: str) -> Optional[Tuple[int, int, int]]:
+    cp = ord(ch)
+    if not HANGUL_FIRST <= cp <= HANGUL_LAST:
+        return None
+    s = cp - HANGUL_FIRST
+    return s // _JUNG_JONG, (s % _JUNG_JONG) // 28, s % 28
+
+
+def _compose(cho: int, jung: int, jong: int) -> str:
+    return chr(HANGUL_FIRST + cho * _JUNG_JONG + jung * 28 + jong)
+
+
+class _Rule:
+    __slots__ = ("text", "cells", "word_start", "not_before_vowel")
+
+    def __init__(self, text: str, cells: bytes, word_start: bool = False, not_before_vowel: bool = False):
+        self.text = text
+        self.cells = cells
+        self.word_start = word_start
+        self.not_before_vowel = not_before_vowel
+
+
+class ContractionRules:
+    """규칙 파일 컴파일 결과 (기본 테이블과 무관한 부분)"""
+
+    version = ""
+
+    def __init__(self, raw: dict):
+        raw = raw if isinstance(raw, dict) else {}
+        self.meta = raw.get("meta") or {}
+        self.syllables = self._load(raw.get("syllables"))
+        self.rimes = self._load(raw.get("rimes"))
+        self.words = self._load(raw.get("words"))
+
+    @staticmethod
+    def _load(items) -> List[Tuple[dict, bytes]]:
+        out = []
+        for item in items or []:
+            if not isinstance(item, dict) or not item.get("text"):
+                continue
+            cells = _cells(item)
+            if cells is None:
+                logger.warning("[braille] contraction rule %r has no valid dots", item.get("text"))
+                continue
+            out.append((item, cells))
+        return out
+
+    def __len__(self) -> int:
+        return len(self.syllables) + len(self.rimes) + len(self.words)
+
+
+registry.register("ko_braille_contractions", RULES_FILE, ContractionRules)
+
+
+class ContractionEngine:
+    """규칙 + 기본 테이블로 만든 트라이. 불변 객체로 취급한다."""
+
+    def __init__(self, rules: ContractionRules, table: BrailleTable):
+        self.rules = rules
+        self.table = table
+        self.version = f"{table.version}+{rules.version}"
+        self.root: Dict[str, dict] = {}
+        self.depth = 1
+
+        for item, cells in rules.words:
+            self._add(_Rule(item["text"], cells, word_start=True))
+
+        for item, cells in rules.rimes:
+            parts = _decompose(item["text"]) if len(item["text"]) == 1 else None
+            if parts is None:
+                self._add(_Rule(item["text"], cells))
+                continue
+            _, jung, jong = parts
+            for cho in range(len(CHOSEONG)):
+                prefix = b"" if cho == _IEUNG else table.cho[cho]
+                self._add(_Rule(_compose(cho, jung, jong), prefix + cells))
+
+        # 음절 약자가 모음+받침 약자보다 우선 (두 규칙이 같은 음절을 만들면 덮어씀)
+        for item, cells in rules.syllables:
+            text = item["text"]
+            nbv = bool(item.get("not_before_vowel"))
+            self._add(_Rule(text, cells, not_before_vowel=nbv))
+            parts = _decompose(text) if len(text) == 1 else None
+            if parts and parts[2] == 0 and item.get("with_final"):
+                cho, jung, _ = parts
+                for jong in range(1, len(JONGSEONG)):
+                    self._add(_Rule(_compose(cho, jung, jong), cells + table.jong[jong]))
+
+    def _add(self, rule: _Rule) -> None:
+        node = self.root
+        for ch in rule.text:
+            node = node.setdefault(ch, {})
+        node[_END] = rule
+        self.depth = max(self.depth, len(rule.text))
+
+    @staticmethod
+    def _word_start(text: str, i: int) -> bool:
+        return i == 0 or _decompose(text[i - 1]) is None
+
+    @staticmethod
+    def _vowel_next(text: str, j: int) -> bool:
+        parts = _decompose(text[j]) if j < len(text) else None
+        return parts is not None and parts[0] == _IEUNG
+
+    def _match(self, text: str, i: int) -> Optional[_Rule]:
+        node, best, j = self.root, None, i
+        n = len(text)
+        while j < n:
+            node = node.get(text[j])
+            if node is None:
+                break
+            j += 1
+            rule = node.get(_END)
+            if rule is None:
+                continue
+            if rule.word_start and not self._word_start(text, i):
+                continue
+            if rule.not_before_vowel and self._vowel_next(text, j):
+                continue
+            best = rule
+        return best
+
+    def text_to_bytes(self, text: str) -> bytes:
+        text = unicodedata.normalize("NFC", text or "")
+        out: List[bytes] = []
+        plain = 0  # 일치 없는 구간 시작 - 기본 테이블로 한 번에 변환
+        i, n = 0, len(text)
+        root = self.root
+        while i < n:
+            rule = self._match(text, i) if text[i] in root else None
+            if rule is None:
+                i += 1
+                continue
+            if plain < i:
+                out.append(self.table.text_to_bytes(text[plain:i]))
+            out.append(rule.cells)
+            i += len(rule.text)
+            plain = i
+        if plain < n:
+            out.append(self.table.text_to_bytes(text[plain:]))
+        return b"".join(out)
+
+
+_ENGINE: Optional[ContractionEngine] = None
+
+
+def get_engine() -> ContractionEngine:
+    """현재 기본 테이블 + 규칙으로 만든 엔진 (둘 중 하나라도 바뀌면 다시 만든다)."""
+    global _ENGINE
+    rules = registry.get("ko_braille_contractions")
+    table = get_table()
+    engine = _ENGINE
+    if engine is None or engine.rules is not rules or engine.table is not table:
+        engine = _ENGINE = ContractionEngine(rules, table)
+    return engine
@@ -0,0 +1,226 @@
+# services/braille/delta.py
+"""
+증분(delta) 변환 세션
+
+자유 변환 화면처럼 글자를 칠 때마다 전체 텍스트를 다시 보내는 대신
+편집(offset, delete, insert)만 보내고 바뀐 셀 구간만 돌려받는다.
+
+- 세션 = 원문 + 변환된 셀을 "조각(chunk)" 목록으로 보관
+  조각은 공백 뒤에서만 나뉘므로(마지막 조각 제외) 조각별 변환 결과를 이어 붙이면
+  전체 변환과 같다 (약자 규칙도 단어 경계를 넘지 않음)
+- 편집 시 걸친 조각만 다시 변환하고, 이전/새 셀의 공통 앞뒤를 잘라 최소 구간만 반환
+  -> 키 입력당 비용은 문서 길이가 아니라 편집 주변 조각 크기에 비례
+- 문서 버전(정수)으로 편집 순서를 검증 (불일치 시 VersionConflict -> 클라이언트가 전체 재전송)
+- offset/delete 는 코드포인트 기준
+- 세션 저장소: 프로세스 메모리, TTL + 총 바이트 상한 (넘치면 오래 안 쓴 세션부터 제거)
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+from .engine import text_to_bytes
+
+logger = logging.getLogger(__name__)
+
+CHUNK_CHARS = 256
+MAX_DOC_CHARS = 200_000
+SESSION_TTL = float(os.getenv("BRAILLE_DELTA_TTL_SEC", "900"))
+MAX_TOTAL_BYTES = int(os.getenv("BRAILLE_DELTA_MAX_BYTES", str(32 * 1024 * 1024)))
+
+_SPACE_RUN = re.compile(r"\s+")
+
+
+class SessionNotFound(KeyError):
+    pass
+
+
+class VersionConflict(Exception):
+    def __init__(self, version: int):
+        super().__init__(f"version conflict (current {version})")
+        self.version = version
+
+
+def _split(text: str, size: int = CHUNK_CHARS) -> List[str]:
+    """공백 뒤에서만 잘라 size 글자 안팎의 조각으로 (공백이 없으면 통째로)"""
+    if len(text) <= size:
+        return [text] if text else []
+    out, start = [], 0
+    for m in _SPACE_RUN.finditer(text):
+        if m.end() - start >= size and m.end() < len(text):
+            out.append(text[start:m.end()])
+            start = m.end()
+    out.append(text[start:])
+    return out
+
+
+class DeltaSession:
+    def __init__(self, text: str, grade: str = "uncontracted"):
+        if len(text) > MAX_DOC_CHARS:
+            raise ValueError(f"문서는 최대 {MAX_DOC_CHARS}자까지 가능합니다.")
+        self.grade = grade
+        self.version = 0
+        self.lock = threading.Lock()
+        self.touched = time.monotonic()
+        self.texts: List[str] = _split(text)
+        self.cells: List[bytes] = [text_to_bytes(t, grade) for t in self.texts]
+        self.chars = len(text)
+
+    @property
+    def size(self) -> int:
+        """대략적인 메모리 사용량 (저장소 상한 계산용)"""
+        return sum(len(t) * 2 + len(c) for t, c in zip(self.texts, self.cells)) + 256
+
+    @property
+    def text(self) -> str:
+        return "".join(self.texts)
+
+    def packed(self) -> bytes:
+        return b"".join(self.cells)
+
+    @staticmethod
+    def _check(chars: int, offset: int, delete: int, insert: str) -> int:
+        """문서 길이 chars 에 편집 하나를 적용할 수 있는지 검사 -> 편집 후 길이"""
+        if offset < 0 or delete < 0 or offset + delete > chars:
+            raise ValueError("편집 범위가 문서를 벗어났습니다.")
+        if chars - delete + len(insert) > MAX_DOC_CHARS:
+            raise ValueError(f"문서는 최대 {MAX_DOC_CHARS}자까지 가능합니다.")
+        return chars - delete + len(insert)
+
+    def apply(self, offset: int, delete: int, insert: str) -> Tuple[int, int, bytes]:
+        """편집 하나 적용 -> (셀 시작 위치, 지운 셀 수, 새 셀)"""
+        self._check(self.chars, offset, delete, insert)
+
+        # 편집 시작이 들어 있는 조각 (끝 위치면 마지막 조각)
+        n = len(self.texts)
+        first, char_pos, cell_pos = 0, 0, 0
+        while first < n - 1 and char_pos + len(self.texts[first]) <= offset:
+            char_pos += len(self.texts[first])
+            cell_pos += len(self.cells[first])
+            first += 1
+
+        # 편집 끝까지 덮는 조각들
+        last, end_pos = first, char_pos + (len(self.texts[first]) if n else 0)
+        while last < n - 1 and end_pos < offset + delete:
+            last += 1
+            end_pos += len(self.texts[last])
+
+        old = "".join(self.texts[first:last + 1])
+        rel = offset - char_pos
+        new = old[:rel] + insert + old[rel + delete:]
+        # 조각 끝 공백이 지워졌으면 다음 단어와 붙으므로 다음 조각까지 함께 다시 변환
+        while last < n - 1 and (not new or not new[-1].isspace()):
+            last += 1
+            new += self.texts[last]
+
+        old_cells = b"".join(self.cells[first:last + 1])
+        texts = _split(new)
+        cells = [text_to_bytes(t, self.grade) for t in texts]
+        self.texts[first:last + 1] = texts
+        self.cells[first:last + 1] = cells
+        self.chars += len(insert) - delete
+
+        # 공통 앞/뒤를 잘라 실제로 바뀐 셀 구간만
+        new_cells = b"".join(cells)
+        head = 0
+        limit = min(len(old_cells), len(new_cells))
+        while head < limit and old_cells[head] == new_cells[head]:
+            head += 1
+        tail = 0
+        limit -= head
+        while tail < limit and old_cells[-1 - tail] == new_cells[-1 - tail]:
+            tail += 1
+        return (cell_pos + head, len(old_cells) - head - tail,
+                new_cells[head:len(new_cells) - tail])
+
+    def edit(self, version: int, edits: List[Tuple[int, int, str]]) -> List[Tuple[int, int, bytes]]:
+        """version 이 현재 버전과 같을 때만 편집들을 차례로 적용.
+        모든 편집의 범위를 먼저 검사하므로 하나라도 잘못되면(ValueError) 아무것도 적용하지 않는다."""
+        with self.lock:
+            if version != self.version:
+                raise VersionConflict(self.version)
+            chars = self.chars
+            for offset, delete, insert in edits:
+                chars = self._check(chars, offset, delete, insert)
+            spans = []
+            for offset, delete, insert in edits:
+                spans.append(self.apply(offset, delete, insert))
+                self.version += 1
+            self.touched = time.monotonic()
+            return spans
+
+
+class SessionStore:
+    """세션 저장소 (TTL + 총 바이트 상한, LRU 제거)"""
+
+    def __init__(self, ttl: float = SESSION_TTL, max_bytes: int = MAX_TOTAL_BYTES):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sessions: "OrderedDict[str, DeltaSession]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def _drop(self, sid: str) -> None:
+        self._sessions.pop(sid, None)
+        self._bytes -= self._sizes.pop(sid, 0)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        while self._sessions:
+            sid, s = next(iter(self._sessions.items()))
+            if now - s.touched < self.ttl and self._bytes <= self.max_bytes:
+                break
+            self._drop(sid)
+            self.evictions += 1
+
+    def create(self, text: str, grade: str = "uncontracted") -> Tuple[str, DeltaSession]:
+        session = DeltaSession(text, grade)
+        sid = secrets.token_urlsafe(12)
+        with self._lock:
+            self._sessions[sid] = session
+            self._sizes[sid] = session.size
+            self._bytes += session.size
+            self._evict()
+        return sid, session
+
+    def get(self, sid: str) -> DeltaSession:
+        with self._lock:
+            session = self._sessions.get(sid)
+            if session is None or time.monotonic() - session.touched >= self.ttl:
+                if session is not None:
+                    self._drop(sid)
+                raise SessionNotFound(sid)
+            self._sessions.move_to_end(sid)
+            return session
+
+    def update(self, sid: str, session: DeltaSession) -> None:
+        """편집 후 크기 갱신"""
+        with self._lock:
+            if sid in self._sessions:
+                size = session.size
+                self._bytes += size - self._sizes.get(sid, 0)
+                self._sizes[sid] = size
+                self._evict()
+
+    def close(self, sid: str) -> bool:
+        with self._lock:
+            found = sid in self._sessions
+            self._drop(sid)
+            return found
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"sessions": len(self._sessions), "bytes": self._bytes,
+                    "max_bytes": self.max_bytes, "ttl": self.ttl, "evictions": self.evictions}
+
+
+sessions = SessionStore()
+
@@ -0,0 +1,226 @@
+# services/braille/engine.py
+"""
+한국어 점자 변환 엔진 (Django 비의존)
+
+ko_braille.json 매핑(tables.registry 가 관리)으로부터 완성형 한글 11,172자(가~힣) 전체와
+자모·ASCII·문장부호 영역을 패킹된 셀 시퀀스로 미리 펼친 테이블을 프로세스당 한 번 만든다.
+변환은 글자당 테이블 조회 한 번으로 끝난다.
+"""
+from __future__ import annotations
+
+import logging
+import unicodedata
+from typing import Dict, Iterable, List, Tuple
+
+from .cache import ConversionCache
+from .cells import BLANK_MASK, BLANK_UNICODE, Cell, from_unicode, pack, to_cells, to_unicode
+from .tables import registry
+
+logger = logging.getLogger(__name__)
+
+MAP_FILE = "ko_braille.json"
+
+BLANK = bytes([BLANK_MASK])
+
+HANGUL_FIRST = 0xAC00  # 가
+HANGUL_LAST = 0xD7A3   # 힣
+
+CHOSEONG = ["ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+            "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+JUNGSEONG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅘ", "ㅙ",
+             "ㅚ", "ㅛ", "ㅜ", "ㅝ", "ㅞ", "ㅟ", "ㅠ", "ㅡ", "ㅢ", "ㅣ"]
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ",
+             "ㄽ", "ㄾ", "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ",
+             "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# 겹받침은 구성 자음을 차례로 찍는다
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+# 매핑이 없어도 빈 셀로 미리 채워 두는 영역
+ASCII_RANGE = range(0x20, 0x7F)
+COMPAT_JAMO_RANGE = range(0x3131, 0x3164)
+
+
+def _parse_mapping(raw: dict) -> Dict[str, bytes]:
+    """{"ㄱ": [1,0,0,0,0,0], "가": [..12..]} -> {"ㄱ": b"\\x01", "가": b"\\x01\\x04"}"""
+    parsed: Dict[str, bytes] = {}
+    for ch, dots in (raw or {}).items():
+        if not isinstance(ch, str) or not isinstance(dots, (list, tuple)):
+            continue
+        if not dots or len(dots) % 6:
+            continue
+        try:
+            bits = [1 if int(x) else 0 for x in dots]
+        except (TypeError, ValueError):
+            continue
+        parsed[ch] = bytes(pack(bits[i:i + 6]) for i in range(0, len(bits), 6))
+    return parsed
+
+
+def _jamo(mapping: Dict[str, bytes], jamo: str) -> bytes:
+    if not jamo:
+        return b""
+    if jamo in mapping:
+        return mapping[jamo]
+    parts = COMPOUND_JAMO.get(jamo)
+    if parts:
+        return b"".join(mapping.get(p, b"") for p in parts)
+    return b""
+
+
+def hangul_parts(mapping: Dict[str, bytes]) -> Tuple[List[bytes], List[bytes], List[bytes]]:
+    """초성(19)/중성(21)/종성(28, 0번은 받침 없음) 인덱스별 셀 바이트열"""
+    return (
+        [_jamo(mapping, j) for j in CHOSEONG],
+        [_jamo(mapping, j) for j in JUNGSEONG],
+        [_jamo(mapping, j) for j in JONGSEONG],
+    )
+
+
+def _build(mapping: Dict[str, bytes]) -> Dict[str, bytes]:
+    table: Dict[str, bytes] = {}
+
+    for cp in ASCII_RANGE:
+        table[chr(cp)] = BLANK
+    for cp in COMPAT_JAMO_RANGE:
+        table[chr(cp)] = _jamo(mapping, chr(cp)) or BLANK
+
+    cho, jung, jong = hangul_parts(mapping)
+    cp = HANGUL_FIRST
+    for c in cho:
+        for v in jung:
+            for f in jong:
+                table[chr(cp)] = c + v + f
+                cp += 1
+
+    # 파일에 직접 정의된 글자(문장부호, 약자 등)가 분해 결과보다 우선
+    table.update(mapping)
+    return table
+
+
+def build_table(raw: dict) -> Dict[str, bytes]:
+    """글자 -> 패킹된 셀 시퀀스 테이블을 만든다 (완성형 한글 전 영역 포함)."""
+    return _build(_parse_mapping(raw))
+
+
+class _BlankDefault(dict):
+    """str.translate 용 매핑: 테이블에 없는 글자는 빈 셀"""
+
+    def __missing__(self, key):
+        return BLANK_UNICODE
+
+
+class BrailleTable:
+    """미리 펼친 변환 테이블. 불변 객체로 취급한다.
+
+    packed: 글자 -> 셀 바이트열 (셀당 1바이트)
+    version: 원본 파일 내용 해시 (레지스트리가 채움) - 캐시 키/ETag 에 사용
+    변환은 str.translate 한 번(C 루프)으로 유니코드 점자를 만들고
+    필요한 표현(bytes / 6-튜플 / 비트 문자열)으로 바꾼다.
+    """
+
+    version = ""
+
+    def __init__(self, raw: dict):
+        mapping = _parse_mapping(raw)
+        self.packed = _build(mapping)
+        # 벡터화 경로(vectorized.py)용: 자모 성분과 파일에 직접 정의된 글자
+        self.cho, self.jung, self.jong = hangul_parts(mapping)
+        self.direct = frozenset(mapping)
+        self._trans = _BlankDefault(
+            (ord(ch), to_unicode(cells)) for ch, cells in self.packed.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    def text_to_unicode(self, text: str) -> str:
+        return unicodedata.normalize("NFC", text or "").translate(self._trans)
+
+    def text_to_bytes(self, text: str) -> bytes:
+        return from_unicode(self.text_to_unicode(text))
+
+    def text_to_cells(self, text: str) -> List[Cell]:
+        return to_cells(self.text_to_bytes(text))
+
+    def many_to_bytes(self, texts: Iterable[str]) -> List[bytes]:
+        """여러 텍스트를 한 번에 변환 (같은 입력은 한 번만 변환)"""
+        done: Dict[str, bytes] = {}
+        out: List[bytes] = []
+        for t in texts:
+            packed = done.get(t)
+            if packed is None:
+                packed = done[t] = self.text_to_bytes(t)
+            out.append(packed)
+        return out
+
+    def many_to_cells(self, texts: Iterable[str]) -> List[List[Cell]]:
+        return [to_cells(p) for p in self.many_to_bytes(texts)]
+
+
+registry.register("ko_braille", MAP_FILE, BrailleTable)
+
+
+def get_table() -> BrailleTable:
+    """프로세스 전역 테이블 (최초 호출 시 빌드, 파일이 바뀌면 백그라운드에서 교체)."""
+    return registry.get("ko_braille")
+
+
+_CACHE = ConversionCache()
+
+
+def configure_cache(**kwargs) -> ConversionCache:
+    """변환 캐시 교체 (max_entries, max_bytes, max_key_chars, shared)"""
+    global _CACHE
+    _CACHE = ConversionCache(**kwargs)
+    return _CACHE
+
+
+def cache_stats() -> dict:
+    return _CACHE.stats()
+
+
+def _converter(grade: str):
+    """grade 별 (변환기, 캐시 네임스페이스). 변환기 = 혼합 문자열 토크나이저(mixed.py) + 정자 테이블/약자 엔진"""
+    from .mixed import get_converter  # 순환 import 회피
+
+    conv = get_converter(grade)
+    return conv, ("c:" if grade == "contracted" else "") + conv.version
+
+
+def table_version(grade: str = "uncontracted") -> str:
+    """grade 별 변환 결과를 결정하는 테이블 버전 (캐시 키/ETag 용)"""
+    return _converter(grade)[1]
+
+
+def text_to_bytes(text: str, grade: str = "uncontracted") -> bytes:
+    """텍스트 -> 패킹된 셀 바이트열 (셀당 1바이트). 짧은 입력은 LRU 캐시를 거친다.
+    grade="contracted" 이면 약자·약어 규칙(contractions.py)을 적용한다."""
+    key = unicodedata.normalize("NFC", text or "")
+    conv, namespace = _converter(grade)
+    return _CACHE.lookup(key, lambda: conv.text_to_bytes(key), namespace)
+
+
+def text_to_cells(text: str, grade: str = "uncontracted") -> List[Cell]:
+    """텍스트 -> 6점 셀 목록."""
+    return to_cells(text_to_bytes(text, grade))
+
+
+def many_to_bytes(texts: Iterable[str], grade: str = "uncontracted") -> List[bytes]:
+    """텍스트 목록 -> 패킹된 셀 바이트열 목록 (배치 내 중복 제거)."""
+    done: Dict[str, bytes] = {}
+    out: List[bytes] = []
+    for t in texts:
+        packed = done.get(t)
+        if packed is None:
+            packed = done[t] = text_to_bytes(t, grade)
+        out.append(packed)
+    return out
+
+
+def text_to_unicode(text: str, grade: str = "uncontracted") -> str:
+    """텍스트 -> 유니코드 점자 문자열 (U+2800 블록)."""
+    return to_unicode(text_to_bytes(text, grade))
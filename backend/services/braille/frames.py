@@ -0,0 +1,105 @@
+# services/braille/frames.py
+"""
+BLE 전송용 프레임 인코더/디코더
+
+GATT write 한 번 = 프레임 하나 (MTU 기본 20바이트 = ATT 23 - 3).
+셀은 1바이트(점 n = 비트 n-1)로 실어 보내므로 점당 1바이트 방식보다 6배 작고,
+한 줄(디스플레이 폭)이 보통 write 한 번에 들어간다.
+
+프레임 구조 (결정적 - 같은 입력이면 항상 같은 바이트열)
+  byte 0  seq      : 프레임 일련번호 (0..255 순환) - 누락/중복 검출
+  byte 1  line     : 줄 번호 (0..255 순환)
+  byte 2  flags    : bit7 = 줄의 마지막 조각(END), bit0..6 = 줄 안 조각 번호 (0..127 순환)
+  byte 3~ payload  : 셀 바이트 (최대 mtu - 3)
+빈 줄은 payload 없이 END 프레임 하나로 보낸다.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Optional
+
+HEADER_SIZE = 3
+DEFAULT_MTU = 20
+MIN_MTU = HEADER_SIZE + 1
+MAX_MTU = 512  # ATT 속성 값 최대 길이
+
+FLAG_END = 0x80
+FRAGMENT_MASK = 0x7F
+
+
+class FrameError(ValueError):
+    """프레임 순서/형식 오류 (누락, 중복, 잘린 프레임 등)"""
+
+
+def _check_mtu(mtu: int) -> int:
+    mtu = int(mtu)
+    if not MIN_MTU <= mtu <= MAX_MTU:
+        raise ValueError(f"mtu 는 {MIN_MTU}~{MAX_MTU} 사이여야 합니다.")
+    return mtu
+
+
+def iter_frames(lines: Iterable[bytes], mtu: int = DEFAULT_MTU, seq: int = 0) -> Iterator[bytes]:
+    """줄별 패킹된 셀 -> 프레임 스트림"""
+    size = _check_mtu(mtu) - HEADER_SIZE
+    for line_no, cells in enumerate(lines):
+        chunks = [cells[i:i + size] for i in range(0, len(cells), size)] or [b""]
+        last = len(chunks) - 1
+        for frag, chunk in enumerate(chunks):
+            flags = (frag & FRAGMENT_MASK) | (FLAG_END if frag == last else 0)
+            yield bytes((seq & 0xFF, line_no & 0xFF, flags)) + chunk
+            seq += 1
+
+
+def encode_frames(lines: Iterable[bytes], mtu: int = DEFAULT_MTU, seq: int = 0) -> List[bytes]:
+    return list(iter_frames(lines, mtu, seq))
+
+
+class FrameDecoder:
+    """디바이스 쪽 재조립기. feed() 에 프레임을 순서대로 넣으면 완성된 줄을 돌려준다."""
+
+    def __init__(self, seq: int = 0):
+        self.expected_seq = seq & 0xFF
+        self.next_line = 0
+        self.line: Optional[int] = None
+        self.fragment = 0
+        self.buf = bytearray()
+
+    def feed(self, frame: bytes) -> Optional[bytes]:
+        if len(frame) < HEADER_SIZE:
+            raise FrameError(f"frame too short ({len(frame)} bytes)")
+        seq, line, flags = frame[0], frame[1], frame[2]
+        if seq != self.expected_seq:
+            raise FrameError(f"sequence gap: expected {self.expected_seq}, got {seq}")
+        if self.line is None:
+            if line != self.next_line:
+                raise FrameError(f"line gap: expected {self.next_line}, got {line}")
+            self.line, self.fragment = line, 0
+        if line != self.line or (flags & FRAGMENT_MASK) != (self.fragment & FRAGMENT_MASK):
+            raise FrameError(f"unexpected fragment {flags & FRAGMENT_MASK} of line {line}")
+        self.expected_seq = (seq + 1) & 0xFF
+        self.buf += frame[HEADER_SIZE:]
+        self.fragment += 1
+        if not flags & FLAG_END:
+            return None
+        out = bytes(self.buf)
+        self.buf.clear()
+        self.next_line = (self.line + 1) & 0xFF
+        self.line = None
+        return out
+
+    @property
+    def pending(self) -> bool:
+        """줄 중간에서 끊겼는지"""
+        return self.line is not None
+
+
+def decode_frames(frames: Iterable[bytes], seq: int = 0) -> List[bytes]:
+    """프레임 스트림 -> 줄별 패킹된 셀 (encode_frames 의 역)"""
+    decoder = FrameDecoder(seq)
+    lines = []
+    for frame in frames:
+        line = decoder.feed(frame)
+        if line is not None:
+            lines.append(line)
+    if decoder.pending:
+        raise FrameError("stream ended in the middle of a line")
+    return lines
@@ -0,0 +1,124 @@
+# services/braille/layout.py
+"""
+점자 디스플레이 폭 기준 줄/페이지 나누기
+
+- 한 줄 = width 셀. 단어(공백 구분) 경계에서 줄을 바꾸고 단어 사이는 빈 셀 1개
+- 한 줄보다 긴 단어는 글자 경계에서 자르고 줄 끝에 붙임표(3-6점)를 찍는다
+  (약자 적용 시 글자 경계를 알 수 없으면 셀 단위로 자름)
+- 커서 = 다음 줄이 시작할 (원문 글자 위치, 그 단어 안의 셀 오프셋).
+  커서만 있으면 그 지점부터 바로 이어서 만들 수 있으므로 K 번째 페이지를 얻으려고
+  앞 페이지들을 다시 만들 필요가 없다. 생성은 제너레이터로 필요한 만큼만 한다.
+"""
+from __future__ import annotations
+
+import re
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from .engine import text_to_bytes
+
+HYPHEN = bytes([0b100100])  # 붙임표 ⠤ (3-6점)
+SPACE = bytes([0])
+
+_WORD = re.compile(r"\S+")
+# 숫자/로마자/부호는 구간 단위로 표지가 붙으므로 글자별로 나눠 변환하면 결과가 달라진다
+_MIXED = re.compile(r"[^\uac00-\ud7a3\u3131-\u318e]")
+
+Cursor = Tuple[int, int]
+
+
+class Line(NamedTuple):
+    text: str      # 이 줄에 (일부라도) 들어간 원문 구간
+    cells: bytes   # 패킹된 셀, 길이 <= width
+
+
+class Page(NamedTuple):
+    cursor: Cursor               # 이 페이지 시작 위치
+    lines: List[Line]
+    next_cursor: Optional[Cursor]  # 없으면 문서 끝
+
+
+def format_cursor(cursor: Optional[Cursor]) -> Optional[str]:
+    return None if cursor is None else f"{cursor[0]}.{cursor[1]}"
+
+
+def parse_cursor(raw) -> Cursor:
+    """'120.3' -> (120, 3). 빈 값이면 문서 처음"""
+    if not raw:
+        return (0, 0)
+    char, _, cell = str(raw).partition(".")
+    cursor = (int(char), int(cell or 0))
+    if cursor[0] < 0 or cursor[1] < 0:
+        raise ValueError("cursor 는 0 이상이어야 합니다.")
+    return cursor
+
+
+def _word_cells(word: str, grade: str) -> Tuple[bytes, List[int]]:
+    """단어 -> (셀, 글자 경계 셀 오프셋 목록)"""
+    if grade == "contracted" or _MIXED.search(word):
+        cells = text_to_bytes(word, grade)
+        return cells, [0, len(cells)]
+    parts = [text_to_bytes(ch) for ch in word]
+    bounds = [0]
+    for p in parts:
+        bounds.append(bounds[-1] + len(p))
+    return b"".join(parts), bounds
+
+
+def _split_point(bounds: List[int], start: int, limit: int) -> int:
+    """start 부터 limit 셀 안에서 자를 수 있는 가장 먼 글자 경계 (없으면 셀 단위로)"""
+    for b in reversed(bounds):
+        if start < b <= start + limit:
+            return b
+    return start + limit
+
+
+def iter_lines(
+    text: str, width: int, cursor: Cursor = (0, 0), grade: str = "uncontracted",
+) -> Iterator[Tuple[Line, Optional[Cursor]]]:
+    """cursor 부터 (줄, 다음 줄 커서) 를 차례로 만든다. 마지막 줄의 다음 커서는 None"""
+    width = max(2, int(width))  # 붙임표 자리 포함 최소 2셀
+    text = text or ""
+    pos, skip = cursor
+
+    line = bytearray()
+    line_from = line_to = pos
+
+    for m in _WORD.finditer(text, pos):
+        word_start, word_end = m.span()
+        cells, bounds = _word_cells(m.group(), grade)
+        offset = skip if word_start == pos else 0
+        while offset < len(cells):
+            rest = len(cells) - offset
+            if not line:
+                line_from = word_start
+            gap = 1 if line else 0
+            if len(line) + gap + rest <= width:
+                line += SPACE * gap + cells[offset:]
+                line_to = word_end
+                break
+            if not line:
+                # 한 줄보다 긴 단어: 붙임표 자리를 남기고 글자 경계에서 자름
+                cut = _split_point(bounds, offset, width - 1)
+                line += cells[offset:cut] + HYPHEN
+                line_to = word_end
+                offset = cut
+            # 남은 내용이 있으므로 이 줄은 마지막 줄이 아니다
+            yield Line(text[line_from:line_to], bytes(line)), (word_start, offset)
+            line = bytearray()
+    if line:
+        yield Line(text[line_from:line_to], bytes(line)), None
+
+
+def iter_pages(
+    text: str, width: int, lines: int = 1, cursor: Cursor = (0, 0), grade: str = "uncontracted",
+) -> Iterator[Page]:
+    """cursor 부터 페이지(lines 줄 묶음)를 차례로 만든다 (지연 생성)"""
+    lines = max(1, int(lines))
+    start, buf = cursor, []
+    for line, nxt in iter_lines(text, width, cursor, grade):
+        buf.append(line)
+        if len(buf) == lines or nxt is None:
+            yield Page(start, buf, nxt)
+            if nxt is None:
+                return
+            start, buf = nxt, []
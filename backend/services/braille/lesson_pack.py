@@ -0,0 +1,230 @@
+# services/braille/lesson_pack.py
+"""
+학습 팩 빌드 (lesson_*.json + ko_braille_core.json -> lesson_pack.json)
+
+- 각 학습 항목의 점자를 엔진으로 다시 만들어 cells / unicode / packed(base64) 로 채운다
+- 손으로 적은 cells·dots·braille 값이 엔진 결과와 다르면 drift 로 보고 (팩에는 엔진 값이 들어감)
+- 음절 분해 TTS 문장("학은 ㅎ + ㅏ + ㄱ입니다.")과 항목 id 색인을 만든다
+- version = 원본 파일 해시 + 변환 테이블 버전의 해시 (같은 입력이면 같은 팩)
+Django 비의존 - 관리 명령(build_lesson_pack)과 스크립트에서 쓴다.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .cells import pack_many, to_cells, to_unicode
+from .engine import CHOSEONG, HANGUL_FIRST, HANGUL_LAST, JONGSEONG, JUNGSEONG, table_version, text_to_bytes
+from .tables import DATA_DIR, LESSON_FILES, registry
+
+PACK_FILE = "lesson_pack.json"
+CORE_FILE = "ko_braille_core.json"
+PACK_FORMAT = 1
+
+# 모드별 항목의 본문 필드
+TEXT_KEYS = {"chars": "char", "words": "word", "sentences": "sentence", "keywords": "content"}
+
+_JUNG_JONG = 21 * 28
+
+
+def decompose(syllable: str) -> List[str]:
+    """'학' -> ['ㅎ', 'ㅏ', 'ㄱ'] (한글 음절이 아니면 글자 그대로)"""
+    cp = ord(syllable)
+    if not HANGUL_FIRST <= cp <= HANGUL_LAST:
+        return [syllable]
+    s = cp - HANGUL_FIRST
+    parts = [CHOSEONG[s // _JUNG_JONG], JUNGSEONG[(s % _JUNG_JONG) // 28]]
+    if s % 28:
+        parts.append(JONGSEONG[s % 28])
+    return parts
+
+
+def _topic(syllable: str) -> str:
+    """받침 있으면 '은', 없으면 '는'"""
+    cp = ord(syllable)
+    has_final = HANGUL_FIRST <= cp <= HANGUL_LAST and (cp - HANGUL_FIRST) % 28
+    return "은" if has_final else "는"
+
+
+def decompose_tts(text: str) -> List[str]:
+    """'학교' -> ['학은 ㅎ + ㅏ + ㄱ입니다.', '교는 ㄱ + ㅛ입니다.'] (공백·부호는 건너뜀)"""
+    out = []
+    for ch in text:
+        if HANGUL_FIRST <= ord(ch) <= HANGUL_LAST:
+            out.append(f"{ch}{_topic(ch)} {' + '.join(decompose(ch))}입니다.")
+    return out
+
+
+def item_id(mode: str, text: str) -> str:
+    """학습 항목 id = 모드 + 본문 해시 (내용이 같으면 빌드가 달라도 같은 id)"""
+    return f"{mode}:{hashlib.sha1(text.encode('utf-8')).hexdigest()[:10]}"
+
+
+def _braille(text: str) -> Tuple[bytes, Dict[str, Any]]:
+    packed = text_to_bytes(text)
+    return packed, {
+        "cells": [list(c) for c in to_cells(packed)],
+        "unicode": to_unicode(packed),
+        "packed": base64.b64encode(packed).decode("ascii"),
+    }
+
+
+def _cells_from(value) -> Optional[bytes]:
+    """원본 cells(6점 배열 목록) -> 패킹 바이트 (형식이 틀리면 None)"""
+    if not isinstance(value, list) or not all(isinstance(c, list) and len(c) == 6 for c in value):
+        return None
+    return pack_many(value)
+
+
+def _dots_to_mask(dots) -> int:
+    mask = 0
+    for d in dots or []:
+        if isinstance(d, int) and 1 <= d <= 6:
+            mask |= 1 << (d - 1)
+    return mask
+
+
+class _Drift:
+    def __init__(self):
+        self.items: List[Dict[str, Any]] = []
+
+    def check(self, source: str, iid: str, text: str, field: str, found: Optional[bytes], expected: bytes):
+        if found is None or found == expected:
+            return
+        self.items.append({
+            "source": source, "id": iid, "text": text, "field": field,
+            "found": to_unicode(found), "expected": to_unicode(expected),
+        })
+
+
+def _build_mode(mode: str, raw, drift: _Drift, index: Dict[str, list]):
+    filename = LESSON_FILES[mode]
+    items = raw if isinstance(raw, list) else (raw or {}).get("items", [])
+    key = TEXT_KEYS[mode]
+    out = []
+    for item in items:
+        if not isinstance(item, dict) or not item.get(key):
+            continue
+        text = str(item[key])
+        iid = item_id(mode, text)
+        packed, braille = _braille(text)
+        drift.check(filename, iid, text, "cells", _cells_from(item.get("cells")), packed)
+        if "cell" in item:
+            drift.check(filename, iid, text, "cell", _cells_from([item["cell"]]), packed[:1])
+        entry = {**item, "id": iid, **braille}
+        if "cell" in item:
+            entry["cell"] = braille["cells"][0] if braille["cells"] else [0] * 6
+        if mode in ("words", "sentences"):
+            entry["ttsDecompose"] = decompose_tts(text)
+        index[iid] = [mode, len(out)]
+        out.append(entry)
+    if isinstance(raw, list):
+        return out
+    return {**(raw or {}), "items": out}
+
+
+def _build_core(raw, drift: _Drift, index: Dict[str, list]) -> Dict[str, Any]:
+    raw = raw if isinstance(raw, dict) else {}
+    core: Dict[str, Any] = {k: v for k, v in raw.items() if k not in ("chars", "words", "sentences")}
+    for section, key in (("chars", "char"), ("words", "word"), ("sentences", "text")):
+        out = []
+        for item in raw.get(section) or []:
+            if not isinstance(item, dict) or not item.get(key):
+                continue
+            text = str(item[key])
+            iid = item_id(f"core.{section}", text)
+            packed, braille = _braille(text)
+            if isinstance(item.get("braille"), str):
+                try:
+                    found = bytes(ord(ch) - 0x2800 for ch in item["braille"])
+                except ValueError:
+                    found = None
+                drift.check(CORE_FILE, iid, text, "braille", found, packed)
+            if section == "chars" and isinstance(item.get("dots"), list):
+                drift.check(CORE_FILE, iid, text, "dots", bytes([_dots_to_mask(item["dots"])]), packed)
+            entry = {**item, "id": iid, **braille}
+            if section != "chars":
+                entry["ttsDecompose"] = decompose_tts(text)
+            index[iid] = [f"core.{section}", len(out)]
+            out.append(entry)
+        core[section] = out
+    return core
+
+
+def check_extra(drift: _Drift, source: str, items: Iterable[Tuple[str, str]]) -> None:
+    """추가 원본(예: 하드코딩된 braille 문자열)의 (텍스트, 유니코드 점자) 쌍 검사"""
+    for text, braille in items:
+        try:
+            found = bytes(ord(ch) - 0x2800 for ch in braille)
+        except ValueError:
+            found = None
+        drift.check(source, item_id("extra", text), text, "braille", found, text_to_bytes(text))
+
+
+def build_pack(data_dir: Path = DATA_DIR, extra: Optional[Dict[str, Iterable[Tuple[str, str]]]] = None):
+    """-> (pack dict, drift 목록). extra: {출처 이름: [(텍스트, 점자 문자열), ...]} 추가 검사 대상"""
+    data_dir = Path(data_dir)
+    drift = _Drift()
+    index: Dict[str, list] = {}
+    sources: Dict[str, str] = {}
+
+    def load(filename):
+        blob = (data_dir / filename).read_bytes()
+        sources[filename] = hashlib.sha1(blob).hexdigest()[:12]
+        return json.loads(blob.decode("utf-8-sig"))
+
+    modes = {mode: _build_mode(mode, load(filename), drift, index) for mode, filename in LESSON_FILES.items()}
+    core = _build_core(load(CORE_FILE), drift, index)
+    for source, pairs in (extra or {}).items():
+        check_extra(drift, source, pairs)
+
+    tables = {"uncontracted": table_version("uncontracted")}
+    digest = hashlib.sha1(json.dumps([PACK_FORMAT, sources, tables], sort_keys=True).encode("utf-8"))
+    pack = {
+        "meta": {
+            "format": PACK_FORMAT,
+            "version": digest.hexdigest()[:12],
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "sources": sources,
+            "tables": tables,
+            "drift": len(drift.items),
+        },
+        "modes": modes,
+        "core": core,
+        "index": index,
+    }
+    return pack, drift.items
+
+
+def write_pack(pack: Dict[str, Any], path: Path) -> None:
+    """원자적 쓰기 (읽는 쪽이 반쯤 쓴 파일을 보지 않도록)"""
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(pack, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+
+
+class LessonPack:
+    """런타임용: 모드별 응답 본문을 미리 직렬화해 둔다 (요청 시 파싱/덤프 없음)"""
+
+    version = ""
+
+    def __init__(self, raw: dict):
+        raw = raw if isinstance(raw, dict) else {}
+        self.meta = raw.get("meta") or {}
+        self.modes = raw.get("modes") or {}
+        self.index = raw.get("index") or {}
+        self.bodies: Dict[str, bytes] = {
+            mode: json.dumps(data, ensure_ascii=False).encode("utf-8")
+            for mode, data in self.modes.items()
+        }
+
+    def __bool__(self) -> bool:
+        return bool(self.modes)
+
+
+registry.register("lesson_pack", PACK_FILE, LessonPack)
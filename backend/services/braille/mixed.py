@@ -0,0 +1,210 @@
+# services/braille/mixed.py
+"""
+혼합 문자열 토크나이저 (엔진 앞단)
+
+뉴스 제목처럼 한글 사이에 숫자·로마자·문장부호가 섞인 입력을 컴파일된 정규식 한 번으로
+숫자 / 로마자 / (기본 테이블에 없는) 문장부호 구간으로 나누고, 나머지 구간은 기본 변환기
+(정자 테이블 또는 약자 엔진)에 통째로 넘긴다.
+
+- 숫자 구간: 수표(3-4-5-6) 한 번 + 숫자 (구간 안의 . , 는 숫자용 부호)
+  숫자 바로 뒤에 ㄴㄷㅁㅋㅌㅍㅎ 으로 시작하는 음절이 오면 한 칸 띄움
+- 로마자 구간(단어 단위): 로마자표 한 번 + 글자. 단어 전체가 대문자면 대문자 단어표,
+  아니면 대문자 앞에만 대문자표. 뒤에 한글이 바로 붙으면 로마자 종료표
+- 문장부호: ko_braille_symbols.json 에 있고 ko_braille.json 에 없는 글자만.
+  곧은 따옴표(" ')는 앞 글자를 보고 여는/닫는 것을 고른다
+구간 안 변환은 str.translate 로 하므로 글자마다 정규식을 부르지 않고 입력 길이에 선형이다.
+로마자 구간을 공백 너머로 잇지 않는 것은 공백 경계에서 잘라 변환해도(스트림/증분 세션/줄 나누기)
+전체 변환과 같은 결과가 나오게 하기 위해서다.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from typing import Dict, List, Optional, Tuple, Union
+
+from .cells import from_unicode, to_unicode
+from .engine import CHOSEONG, HANGUL_FIRST, HANGUL_LAST, BrailleTable, get_table
+from .tables import registry
+
+logger = logging.getLogger(__name__)
+
+SYMBOLS_FILE = "ko_braille_symbols.json"
+
+BLANK = bytes([0])
+_JUNG_JONG = 21 * 28
+_OPENERS = "([{“‘"
+_QUOTES = ('"', "'")
+
+
+def _cells(dots) -> Optional[bytes]:
+    if not isinstance(dots, list) or not dots:
+        return None
+    try:
+        out = bytearray()
+        for cell in dots:
+            mask = 0
+            for d in cell:
+                d = int(d)
+                if 1 <= d <= 6:
+                    mask |= 1 << (d - 1)
+            out.append(mask)
+        return bytes(out)
+    except (TypeError, ValueError):
+        return None
+
+
+def _cell_map(raw) -> Dict[str, bytes]:
+    out = {}
+    for key, dots in (raw or {}).items():
+        cells = _cells(dots)
+        if cells is not None:
+            out[str(key)] = cells
+    return out
+
+
+def _is_hangul(ch: str) -> bool:
+    cp = ord(ch)
+    return HANGUL_FIRST <= cp <= HANGUL_LAST or 0x3131 <= cp <= 0x318E
+
+
+class SymbolRules:
+    """ko_braille_symbols.json 컴파일 결과 (기본 테이블과 무관한 부분)"""
+
+    version = ""
+
+    def __init__(self, raw: dict):
+        raw = raw if isinstance(raw, dict) else {}
+        ind = _cell_map(raw.get("indicators"))
+        self.number = ind.get("number", b"")
+        self.roman = ind.get("roman", b"")
+        self.roman_end = ind.get("roman_end", b"")
+        self.capital = ind.get("capital", b"")
+        self.capital_word = ind.get("capital_word", self.capital * 2)
+        self.digits = _cell_map(raw.get("digits"))
+        self.number_punct = _cell_map(raw.get("number_punct"))
+        self.latin = {k.lower(): v for k, v in _cell_map(raw.get("latin")).items() if len(k) == 1}
+        self.punct = _cell_map(raw.get("punctuation"))
+        self.space_before = frozenset(
+            CHOSEONG.index(j) for j in raw.get("number_space_before") or [] if j in CHOSEONG
+        )
+
+
+registry.register("ko_braille_symbols", SYMBOLS_FILE, SymbolRules)
+
+
+def _trans(mapping: Dict[str, bytes]) -> Dict[int, str]:
+    return {ord(ch): to_unicode(cells) for ch, cells in mapping.items()}
+
+
+class MixedScriptConverter:
+    """토크나이저 + 기본 변환기. 불변 객체로 취급한다."""
+
+    def __init__(self, rules: SymbolRules, base, table: BrailleTable):
+        self.rules = rules
+        self.base = base
+        self.version = f"{base.version}+{rules.version}"
+
+        self._number = _trans({**rules.digits, **rules.number_punct})
+        lower = _trans(rules.latin)
+        cap = to_unicode(rules.capital)
+        self._latin = dict(lower)
+        self._latin.update({ord(ch.upper()): cap + cells for ch, cells in ((chr(k), v) for k, v in lower.items())})
+        self._lower = lower
+
+        # 기본 테이블에 이미 있는 글자는 기본 테이블 쪽을 쓴다
+        self.punct = {ch: cells for ch, cells in rules.punct.items()
+                      if len(ch) == 1 and ch not in table.direct}
+        self.quotes = {q: (rules.punct.get(q + "open"), rules.punct.get(q + "close"))
+                       for q in _QUOTES if q not in table.direct and q + "open" in rules.punct}
+
+        groups = []
+        if rules.digits:
+            digits = "".join(re.escape(d) for d in rules.digits)
+            seps = "".join(re.escape(p) for p in rules.number_punct)
+            num = f"[{digits}]+" + (f"(?:[{seps}][{digits}]+)*" if seps else "")
+            groups.append(f"(?P<num>{num})")
+        if rules.latin:
+            groups.append("(?P<latin>[A-Za-z]+)")
+        punct = "".join(re.escape(ch) for ch in list(self.punct) + list(self.quotes))
+        if punct:
+            groups.append(f"(?P<punct>[{punct}]+)")
+        self.pattern = re.compile("|".join(groups)) if groups else None
+
+    def _convert_number(self, run: str, text: str, end: int) -> bytes:
+        out = self.rules.number + from_unicode(run.translate(self._number))
+        nxt = text[end] if end < len(text) else ""
+        if nxt and HANGUL_FIRST <= ord(nxt) <= HANGUL_LAST:
+            if (ord(nxt) - HANGUL_FIRST) // _JUNG_JONG in self.rules.space_before:
+                out += BLANK
+        return out
+
+    def _convert_latin(self, word: str, text: str, end: int) -> bytes:
+        if len(word) > 1 and word.isupper():
+            body = self.rules.capital_word + from_unicode(word.lower().translate(self._lower))
+        else:
+            body = from_unicode(word.translate(self._latin))
+        out = self.rules.roman + body
+        if end < len(text) and _is_hangul(text[end]):
+            out += self.rules.roman_end
+        return out
+
+    def _convert_punct(self, run: str, text: str, start: int) -> bytes:
+        out = bytearray()
+        for i, ch in enumerate(run, start):
+            q = self.quotes.get(ch)
+            if q is None:
+                out += self.punct[ch]
+                continue
+            prev = text[i - 1] if i else ""
+            opening = not prev or prev.isspace() or prev in _OPENERS
+            out += q[0] if opening else (q[1] or q[0])
+        return bytes(out)
+
+    def parts(self, text: str) -> List[Union[Tuple[int, int], bytes]]:
+        """입력 -> 순서대로 [(start, end) 기본 변환기로 넘길 구간 | 숫자·로마자·문장부호 구간의 변환 결과]
+        (벡터화 경로가 기본 변환기 구간만 모아 한 번에 변환할 수 있게 나눠 둔다)"""
+        if self.pattern is None:
+            return [(0, len(text))] if text else []
+        out: List[Union[Tuple[int, int], bytes]] = []
+        pos = 0
+        for m in self.pattern.finditer(text):
+            start, end = m.span()
+            if pos < start:
+                out.append((pos, start))
+            kind = m.lastgroup
+            if kind == "num":
+                out.append(self._convert_number(m.group(), text, end))
+            elif kind == "latin":
+                out.append(self._convert_latin(m.group(), text, end))
+            else:
+                out.append(self._convert_punct(m.group(), text, start))
+            pos = end
+        if pos < len(text):
+            out.append((pos, len(text)))
+        return out
+
+    def text_to_bytes(self, text: str) -> bytes:
+        base = self.base.text_to_bytes
+        parts = self.parts(text)
+        if len(parts) == 1 and isinstance(parts[0], tuple):
+            return base(text)
+        return b"".join(p if isinstance(p, bytes) else base(text[p[0]:p[1]]) for p in parts)
+
+
+_CONVERTERS: Dict[str, MixedScriptConverter] = {}
+
+
+def get_converter(grade: str = "uncontracted") -> MixedScriptConverter:
+    """grade 별 토크나이저+엔진 (규칙/테이블이 바뀌면 다시 만든다)"""
+    rules = registry.get("ko_braille_symbols")
+    table = get_table()
+    if grade == "contracted":
+        from .contractions import get_engine  # 순환 import 회피
+
+        base = get_engine()
+    else:
+        grade, base = "uncontracted", table
+    conv = _CONVERTERS.get(grade)
+    if conv is None or conv.rules is not rules or conv.base is not base:
+        conv = _CONVERTERS[grade] = MixedScriptConverter(rules, base, table)
+    return conv
@@ -0,0 +1,259 @@
+# services/braille/reverse.py
+"""
+점자 -> 텍스트 역변환 (정자 기준)
+
+정방향 테이블(BrailleTable)의 자모 성분과 파일에 직접 정의된 글자, 혼합 문자열 규칙
+(ko_braille_symbols.json)으로부터 셀 시퀀스 -> 후보 역색인을 만들고, 셀 스트림 위에서
+격자(lattice) 최단 경로로 해석을 고른다.
+
+- 간선: 음절(초성+중성[+종성]), 문장부호/공백, 낱자모, 숫자 구간, 로마자 구간, 따옴표, 해석 불가 셀
+- 비용: 음절 1, 받침 +0.1(겹받침 +0.2), 문장부호 1, 낱자모 3, 해석 불가 10
+  -> 음절로 묶이는 해석이 우선이고, 같은 비용이면 받침 없는 쪽(가나 > 간ㅏ)이 이긴다
+- 숫자(수표 + 숫자[. , 숫자]...)·로마자(로마자표 + [대문자표] 글자..., [로마자 종료표]) 구간은
+  길이마다 비용 1 인 간선 하나 -> 구간 뒤 셀이 숫자/글자와 겹쳐도(3개의 ㄱ = 1) 최단 경로가 가른다.
+  정방향은 한글 앞에서 반드시 로마자 종료표를 넣으므로, 종료표 없이 끝난 로마자 구간 바로 뒤에는
+  한글 간선을 쓰지 않는다 (Hello, -> Hell커 방지)
+  수표 뒤 띄움(3 나 -> 3나)은 같은 셀이라 구분할 수 없으므로 띄움을 빼고 ambiguous 로 표시
+- 큰따옴표(“ ”)는 ? / ㅒ 와 셀이 같아서 따옴표가 열린 상태를 격자에 들고 다닌다:
+  여는 것은 낱말 첫머리에서만, 닫는 것은 열린 뒤에만(비용 0.5) 쓸 수 있다.
+  곧은 따옴표(" ')는 둥근 따옴표와 셀이 같으므로 둥근 따옴표로 읽는다
+- 같은 셀·같은 비용의 후보가 여럿(예: ㄷ/ㅌ)이면 테이블 순서상 앞의 것을 쓰고 ambiguous 로 표시
+"""
+from __future__ import annotations
+
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+from .cells import BLANK_MASK
+from .engine import CHOSEONG, COMPOUND_JAMO, HANGUL_FIRST, HANGUL_LAST, JONGSEONG, JUNGSEONG, BrailleTable, get_table
+from .mixed import SymbolRules
+from .tables import registry
+
+REPLACEMENT = "\ufffd"
+
+COST_SYLLABLE = 1.0
+COST_FINAL = 0.1
+COST_COMPOUND_FINAL = 0.2
+COST_SYMBOL = 1.0
+COST_JAMO = 3.0
+COST_UNKNOWN = 10.0
+COST_QUOTE_CLOSE = 0.5
+
+QUOTE_OPEN, QUOTE_CLOSE = "“", "”"
+
+# 격자 상태 비트
+_QUOTED = 1  # 큰따옴표가 열려 있음
+_ROMAN = 2   # 방금 로마자 구간이 종료표 없이 끝남 -> 다음 간선은 한글이 아니어야 함
+
+_JUNG_JONG = 21 * 28
+CONJOINING_JAMO = range(0x1100, 0x1200)
+
+# (글자/인덱스, 비용, 같은 비용 후보 수)
+_Cand = Tuple[object, float, int]
+
+
+def _index(items) -> Dict[bytes, _Cand]:
+    """(셀, 값, 비용) 목록 -> 셀별 최저 비용 후보 (같으면 먼저 나온 값) + 동률 후보 수"""
+    groups: Dict[bytes, list] = {}
+    for order, (cells, value, cost) in enumerate(items):
+        if cells:
+            groups.setdefault(cells, []).append((cost, order, value))
+    out: Dict[bytes, _Cand] = {}
+    for cells, cands in groups.items():
+        cands.sort(key=lambda x: (x[0], x[1]))
+        best = cands[0][0]
+        ties = len({v for c, _, v in cands if c == best})
+        out[cells] = (cands[0][2], best, ties)
+    return out
+
+
+def is_jamo(ch: str) -> bool:
+    return ch in CHOSEONG or ch in JUNGSEONG or ch in JONGSEONG[1:]
+
+
+def _is_hangul(text: str) -> bool:
+    return bool(text) and (HANGUL_FIRST <= ord(text[0]) <= HANGUL_LAST or is_jamo(text[0]))
+
+
+class ReverseIndex:
+    """BrailleTable + SymbolRules 로부터 만든 역색인. 불변 객체로 취급한다."""
+
+    def __init__(self, table: Optional[BrailleTable] = None, rules: Optional[SymbolRules] = None):
+        table = table or get_table()
+        rules = rules or registry.get("ko_braille_symbols")
+        self.table = table
+        self.rules = rules
+        self.version = f"{table.version}+{rules.version}"
+
+        self.cho = _index((c, i, 0.0) for i, c in enumerate(table.cho))
+        self.jung = _index((c, i, 0.0) for i, c in enumerate(table.jung))
+        self.jong = _index(
+            (c, i, COST_COMPOUND_FINAL if JONGSEONG[i] in COMPOUND_JAMO else COST_FINAL)
+            for i, c in enumerate(table.jong) if i
+        )
+
+        # 빈 셀은 항상 공백으로 읽는다. 나머지는 테이블 순서(ASCII -> 호환 자모 -> 기타)
+        symbols = [(bytes([BLANK_MASK]), " ", COST_SYMBOL)]
+        for ch, cells in table.packed.items():
+            cp = ord(ch)
+            if ch not in table.direct or cp in CONJOINING_JAMO or HANGUL_FIRST <= cp <= HANGUL_LAST:
+                continue  # 완성형 음절은 음절 간선이 담당
+            symbols.append((cells, ch, COST_JAMO if is_jamo(ch) else COST_SYMBOL))
+        # 기본 테이블에 없는 문장부호 (정방향 mixed.py 와 같은 기준). 큰따옴표는 따로 다룬다
+        for ch, cells in rules.punct.items():
+            if len(ch) == 1 and ch not in table.direct and ch not in (QUOTE_OPEN, QUOTE_CLOSE):
+                symbols.append((cells, ch, COST_SYMBOL))
+        self.symbols = _index(symbols)
+        self.quote_open = rules.punct.get(QUOTE_OPEN) if QUOTE_OPEN not in table.direct else None
+        self.quote_close = rules.punct.get(QUOTE_CLOSE) if QUOTE_CLOSE not in table.direct else None
+
+        self.digits = {cells: ch for ch, cells in rules.digits.items()}
+        self.number_punct = {cells: ch for ch, cells in rules.number_punct.items()}
+        self.latin = {cells: ch for ch, cells in rules.latin.items()}
+        self.space_before = [table.cho[i] for i in sorted(rules.space_before)]
+
+        self.max_cho = max(map(len, self.cho), default=1)
+        self.max_jung = max(map(len, self.jung), default=1)
+        self.max_jong = max(map(len, self.jong), default=1)
+        self.max_symbol = max(map(len, self.symbols), default=1)
+
+    def _edges(self, packed: bytes, i: int):
+        """위치 i 에서 나가는 간선: (끝 위치, 텍스트, 비용, 모호 여부)"""
+        n = len(packed)
+        for a in range(1, min(self.max_symbol, n - i) + 1):
+            hit = self.symbols.get(packed[i:i + a])
+            if hit:
+                yield i + a, hit[0], hit[1], hit[2] > 1
+
+        for a in range(1, min(self.max_cho, n - i) + 1):
+            c = self.cho.get(packed[i:i + a])
+            if not c:
+                continue
+            j = i + a
+            for b in range(1, min(self.max_jung, n - j) + 1):
+                v = self.jung.get(packed[j:j + b])
+                if not v:
+                    continue
+                k = j + b
+                amb = c[2] > 1 or v[2] > 1
+                base = HANGUL_FIRST + c[0] * _JUNG_JONG + v[0] * 28
+                yield k, chr(base), COST_SYLLABLE, amb
+                for d in range(1, min(self.max_jong, n - k) + 1):
+                    f = self.jong.get(packed[k:k + d])
+                    if f:
+                        yield k + d, chr(base + f[0]), COST_SYLLABLE + f[1], amb or f[2] > 1
+
+    def _match(self, packed: bytes, i: int, lookup: Dict[bytes, str]) -> Optional[Tuple[int, str]]:
+        for cells, ch in lookup.items():
+            if packed.startswith(cells, i):
+                return i + len(cells), ch
+        return None
+
+    def _number_edges(self, packed: bytes, i: int):
+        """수표로 시작하는 숫자 구간: 숫자가 하나 늘 때마다 간선 하나"""
+        rules = self.rules
+        if not rules.number or not packed.startswith(rules.number, i):
+            return
+        k, text = i + len(rules.number), ""
+        while True:
+            hit = self._match(packed, k, self.digits)
+            if hit is None:
+                return
+            k, ch = hit
+            text += ch
+            yield k, text, COST_SYMBOL, False
+            # 숫자 뒤 ㄴㄷㅁㅋㅌㅍㅎ 앞의 띄움은 정방향이 넣은 것으로 보고 뺀다
+            if packed[k:k + 1] == bytes([BLANK_MASK]) and any(packed.startswith(c, k + 1) for c in self.space_before):
+                yield k + 1, text, COST_SYMBOL, True
+            sep = self._match(packed, k, self.number_punct)
+            if sep is not None and self._match(packed, sep[0], self.digits) is not None:
+                k = sep[0]
+                text += sep[1]
+
+    def _roman_edges(self, packed: bytes, i: int):
+        """로마자표로 시작하는 한 낱말: 글자가 하나 늘 때마다 간선 하나 (+ 로마자 종료표까지 먹는 간선)
+        -> (끝 위치, 텍스트, 비용, 종료표 없이 끝났는지)"""
+        rules = self.rules
+        if not rules.roman or not packed.startswith(rules.roman, i):
+            return
+        k, text = i + len(rules.roman), ""
+        upper_word = bool(rules.capital_word) and packed.startswith(rules.capital_word, k)
+        if upper_word:
+            k += len(rules.capital_word)
+        while True:
+            upper = upper_word
+            if not upper_word and rules.capital and packed.startswith(rules.capital, k):
+                upper, j = True, k + len(rules.capital)
+            else:
+                j = k
+            hit = self._match(packed, j, self.latin)
+            if hit is None:
+                return
+            k, ch = hit
+            text += ch.upper() if upper else ch
+            yield k, text, COST_SYMBOL, True
+            if rules.roman_end and packed.startswith(rules.roman_end, k):
+                yield k + len(rules.roman_end), text, COST_SYMBOL, False
+
+    def decode(self, packed: bytes) -> Tuple[str, bool]:
+        """패킹된 셀 -> (텍스트, 모호한 선택이 있었는지)"""
+        n = len(packed)
+        inf = float("inf")
+        blank = bytes([BLANK_MASK])
+        states = range(4)  # _QUOTED | _ROMAN 조합
+        cost = [[inf] * (n + 1) for _ in states]
+        back: List[List[Optional[Tuple[int, int, str, bool]]]] = [[None] * (n + 1) for _ in states]
+        cost[0][0] = 0.0
+
+        def relax(i, s, j, t, text, c, amb):
+            if s & _ROMAN and _is_hangul(text):
+                return
+            if cost[s][i] + c < cost[t][j]:
+                cost[t][j] = cost[s][i] + c
+                back[t][j] = (i, s, text, amb)
+
+        for i in range(n):
+            live = [s for s in states if cost[s][i] != inf]
+            if not live:
+                continue
+            edges = list(self._edges(packed, i)) + list(self._number_edges(packed, i))
+            roman = list(self._roman_edges(packed, i))
+            for s in live:
+                quoted = s & _QUOTED
+                for j, text, c, amb in edges:
+                    relax(i, s, j, quoted, text, c, amb)
+                for j, text, c, open_end in roman:
+                    relax(i, s, j, quoted | (_ROMAN if open_end else 0), text, c, False)
+                if not quoted and self.quote_open and packed.startswith(self.quote_open, i) \
+                        and (i == 0 or packed[i - 1:i] == blank):
+                    relax(i, s, i + len(self.quote_open), _QUOTED, QUOTE_OPEN, COST_SYMBOL, False)
+                if quoted and self.quote_close and packed.startswith(self.quote_close, i):
+                    relax(i, s, i + len(self.quote_close), 0, QUOTE_CLOSE, COST_QUOTE_CLOSE, False)
+                # 해석 불가 셀 간선은 항상 둔다 (막다른 경로 방지)
+                relax(i, s, i + 1, quoted, REPLACEMENT, COST_UNKNOWN, False)
+
+        parts: List[str] = []
+        ambiguous = False
+        s = min(states, key=lambda t: cost[t][n])  # 같은 비용이면 따옴표가 닫힌 쪽
+        j = n
+        while j > 0:
+            i, s, text, amb = back[s][j]  # type: ignore[misc]
+            parts.append(text)
+            ambiguous = ambiguous or amb
+            j = i
+        return unicodedata.normalize("NFC", "".join(reversed(parts))), ambiguous
+
+
+_INDEX: Optional[ReverseIndex] = None
+
+
+def get_index() -> ReverseIndex:
+    global _INDEX
+    if _INDEX is None or _INDEX.table is not get_table() or _INDEX.rules is not registry.get("ko_braille_symbols"):
+        _INDEX = ReverseIndex()
+    return _INDEX
+
+
+def bytes_to_text(packed: bytes) -> Tuple[str, bool]:
+    """패킹된 셀 -> (텍스트, ambiguous)"""
+    return get_index().decode(bytes(packed))
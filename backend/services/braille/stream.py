@@ -0,0 +1,80 @@
+# services/braille/stream.py
+"""
+긴 문서용 스트리밍 변환
+
+입력을 조각(chunk) 단위로 받아 문장(또는 최대 N글자) 단위로 잘라 바로 변환한다.
+메모리 사용량은 입력 길이와 무관하게 세그먼트 하나 크기로 유지된다.
+"""
+from __future__ import annotations
+
+import codecs
+import re
+from typing import Iterable, Iterator, Optional, Tuple
+
+from .engine import BrailleTable
+from .mixed import get_converter
+
+DEFAULT_MAX_CHARS = 200
+READ_SIZE = 8192
+
+# 문장부호 뒤에 공백이 올 때만 문장 끝 (3.14, U.S. 같은 구간을 자르지 않도록)
+_SENTENCE_END = re.compile(r"[.!?。]+(?=\s)|\n+")
+
+
+def _cut_point(buf: str, max_chars: int) -> Optional[int]:
+    m = _SENTENCE_END.search(buf, 0, max_chars)
+    if m:
+        return m.end()
+    if len(buf) < max_chars:
+        return None
+    # 문장 끝이 없으면 최대 길이 안의 마지막 공백에서 자른다
+    space = buf.rfind(" ", 0, max_chars)
+    return space + 1 if space > 0 else max_chars
+
+
+def iter_segments(chunks: Iterable[str], max_chars: int = DEFAULT_MAX_CHARS) -> Iterator[str]:
+    """텍스트 조각 스트림 -> 문장/최대 길이 세그먼트 스트림 (이어 붙이면 원문과 같다)"""
+    max_chars = max(1, int(max_chars))
+    buf = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buf += chunk
+        while buf:
+            cut = _cut_point(buf, max_chars)
+            if cut is None:
+                break
+            yield buf[:cut]
+            buf = buf[cut:]
+    if buf:
+        yield buf
+
+
+def iter_decode(byte_chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[str]:
+    """바이트 조각 -> 문자열 조각 (멀티바이트 글자가 경계에 걸쳐도 안전)"""
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    for chunk in byte_chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_read(stream, size: int = READ_SIZE) -> Iterator[bytes]:
+    """file-like 객체를 size 바이트씩 읽는다"""
+    return iter(lambda: stream.read(size), b"")
+
+
+def iter_convert(
+    chunks: Iterable[str],
+    max_chars: int = DEFAULT_MAX_CHARS,
+    table: Optional[BrailleTable] = None,
+    grade: str = "uncontracted",
+) -> Iterator[Tuple[str, bytes]]:
+    """텍스트 조각 스트림 -> (세그먼트, 패킹된 셀) 스트림"""
+    if table is None:
+        table = get_converter(grade)
+    for seg in iter_segments(chunks, max_chars):
+        yield seg, table.text_to_bytes(seg)
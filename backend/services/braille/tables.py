@@ -0,0 +1,155 @@
+# services/braille/tables.py
+"""
+매핑 테이블 레지스트리 (mtime 기반 핫 리로드)
+
+- 각 JSON 파일은 프로세스당 한 번 파싱·컴파일해 메모리에 둔다 (요청마다 파일 I/O 없음)
+- 최대 check_interval 초에 한 번만 stat 으로 변경 여부를 확인
+- 바뀌었으면 백그라운드 스레드에서 다시 빌드해 참조만 원자적으로 교체
+  (읽는 쪽은 재빌드를 기다리지 않고 기존 테이블을 계속 쓴다)
+- 재빌드 실패 시 기존 테이블 유지
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+CHECK_INTERVAL = float(os.getenv("BRAILLE_TABLE_CHECK_SEC", "2.0"))
+
+
+class _Entry:
+    __slots__ = ("name", "path", "compile", "default", "value", "version",
+                 "stamp", "checked", "lock", "loaded")
+
+    def __init__(self, name: str, path: Path, compile: Callable[[Any], Any], default: Any):
+        self.name = name
+        self.path = path
+        self.compile = compile
+        self.default = default
+        self.value: Any = None
+        self.version = ""
+        self.stamp: Optional[tuple] = None
+        self.checked = 0.0
+        self.lock = threading.Lock()
+        self.loaded = False
+
+
+def _stat(path: Path) -> Optional[tuple]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class TableRegistry:
+    def __init__(self, data_dir: Path = DATA_DIR, check_interval: float = CHECK_INTERVAL):
+        self.data_dir = Path(data_dir)
+        self.check_interval = check_interval
+        self._entries: Dict[str, _Entry] = {}
+
+    def register(self, name: str, filename: str, compile: Callable[[Any], Any], default: Any = None) -> None:
+        """compile(파싱된 JSON) -> 컴파일된 테이블. 컴파일 결과에 version 속성이 있으면 채워 준다."""
+        self._entries[name] = _Entry(name, self.data_dir / filename, compile,
+                                     {} if default is None else default)
+
+    def _build(self, entry: _Entry) -> None:
+        stamp = _stat(entry.path)
+        try:
+            with open(entry.path, "rb") as f:
+                blob = f.read()
+            value = entry.compile(json.loads(blob.decode("utf-8-sig")))
+            version = hashlib.sha1(blob).hexdigest()[:12]
+        except Exception:
+            if entry.loaded:
+                logger.exception("[braille] reload of %s failed; keeping previous table", entry.path)
+                entry.stamp = stamp
+                return
+            logger.exception("[braille] failed to load %s", entry.path)
+            value, version = entry.compile(entry.default), "empty"
+        if hasattr(value, "version"):
+            value.version = version
+        # 참조 교체는 원자적 - 읽는 쪽은 이전/새 테이블 중 하나를 온전히 본다
+        entry.value, entry.version, entry.stamp = value, version, stamp
+        entry.loaded = True
+        logger.info("[braille] table %s loaded (version %s)", entry.name, version)
+
+    def _rebuild_async(self, entry: _Entry) -> None:
+        def run():
+            try:
+                self._build(entry)
+            finally:
+                entry.lock.release()
+        threading.Thread(target=run, name=f"braille-reload-{entry.name}", daemon=True).start()
+
+    def get(self, name: str) -> Any:
+        entry = self._entries[name]
+        if not entry.loaded:
+            with entry.lock:
+                if not entry.loaded:
+                    entry.checked = time.monotonic()
+                    self._build(entry)
+            return entry.value
+
+        now = time.monotonic()
+        if now - entry.checked >= self.check_interval:
+            entry.checked = now
+            if _stat(entry.path) != entry.stamp and entry.lock.acquire(blocking=False):
+                self._rebuild_async(entry)
+        return entry.value
+
+    def version(self, name: str) -> str:
+        self.get(name)
+        return self._entries[name].version
+
+    def reload(self, name: Optional[str] = None) -> None:
+        """명시적 재빌드 (동기). name 이 없으면 전부"""
+        for entry in ([self._entries[name]] if name else list(self._entries.values())):
+            with entry.lock:
+                entry.checked = time.monotonic()
+                self._build(entry)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            e.name: {"file": e.path.name, "loaded": e.loaded, "version": e.version}
+            for e in self._entries.values()
+        }
+
+
+def _compile_core(raw: dict) -> dict:
+    """ko_braille_core.json: 원본 + 글자별 인덱스"""
+    raw = raw if isinstance(raw, dict) else {}
+    chars = [c for c in raw.get("chars", []) if isinstance(c, dict) and c.get("char")]
+    return {**raw, "by_char": {c["char"]: c for c in chars}}
+
+
+def _compile_catalog(raw: dict) -> dict:
+    return raw if isinstance(raw, dict) else {}
+
+
+def _compile_lesson(raw):
+    """lesson_*.json: 파싱 결과 그대로 ({mode, items} 또는 목록)"""
+    return raw
+
+
+registry = TableRegistry()
+registry.register("ko_braille_core", "ko_braille_core.json", _compile_core)
+registry.register("braille_catalog", "braille_catalog.json", _compile_catalog)
+
+LESSON_FILES = {
+    "chars": "lesson_chars.json",
+    "words": "lesson_words.json",
+    "sentences": "lesson_sentences.json",
+    "keywords": "lesson_keywords.json",
+}
+for _mode, _filename in LESSON_FILES.items():
+    registry.register(f"lesson_{_mode}", _filename, _compile_lesson,
+                      default=[] if _mode == "keywords" else {"mode": _mode, "items": []})
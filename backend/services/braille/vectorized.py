@@ -0,0 +1,161 @@
+# services/braille/vectorized.py
+"""
+NumPy 벡터화 대량 변환 경로 (오프라인 작업 / 전자책·뉴스 전문 등 매우 긴 입력용)
+
+1) 문자열 -> 코드포인트 배열
+2) 한글 음절 영역은 산술 연산으로 초성/중성/종성 인덱스를 구해 자모 셀 행렬에서 gather
+   (받침 없음·빈 성분은 길이 0 으로 두고 마스크로 걸러냄)
+3) 그 외 코드포인트(및 파일에 직접 정의된 음절)는 BMP 전체 룩업 테이블에서 gather
+4) 글자별 셀 행을 마스크로 평탄화 -> BrailleTable.text_to_bytes 와 바이트 단위로 같은 결과
+
+모듈 함수 text_to_bytes 는 공개 엔진(engine.text_to_bytes, 정자)과 같은 결과를 낸다:
+혼합 문자열 토크나이저(mixed.py)가 숫자·로마자·문장부호 구간을 변환하고, 나머지(기본 테이블)
+구간만 모아 위 벡터화 경로로 한 번에 변환한 뒤 글자별 셀 수로 다시 잘라 제자리에 끼운다.
+
+numpy 는 선택 의존성이다. 설치되어 있지 않으면 import 시 ImportError.
+"""
+from __future__ import annotations
+
+import unicodedata
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .engine import HANGUL_FIRST, HANGUL_LAST, BrailleTable, get_table
+
+BMP_SIZE = 0x10000
+CHUNK_CHARS = 1 << 20  # 한 번에 처리할 글자 수 (중간 배열 메모리 상한)
+
+_JUNG_JONG = 21 * 28
+
+
+def _matrix(seqs: List[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """가변 길이 셀 바이트열 목록 -> (n × 최대길이 행렬, 길이 배열)"""
+    width = max(1, max((len(x) for x in seqs), default=1))
+    mat = np.zeros((len(seqs), width), dtype=np.uint8)
+    lens = np.zeros(len(seqs), dtype=np.intp)
+    for i, x in enumerate(seqs):
+        mat[i, :len(x)] = np.frombuffer(x, dtype=np.uint8)
+        lens[i] = len(x)
+    return mat, lens
+
+
+class VectorizedConverter:
+    """BrailleTable 로부터 만든 배열 룩업 테이블"""
+
+    def __init__(self, table: Optional[BrailleTable] = None):
+        table = table or get_table()
+        self.table = table
+
+        self.cho, self.cho_len = _matrix(table.cho)
+        self.jung, self.jung_len = _matrix(table.jung)
+        self.jong, self.jong_len = _matrix(table.jong)
+
+        # 한글 이외(+ 직접 정의 음절) 룩업: 없는 코드포인트는 빈 셀 1개
+        width = max(len(v) for v in table.packed.values())
+        self.other = np.zeros((BMP_SIZE, width), dtype=np.uint8)
+        self.other_len = np.ones(BMP_SIZE, dtype=np.intp)
+        for ch, cells in table.packed.items():
+            cp = ord(ch)
+            if cp < BMP_SIZE:
+                self.other[cp, :len(cells)] = np.frombuffer(cells, dtype=np.uint8)
+                self.other_len[cp] = len(cells)
+
+        # 파일에 직접 정의된 음절은 분해 대신 두 번째 룩업을 타야 스칼라 엔진과 같아진다
+        self.syllable = np.ones(HANGUL_LAST - HANGUL_FIRST + 1, dtype=bool)
+        for ch in table.direct:
+            if HANGUL_FIRST <= ord(ch) <= HANGUL_LAST:
+                self.syllable[ord(ch) - HANGUL_FIRST] = False
+
+        self.width = max(
+            self.cho.shape[1] + self.jung.shape[1] + self.jong.shape[1],
+            self.other.shape[1],
+        )
+
+    def _convert_codepoints(self, cps: np.ndarray, lengths: bool = False):
+        n = cps.shape[0]
+        rows = np.zeros((n, self.width), dtype=np.uint8)
+        mask = np.zeros((n, self.width), dtype=bool)
+
+        in_block = (cps >= HANGUL_FIRST) & (cps <= HANGUL_LAST)
+        hangul = in_block.copy()
+        hangul[in_block] = self.syllable[cps[in_block] - HANGUL_FIRST]
+
+        # --- 한글 음절: 초성/중성/종성 인덱스 산술 ---
+        s = cps[hangul] - HANGUL_FIRST
+        ci, vi, fi = s // _JUNG_JONG, (s % _JUNG_JONG) // 28, s % 28
+        h = np.concatenate((self.cho[ci], self.jung[vi], self.jong[fi]), axis=1)
+        # 성분별 유효 셀 마스크 (받침 없음 = 종성 길이 0)
+        hm = np.concatenate((
+            np.arange(self.cho.shape[1]) < self.cho_len[ci][:, None],
+            np.arange(self.jung.shape[1]) < self.jung_len[vi][:, None],
+            np.arange(self.jong.shape[1]) < self.jong_len[fi][:, None],
+        ), axis=1)
+        rows[hangul, :h.shape[1]] = h
+        mask[hangul, :h.shape[1]] = hm
+
+        # --- 그 외: 두 번째 룩업 (BMP 밖은 빈 셀) ---
+        other = ~hangul
+        ocp = cps[other]
+        ocp = np.where(ocp < BMP_SIZE, ocp, 0)
+        width = self.other.shape[1]
+        rows[other, :width] = self.other[ocp]
+        mask[other, :width] = np.arange(width) < self.other_len[ocp][:, None]
+
+        # 행 우선 평탄화 = 글자 순서 그대로
+        if lengths:
+            return rows[mask], mask.sum(axis=1)
+        return rows[mask]
+
+    def text_to_bytes(self, text: str) -> bytes:
+        """기본 테이블만 적용 (BrailleTable.text_to_bytes 와 같은 결과, 토크나이저 없음)"""
+        text = unicodedata.normalize("NFC", text or "")
+        parts = []
+        for i in range(0, len(text), CHUNK_CHARS):
+            chunk = text[i:i + CHUNK_CHARS]
+            cps = np.frombuffer(chunk.encode("utf-32-le", "surrogatepass"), dtype="<u4").astype(np.int64)
+            parts.append(self._convert_codepoints(cps).tobytes())
+        return b"".join(parts)
+
+    def convert_spans(self, text: str) -> Tuple[bytes, np.ndarray]:
+        """-> (평탄화된 셀 바이트열, 글자별 시작 오프셋 len(text)+1 개)"""
+        flats, lens = [], [np.zeros(1, dtype=np.int64)]
+        for i in range(0, len(text), CHUNK_CHARS):
+            chunk = text[i:i + CHUNK_CHARS]
+            cps = np.frombuffer(chunk.encode("utf-32-le", "surrogatepass"), dtype="<u4").astype(np.int64)
+            flat, n = self._convert_codepoints(cps, lengths=True)
+            flats.append(flat.tobytes())
+            lens.append(n)
+        return b"".join(flats), np.cumsum(np.concatenate(lens))
+
+
+_CONVERTER: Optional[VectorizedConverter] = None
+
+
+def get_converter() -> VectorizedConverter:
+    global _CONVERTER
+    if _CONVERTER is None or _CONVERTER.table is not get_table():
+        _CONVERTER = VectorizedConverter()
+    return _CONVERTER
+
+
+def text_to_bytes(text: str) -> bytes:
+    """벡터화 경로로 텍스트 -> 패킹된 셀 바이트열 (engine.text_to_bytes 정자와 동일한 결과)"""
+    from .mixed import get_converter as get_mixed  # 순환 import 회피
+
+    text = unicodedata.normalize("NFC", text or "")
+    parts = get_mixed("uncontracted").parts(text)
+    spans = [p for p in parts if isinstance(p, tuple)]
+    if not spans:
+        return b"".join(parts)
+    # 기본 테이블 구간은 모아서 한 번에 변환 (글자별 변환이라 이어 붙여도 결과가 같다)
+    flat, offsets = get_converter().convert_spans("".join(text[a:b] for a, b in spans))
+    out, n = [], 0
+    for p in parts:
+        if isinstance(p, bytes):
+            out.append(p)
+        else:
+            m = n + p[1] - p[0]
+            out.append(flat[offsets[n]:offsets[m]])
+            n = m
+    return b"".join(out)
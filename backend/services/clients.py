@@ -0,0 +1,227 @@
+# services/clients.py
+"""
+LLM / 외부 API 클라이언트 레지스트리 (Django 비의존)
+
+요청마다 .env 를 다시 찾고 OpenAI 클라이언트·Gemini 모델·HTTP 세션을 새로 만들면
+매번 연결 풀이 새로 생기고 TLS 핸드셰이크를 다시 한다. 여기서는 프로세스당 한 번 만들어
+keep-alive 연결 풀을 재사용한다.
+
+- openai()            : OpenAI 클라이언트 (내부 httpx 연결 풀 재사용)
+- gemini_model(...)   : genai.GenerativeModel (키·모델 이름·설정별로 한 번, 키마다 자기 서비스 클라이언트)
+- http()              : requests.Session (네이버 뉴스 등, 호스트별 keep-alive 풀)
+- aopenai() / ahttp() : async 뷰(ASGI)용 AsyncOpenAI / httpx.AsyncClient. async 연결 풀은 이벤트 루프에
+  묶이므로 실행 중인 루프별로 한 번 만든다 (uvicorn 은 프로세스당 루프 하나 -> 사실상 프로세스 공유)
+- reload()            : 설정 변경 반영 훅. .env 를 다시 읽고 만들어 둔 클라이언트를 버린다
+  (요청 경로에서는 .env 를 읽지 않는다 - 환경변수는 기동 시 settings/wsgi/asgi 가 읽어 둠)
+키가 없으면 ConfigError. 실패한 생성은 캐시하지 않는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+ENV_FILES = (BACKEND_DIR / ".env", BACKEND_DIR.parent / ".env")
+
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT_SEC", "60"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "1"))
+HTTP_POOL_SIZE = int(os.getenv("LLM_HTTP_POOL_SIZE", "20"))
+# async 경로는 스레드 수에 묶이지 않으므로 풀을 크게 (동시 업스트림 호출 수 상한)
+ASYNC_POOL_SIZE = int(os.getenv("LLM_ASYNC_POOL_SIZE", "200"))
+
+
+class ConfigError(RuntimeError):
+    pass
+
+
+def _require(env: str) -> str:
+    value = os.getenv(env, "").strip()
+    if not value:
+        raise ConfigError(f"{env} 미설정")
+    return value
+
+
+class ClientRegistry:
+    """이름 -> 한 번 만든 클라이언트. 생성은 이름별 잠금 아래에서 한 번만"""
+
+    def __init__(self):
+        self._clients: Dict[Any, Any] = {}
+        self._loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Any, Any]]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def get(self, key, factory: Callable[[], Any]):
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = factory()
+                logger.info("[clients] %s created", key if isinstance(key, str) else key[0])
+        return client
+
+    def get_async(self, key, factory: Callable[[], Any]):
+        """실행 중인 이벤트 루프별 클라이언트 (루프가 닫히면 같이 버려진다)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            per_loop = self._loop_clients.get(loop)
+            if per_loop is None:
+                per_loop = self._loop_clients[loop] = {}
+        client = per_loop.get(key)
+        if client is None:
+            # 한 루프 안에서는 await 없이 만들므로 경쟁 없음
+            client = per_loop[key] = factory()
+            logger.info("[clients] %s created (async)", key if isinstance(key, str) else key[0])
+        return client
+
+    def reload(self, reread_env: bool = True) -> None:
+        """설정 변경 반영: .env 재로드(override) + 기존 클라이언트 버리기. 진행 중인 요청은 이전 클라이언트로 끝난다
+        (close() 는 진행 중인 연결까지 끊으므로 부르지 않는다 - 참조가 모두 사라지면 GC 가 정리)"""
+        if reread_env:
+            from dotenv import load_dotenv
+
+            for path in ENV_FILES:
+                load_dotenv(path, override=True, encoding="utf-8")
+        with self._lock:
+            # 다음 요청부터 새로 생성 (async 클라이언트도 마찬가지)
+            self._clients = {}
+            self._loop_clients = weakref.WeakKeyDictionary()
+            self.generation += 1
+        logger.info("[clients] reloaded (generation %d)", self.generation)
+
+    def status(self) -> Dict[str, Any]:
+        names = sorted(k if isinstance(k, str) else k[0] for k in self._clients)
+        async_names = sorted({k if isinstance(k, str) else k[0]
+                              for per_loop in list(self._loop_clients.values()) for k in per_loop})
+        return {"generation": self.generation, "clients": names, "async_clients": async_names,
+                "event_loops": len(self._loop_clients)}
+
+
+registry = ClientRegistry()
+
+
+def openai():
+    """OpenAI 클라이언트 (프로세스 공유). 키가 바뀌면 reload() 후 새로 만든다"""
+    key = _require("OPENAI_API_KEY")
+
+    def build():
+        try:
+            from openai import OpenAI
+        except Exception as e:
+            raise ConfigError(f"OpenAI SDK(v1+) 필요: {e}")
+        return OpenAI(api_key=key, timeout=OPENAI_TIMEOUT, max_retries=OPENAI_MAX_RETRIES)
+
+    return registry.get("openai", build)
+
+
+def aopenai():
+    """AsyncOpenAI 클라이언트 (async 뷰 전용, 루프별 공유)"""
+    key = _require("OPENAI_API_KEY")
+
+    def build():
+        try:
+            from openai import AsyncOpenAI
+        except Exception as e:
+            raise ConfigError(f"OpenAI SDK(v1+) 필요: {e}")
+        import httpx
+
+        limits = httpx.Limits(max_connections=ASYNC_POOL_SIZE, max_keepalive_connections=ASYNC_POOL_SIZE // 4)
+        return AsyncOpenAI(api_key=key, timeout=OPENAI_TIMEOUT, max_retries=OPENAI_MAX_RETRIES,
+                           http_client=httpx.AsyncClient(limits=limits, timeout=OPENAI_TIMEOUT))
+
+    return registry.get_async("openai.async", build)
+
+
+def _fingerprint(key: str) -> str:
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+
+
+def _gemini_options(key: str):
+    from google.api_core.client_options import ClientOptions
+
+    return ClientOptions(api_key=key)
+
+
+def gemini_model(model_name: str, key_env: str = "GOOGLE_API_KEY", **kwargs):
+    """genai.GenerativeModel (키 + 모델 이름 + 설정별로 한 번).
+    프로세스 전역 genai.configure 는 쓰지 않는다 - GOOGLE_API_KEY(llm.py)와 GEMINI_API_KEY(그 외)가
+    섞여 있어도 모델마다 자기 키로 만든 GenerativeServiceClient 를 붙인다"""
+    key = _require(key_env)
+    fp = _fingerprint(key)
+
+    def build_service():
+        from google.ai import generativelanguage as glm
+
+        return glm.GenerativeServiceClient(client_options=_gemini_options(key))
+
+    # 레지스트리 잠금은 재진입이 안 되므로 서비스 클라이언트는 모델 생성 밖에서 먼저 얻는다
+    service = registry.get(("gemini.client", fp), build_service)
+
+    def build():
+        import google.generativeai as genai
+
+        model = genai.GenerativeModel(model_name, **kwargs)
+        model._client = service
+        return model
+
+    return registry.get(("gemini", fp, model_name, repr(sorted(kwargs.items()))), build)
+
+
+def gemini_async_model(model_name: str, key_env: str = "GOOGLE_API_KEY", **kwargs):
+    """generate_content_async 용 모델 (async 뷰 전용). grpc aio 채널은 이벤트 루프에 묶이므로 루프별로"""
+    key = _require(key_env)
+    fp = _fingerprint(key)
+
+    def build():
+        import google.generativeai as genai
+        from google.ai import generativelanguage as glm
+
+        model = genai.GenerativeModel(model_name, **kwargs)
+        model._async_client = glm.GenerativeServiceAsyncClient(client_options=_gemini_options(key))
+        return model
+
+    return registry.get_async(("gemini.async", fp, model_name, repr(sorted(kwargs.items()))), build)
+
+
+def http():
+    """keep-alive requests.Session (외부 HTTP API 공용)"""
+    def build():
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    return registry.get("http", build)
+
+
+def ahttp():
+    """keep-alive httpx.AsyncClient (async 뷰의 외부 HTTP API 공용, 루프별 공유)"""
+    def build():
+        import httpx
+
+        limits = httpx.Limits(max_connections=ASYNC_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE)
+        return httpx.AsyncClient(limits=limits, timeout=10)
+
+    return registry.get_async("http.async", build)
+
+
+def naver_credentials() -> Tuple[str, str]:
+    return _require("NAVER_CLIENT_ID"), _require("NAVER_CLIENT_SECRET")
+
+
+def reload() -> None:
+    registry.reload()
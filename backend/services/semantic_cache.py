@@ -0,0 +1,215 @@
+# services/semantic_cache.py
+"""
+유사 질의 캐시 (MinHash + LSH, 모델·네트워크 불필요)
+
+STT 로 들어오는 질의는 같은 의도라도 조사·띄어쓰기·어미가 제각각이라
+("블록체인이 뭐야" / "블록체인 설명해줘") 정확 일치 캐시(answer_cache)로는 못 잡는다.
+
+- 정규화: answer_cache.normalize_query 후 끝의 요청 표현(뭐야, 설명해줘, 알려줘 ...)과
+  조사(이/가/은/는 ...)를 떼어 핵심어만 남긴다
+- shingle: 글자 n-gram (기본 2) -> MinHash 서명 (num_perm 개 해시의 최솟값)
+- LSH: 서명을 bands × rows 로 잘라 밴드별 버킷에 넣는다. 후보는 버킷이 하나라도 겹치는 항목뿐이고,
+  후보에 대해서만 실제 shingle Jaccard 를 계산해 threshold 이상인 가장 비슷한 답을 쓴다
+- 범위(scope: 모드·topic·모델·템플릿)가 다르면 절대 섞지 않는다
+- 항목 수 상한(LRU 제거) + TTL. 조회/적중/후보 수/유사도 분포 통계 제공
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from .answer_cache import normalize_query
+
+DEFAULT_THRESHOLD = float(os.getenv("CHAT_SEMANTIC_THRESHOLD", "0.8"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("CHAT_SEMANTIC_MAX_ENTRIES", "4096"))
+DEFAULT_NGRAM = 2
+DEFAULT_BANDS = 16
+DEFAULT_ROWS = 4
+
+# 끝에 붙는 요청 표현 (긴 것부터 떼어냄)
+REQUEST_SUFFIXES = tuple(sorted((
+    "뭐야", "뭐예요", "뭐에요", "뭔가요", "무엇인가요", "무엇이야", "뭐지", "란뭐야", "이란",
+    "설명해줘", "설명해주세요", "설명좀", "설명", "알려줘", "알려주세요", "알려줄래", "말해줘",
+    "에대해", "에대해서", "가르쳐줘", "궁금해", "좀",
+), key=len, reverse=True))
+PARTICLES = ("에대한", "이란", "란", "이", "가", "은", "는", "을", "를", "의", "에")
+
+_MERSENNE = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_U64 = struct.Struct("<Q")
+
+
+def canonical(query: str) -> str:
+    """정규화 + 요청 표현/조사 제거 ("블록체인이 뭐야?" -> "블록체인")"""
+    text = normalize_query(query)
+    changed = True
+    while changed and text:
+        changed = False
+        for suffix in REQUEST_SUFFIXES:
+            if text.endswith(suffix) and len(text) > len(suffix):
+                text = text[:-len(suffix)]
+                changed = True
+                break
+        for particle in PARTICLES:
+            if text.endswith(particle) and len(text) > len(particle) + 1:
+                text = text[:-len(particle)]
+                changed = True
+                break
+    return text
+
+
+def shingles(text: str, n: int = DEFAULT_NGRAM) -> FrozenSet[str]:
+    if len(text) <= n:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """(a*h + b) mod p 꼴의 해시 num_perm 개 (시드 고정 - 프로세스/워커가 달라도 같은 서명)"""
+
+    def __init__(self, num_perm: int, seed: int = 1):
+        rng = random.Random(seed)
+        self.params = [(rng.randrange(1, _MERSENNE), rng.randrange(0, _MERSENNE)) for _ in range(num_perm)]
+
+    @staticmethod
+    def _base(shingle: str) -> int:
+        return _U64.unpack(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest())[0]
+
+    def signature(self, items: FrozenSet[str]) -> Tuple[int, ...]:
+        if not items:
+            return tuple(_MAX_HASH for _ in self.params)
+        hashes = [self._base(s) for s in items]
+        return tuple(
+            min(((a * h + b) % _MERSENNE) & _MAX_HASH for h in hashes)
+            for a, b in self.params
+        )
+
+
+class _Entry:
+    __slots__ = ("scope", "shingles", "bands", "payload", "expires", "text")
+
+    def __init__(self, scope, shingles, bands, payload, expires, text):
+        self.scope = scope
+        self.shingles = shingles
+        self.bands = bands
+        self.payload = payload
+        self.expires = expires
+        self.text = text
+
+
+class SemanticCache:
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ngram: int = DEFAULT_NGRAM, bands: int = DEFAULT_BANDS, rows: int = DEFAULT_ROWS):
+        self.threshold = threshold
+        self.max_entries = max(1, int(max_entries))
+        self.ngram = ngram
+        self.bands = bands
+        self.rows = rows
+        self.hasher = MinHasher(bands * rows)
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._buckets: Dict[Tuple[Any, int, Tuple[int, ...]], set] = {}
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self.lookups = 0
+        self.hits = 0
+        self.candidates = 0
+        self.evictions = 0
+        self.similarity = [0] * 10   # 적중 유사도 분포 (0.1 단위)
+
+    def _keys(self, scope, text: str):
+        items = shingles(text, self.ngram)
+        sig = self.hasher.signature(items)
+        r = self.rows
+        bands = [(scope, i, sig[i * r:(i + 1) * r]) for i in range(self.bands)]
+        return items, bands
+
+    def lookup(self, scope, query: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """-> (payload, 유사도) 또는 None"""
+        text = canonical(query)
+        if not text:
+            return None
+        items, bands = self._keys(scope, text)
+        now = time.time()
+        with self._lock:
+            self.lookups += 1
+            ids = set()
+            for band in bands:
+                ids |= self._buckets.get(band, set())
+            self.candidates += len(ids)
+            best, best_id = 0.0, None
+            for eid in ids:
+                entry = self._entries.get(eid)
+                if entry is None:
+                    continue
+                if entry.expires < now:
+                    del self._entries[eid]
+                    self._drop(eid, entry)
+                    continue
+                sim = 1.0 if entry.text == text else jaccard(items, entry.shingles)
+                if sim > best:
+                    best, best_id = sim, eid
+            if best_id is None or best < self.threshold:
+                return None
+            self._entries.move_to_end(best_id)
+            self.hits += 1
+            self.similarity[min(9, int(best * 10))] += 1
+            return self._entries[best_id].payload, best
+
+    def add(self, scope, query: str, payload: Dict[str, Any], ttl: int) -> None:
+        text = canonical(query)
+        if not text or ttl <= 0:
+            return
+        items, bands = self._keys(scope, text)
+        with self._lock:
+            eid = self._next_id
+            self._next_id += 1
+            self._entries[eid] = _Entry(scope, items, bands, payload, time.time() + ttl, text)
+            for band in bands:
+                self._buckets.setdefault(band, set()).add(eid)
+            while len(self._entries) > self.max_entries:
+                old_id, old = self._entries.popitem(last=False)
+                self._drop(old_id, old)
+                self.evictions += 1
+
+    def _drop(self, eid: int, entry: _Entry) -> None:
+        for band in entry.bands:
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(eid)
+                if not bucket:
+                    del self._buckets[band]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "threshold": self.threshold,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "buckets": len(self._buckets),
+                "bands": self.bands,
+                "rows": self.rows,
+                "ngram": self.ngram,
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": round(self.hits / self.lookups, 4) if self.lookups else 0.0,
+                "avg_candidates": round(self.candidates / self.lookups, 2) if self.lookups else 0.0,
+                "evictions": self.evictions,
+                "similarity_hist": list(self.similarity),
+            }
@@ -0,0 +1,116 @@
+# services/single_flight.py
+"""
+같은 키의 동시 LLM 호출 합치기 (single-flight, Django 비의존)
+
+인기 주제가 뜨면 같은 질의가 1초 안에 수십 번 들어와 각자 업스트림을 부른다
+(비용 증가 + 제공자 레이트리밋, llm.generate_reply 는 재시도도 안 함).
+키(answer_cache.make_key 와 같은 값)별로 진행 중인 호출을 하나만 두고,
+그동안 들어온 같은 키의 요청은 그 결과를 기다렸다가 같이 받는다.
+
+- do(key, fn)         : 스레드(WSGI) 경로. 첫 호출자가 fn() 실행, 나머지는 Future 대기
+- await ado(key, afn) : async 경로. 첫 호출자가 afn() 을 별도 task 로 띄우고 모두 그 결과를 기다림
+  (요청 하나가 취소돼도 다른 대기자의 호출은 계속된다)
+- 둘 다 concurrent.futures.Future 하나를 공유하므로 스레드/async 호출자끼리도 합쳐진다
+- 예외는 그 시점의 대기자 모두에게 그대로 전달되고 아무것도 남기지 않는다 (다음 요청은 새로 호출)
+- 반환값: (결과, 공유 여부) - 공유 여부는 다른 요청의 호출 결과를 받았는지
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 진행 중인 async 호출 task (강한 참조)
+_tasks: Set[asyncio.Task] = set()
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_waiters = 0
+        self._waiters: Dict[Hashable, int] = {}
+
+    def _join(self, key) -> Tuple[Future, bool]:
+        """-> (공유 Future, 내가 첫 호출자인지)"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                waiting = self._waiters[key] = self._waiters[key] + 1
+                self.max_waiters = max(self.max_waiters, waiting)
+                return future, False
+            future = self._calls[key] = Future()
+            self._waiters[key] = 0
+            self.leaders += 1
+            return future, True
+
+    def _settle(self, key, future: Future, result: Any = None, exc: BaseException | None = None) -> None:
+        # 키를 먼저 비워야 결과 이후에 온 요청은 (캐시를 보거나) 새로 호출한다
+        with self._lock:
+            self._calls.pop(key, None)
+            waiting = self._waiters.pop(key, 0)
+            if exc is not None:
+                self.errors += 1
+        if exc is not None:
+            if waiting:
+                logger.info("[single-flight] call failed, %d waiter(s) get the error: %s", waiting, exc)
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def do(self, key, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        future, leader = self._join(key)
+        if not leader:
+            return future.result(), True
+        try:
+            result = fn()
+        except BaseException as e:
+            self._settle(key, future, exc=e)
+            raise
+        self._settle(key, future, result=result)
+        return result, False
+
+    async def ado(self, key, afn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        future, leader = self._join(key)
+        if leader:
+            task = asyncio.ensure_future(afn())
+            # 이벤트 루프는 task 를 약하게만 참조하므로 끝날 때까지 붙잡아 둔다 (중간에 GC 방지)
+            _tasks.add(task)
+            task.add_done_callback(_tasks.discard)
+
+            def done(t: asyncio.Task) -> None:
+                if t.cancelled():
+                    self._settle(key, future, exc=asyncio.CancelledError())
+                elif t.exception() is not None:
+                    self._settle(key, future, exc=t.exception())
+                else:
+                    self._settle(key, future, result=t.result())
+
+            task.add_done_callback(done)
+        # shield: 이 요청이 취소돼도 공유 Future(다른 대기자)는 취소하지 않는다
+        return await asyncio.shield(asyncio.wrap_future(future)), not leader
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "max_waiters": self.max_waiters,
+            }
+
+
+flights = SingleFlight()